@@ -0,0 +1,157 @@
+# src/autotrade/analysis/cache.py
+# ------------------------------------------------------------
+# 지표 캐시: 같은 종가 시리즈에 대한 지표 계산을 전략/파라미터 조합 간에 공유
+# - 키 = (시리즈 지문, 지표 이름, 파라미터)
+#   시리즈 지문은 float64 바이트의 blake2b 해시 + 길이 (같은 내용이면 다른 리스트도 적중)
+# - 복합 지표는 구성 요소를 캐시에서 가져와 조합
+#   예: MACD(12,26,9)와 MACD(12,30,9)는 EMA12를 한 번만 계산
+# - 바이트 기준 LRU 퇴출, hits / misses / evictions 카운터
+# 반환된 리스트는 여러 호출자가 공유하므로 수정하지 마세요.
+# 전략 신호용이라 indicators.py의 같은 이름 함수를 exact=True로 부른 결과
+# (상태형 지표 batch / on_candle)와 비트 단위로 동일합니다.
+# ------------------------------------------------------------
+from __future__ import annotations
+from array import array
+from collections import OrderedDict
+from hashlib import blake2b
+from math import nan
+import sys
+from typing import Any, Callable, Dict, Hashable, List, Sequence, Tuple, TypeVar
+
+from autotrade.analysis import indicators
+
+T = TypeVar("T")
+Key = Tuple[Hashable, ...]
+
+
+def _sizeof(value: Any) -> int:
+    """캐시 값의 대략적인 메모리 크기 (리스트: 포인터 + float 객체)"""
+    if isinstance(value, tuple):
+        return sys.getsizeof(value) + sum(_sizeof(v) for v in value)
+    if isinstance(value, list):
+        return sys.getsizeof(value) + 24 * len(value)
+    return sys.getsizeof(value)
+
+
+class IndicatorCache:
+    """
+    max_bytes를 넘으면 가장 오래 안 쓴 항목부터 퇴출.
+    max_bytes보다 큰 결과 1개는 저장하지 않고 계산만 합니다.
+    """
+
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024):
+        if max_bytes < 0:
+            raise ValueError(f"max_bytes must be >= 0, got {max_bytes}")
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._items: "OrderedDict[Key, Tuple[Any, int]]" = OrderedDict()
+        # 직전 시리즈 객체의 지문 (한 signals() 안에서 여러 지표를 요청할 때 재해시 방지)
+        self._last: Tuple[Any, Hashable] = (None, None)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def series_key(self, values: Sequence[float]) -> Hashable:
+        obj, key = self._last
+        if obj is values:
+            return key
+        buf = array("d", values).tobytes()
+        key = (len(values), blake2b(buf, digest_size=16).digest())
+        self._last = (values, key)  # 객체를 붙잡아 두므로 id 재사용 문제 없음
+        return key
+
+    def get(
+        self,
+        values: Sequence[float],
+        name: str,
+        params: Tuple[Hashable, ...],
+        compute: Callable[[], T],
+    ) -> T:
+        """(values, name, params)의 캐시 값, 없으면 compute()로 계산해 저장"""
+        key = (self.series_key(values), name) + params
+        hit = self._items.get(key)
+        if hit is not None:
+            self._items.move_to_end(key)
+            self.hits += 1
+            return hit[0]  # type: ignore[no-any-return]
+        self.misses += 1
+        value = compute()
+        size = _sizeof(value)
+        if size <= self.max_bytes:
+            self._items[key] = (value, size)
+            self.nbytes += size
+            while self.nbytes > self.max_bytes:
+                _, (_, old) = self._items.popitem(last=False)
+                self.nbytes -= old
+                self.evictions += 1
+        return value
+
+    def clear(self) -> None:
+        self._items.clear()
+        self.nbytes = 0
+        self._last = (None, None)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "entries": len(self._items),
+            "bytes": self.nbytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    # --------------------------------------------------------
+    # indicators.py 전체 구간 함수와 같은 시그니처
+    # --------------------------------------------------------
+    def sma(self, values: Sequence[float], window: int) -> List[float]:
+        return self.get(
+            values, "sma", (window,), lambda: indicators.sma(values, window, exact=True)
+        )
+
+    def ema(self, values: Sequence[float], period: int) -> List[float]:
+        return self.get(
+            values, "ema", (period,), lambda: indicators.ema(values, period, exact=True)
+        )
+
+    def wilder_rsi(self, values: Sequence[float], period: int) -> List[float]:
+        return self.get(
+            values,
+            "wilder_rsi",
+            (period,),
+            lambda: indicators.wilder_rsi(values, period, exact=True),
+        )
+
+    def rolling_std(self, values: Sequence[float], window: int) -> List[float]:
+        return self.get(
+            values,
+            "rolling_std",
+            (window,),
+            lambda: indicators.rolling_std(values, window, exact=True),
+        )
+
+    def bollinger(
+        self, values: Sequence[float], window: int, k: float
+    ) -> Tuple[List[float], List[float]]:
+        def compute() -> Tuple[List[float], List[float]]:
+            mid = self.sma(values, window)
+            std = self.rolling_std(values, window)
+            upper = [m + k * s if (m == m and s == s) else nan for m, s in zip(mid, std)]
+            lower = [m - k * s if (m == m and s == s) else nan for m, s in zip(mid, std)]
+            return upper, lower
+
+        return self.get(values, "bollinger", (window, k), compute)
+
+    def macd(
+        self, values: Sequence[float], fast: int = 12, slow: int = 26, signal: int = 9
+    ) -> Tuple[List[float], List[float], List[float]]:
+        def compute() -> Tuple[List[float], List[float], List[float]]:
+            f = self.ema(values, fast)
+            s = self.ema(values, slow)
+            line = [a - b for a, b in zip(f, s)]
+            sig = indicators.ema(line, signal, exact=True)
+            return line, sig, [m - g for m, g in zip(line, sig)]
+
+        return self.get(values, "macd", (fast, slow, signal), compute)
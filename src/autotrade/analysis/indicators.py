@@ -1,11 +1,289 @@
-from typing import Sequence, List
+# src/autotrade/analysis/indicators.py
+# ------------------------------------------------------------
+# 기술 지표
+# - sma(values, window): 리스트 입력 → 리스트 출력 (기존 함수)
+# - 상태형 지표 (SMA / EMA / WilderRSI / RollingStd / MACD)
+#   update(x): 새 값 1개 반영 → 현재 지표값, O(1) (창 길이와 무관)
+#   batch(values): update를 차례로 적용한 결과 리스트 (같은 연산 순서 → 비트 단위 동일)
+#   워밍업 중에는 NaN을 돌려줍니다.
+# - 전체 구간 함수 (sma / ema / wilder_rsi / rolling_std / bollinger / macd)
+#   NumPy가 있고 입력이 NUMPY_MIN_LEN 이상이면 kernels.py의 벡터 커널(오차 1e-9 이내),
+#   아니면 순수 파이썬 경로를 사용합니다.
+#   exact=True면 항상 상태형 지표의 batch (on_candle과 비트 단위 동일).
+#   전략 신호는 이 경로를 씁니다: 커널의 1e-9 오차도 종가가 밴드/교차 경계에 정확히
+#   걸리는 호가 단위 가격에서는 신호를 바꾸므로, 벡터/스트리밍/롤링 체결이 같으려면 필요.
+# ------------------------------------------------------------
+from __future__ import annotations
+from collections import deque
+from math import nan, sqrt
+from typing import Any, Deque, Iterable, List, NamedTuple, Sequence, Tuple
 
+try:
+    import numpy as np
+    from autotrade.analysis import kernels as _kernels
+except ImportError:  # pragma: no cover - NumPy 미설치 환경
+    _kernels = None  # type: ignore[assignment]
 
-def sma(values: Sequence[float], window: int) -> List[float]:
-    out, s = [], 0.0
-    for i, v in enumerate(values):
-        s += v
-        if i >= window:
-            s -= values[i - window]
-        out.append((s / window) if i + 1 >= window else float("nan"))
-    return out
+USE_NUMPY = _kernels is not None
+NUMPY_MIN_LEN = 256  # 이보다 짧으면 배열 변환 비용이 더 큼
+
+
+def _vectorize(values: Sequence[float], exact: bool = False) -> Any:
+    """커널 경로를 쓸 입력이면 float64 배열, 아니면 None"""
+    if not exact and USE_NUMPY and len(values) >= NUMPY_MIN_LEN:
+        return np.asarray(values, dtype=np.float64)
+    return None
+
+
+def sma(values: Sequence[float], window: int, exact: bool = False) -> List[float]:
+    x = _vectorize(values, exact)
+    if x is not None:
+        return _kernels.sma(x, window).tolist()
+    return SMA(window).batch(values)
+
+
+class _ExactWindow:
+    """
+    최근 window개 값의 정확한 합계 (제곱합은 squares=True일 때).
+    float는 모두 n / 2**e 꼴이라 공통 분모 2**k로 맞춘 정수로 누적하면
+    더하고 빼도 반올림 오차가 쌓이지 않습니다. k는 지금까지 본 값 중 최대 e로
+    필요할 때만 늘립니다 (가격대 기준 수십 비트 정수, 갱신 O(1)).
+    평균/분산은 창 내용만의 함수 → 같은 값이 이어지면 평균은 그 값, 분산은 정확히 0.
+    """
+
+    def __init__(self, window: int, squares: bool = False):
+        if window < 1:
+            raise ValueError(f"window must be >= 1, got {window}")
+        self.window = window
+        self.squares = squares
+        self._q: Deque[int] = deque()
+        self._k = 0
+        self._s1 = 0
+        self._s2 = 0
+
+    def push(self, x: float) -> bool:
+        """x 추가 (가장 오래된 값은 밀려남), 창이 가득 찼으면 True"""
+        n, d = x.as_integer_ratio()
+        e = d.bit_length() - 1
+        if e > self._k:
+            sh = e - self._k
+            self._q = deque(v << sh for v in self._q)
+            self._s1 <<= sh
+            self._s2 <<= 2 * sh
+            self._k = e
+        v = n << (self._k - e)
+        self._q.append(v)
+        self._s1 += v
+        if self.squares:
+            self._s2 += v * v
+        if len(self._q) > self.window:
+            old = self._q.popleft()
+            self._s1 -= old
+            if self.squares:
+                self._s2 -= old * old
+        return len(self._q) == self.window
+
+    def mean(self) -> float:
+        """창 평균 (정확한 합계 / window를 한 번만 반올림)"""
+        return self._s1 / (self.window << self._k)
+
+    def var(self) -> float:
+        """모분산 = (w*Σx² - (Σx)²) / w² (분자를 정수로 계산 → 상쇄 오차 없음, 음수 불가)"""
+        w = self.window
+        return (w * self._s2 - self._s1 * self._s1) / ((w * w) << (2 * self._k))
+
+
+class SMA:
+    """단순이동평균: 창 합계를 정수로 정확히 누적 (긴 구간에서도 합계가 틀어지지 않음)"""
+
+    def __init__(self, window: int):
+        self.window = window
+        self.n = 0
+        self._w = _ExactWindow(window)
+
+    def update(self, x: float) -> float:
+        self.n += 1
+        return self._w.mean() if self._w.push(x) else nan
+
+    def batch(self, values: Iterable[float]) -> List[float]:
+        return [self.update(v) for v in values]
+
+
+class EMA:
+    """지수이동평균: 첫 값으로 시작, k = 2/(period+1)"""
+
+    def __init__(self, period: int):
+        if period < 1:
+            raise ValueError(f"period must be >= 1, got {period}")
+        self.period = period
+        self.n = 0
+        self._k = 2.0 / (period + 1)
+        self.value = nan
+
+    def update(self, x: float) -> float:
+        if self.n == 0:
+            self.value = x
+        else:
+            self.value = x * self._k + self.value * (1 - self._k)
+        self.n += 1
+        return self.value
+
+    def batch(self, values: Iterable[float]) -> List[float]:
+        return [self.update(v) for v in values]
+
+
+class WilderRSI:
+    """
+    Wilder's RSI: 처음 period개 변화량의 단순평균으로 시작해 (avg*(p-1)+x)/p로 평활.
+    첫 유효값은 period+1번째 입력에서 나오고, 그 전은 NaN.
+    """
+
+    def __init__(self, period: int = 14):
+        if period < 1:
+            raise ValueError(f"period must be >= 1, got {period}")
+        self.period = period
+        self.n = 0
+        self._prev = 0.0
+        self._gain = 0.0
+        self._loss = 0.0
+
+    def update(self, x: float) -> float:
+        i, p = self.n, self.period
+        out = nan
+        if i > 0:
+            delta = x - self._prev
+            gain = max(delta, 0.0)
+            loss = max(-delta, 0.0)
+            if i <= p:
+                # 초기 평균용 합계 (i == period에서 평균으로 전환)
+                self._gain += gain
+                self._loss += loss
+                if i == p:
+                    self._gain /= p
+                    self._loss /= p
+                    rs = (self._gain / self._loss) if self._loss != 0 else float("inf")
+                    out = 100.0 - (100.0 / (1.0 + rs))
+            else:
+                self._gain = (self._gain * (p - 1) + gain) / p
+                self._loss = (self._loss * (p - 1) + loss) / p
+                if self._loss == 0:
+                    out = 100.0  # 손실 0이면 RSI=100
+                else:
+                    out = 100.0 - (100.0 / (1.0 + self._gain / self._loss))
+        self.n = i + 1
+        self._prev = x
+        return out
+
+    def batch(self, values: Iterable[float]) -> List[float]:
+        return [self.update(v) for v in values]
+
+
+class RollingStd:
+    """
+    이동 모표준편차 (창 크기 window): 합계/제곱합을 정수로 정확히 누적.
+    s2/window - mean² 방식의 상쇄 오차나 이동 갱신의 오차 누적이 없고,
+    mean에는 같은 상태에서 구한 창 평균(SMA와 동일 값)이 남습니다.
+    window < 2이면 항상 NaN.
+    """
+
+    def __init__(self, window: int):
+        self.window = window
+        self.n = 0
+        self.mean = nan
+        self._w = _ExactWindow(window, squares=True)
+
+    def update(self, x: float) -> float:
+        self.n += 1
+        if not self._w.push(x):
+            return nan
+        self.mean = self._w.mean()
+        if self.window < 2:
+            return nan
+        return sqrt(self._w.var())
+
+    def batch(self, values: Iterable[float]) -> List[float]:
+        return [self.update(v) for v in values]
+
+
+class MACDValue(NamedTuple):
+    macd: float
+    signal: float
+    hist: float
+
+
+class MACD:
+    """MACD = EMA(fast) - EMA(slow), signal = EMA(macd, signal), hist = macd - signal"""
+
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9):
+        self.fast = EMA(fast)
+        self.slow = EMA(slow)
+        self.signal = EMA(signal)
+        self.n = 0
+
+    def update(self, x: float) -> MACDValue:
+        m = self.fast.update(x) - self.slow.update(x)
+        s = self.signal.update(m)
+        self.n += 1
+        return MACDValue(m, s, m - s)
+
+    def batch(self, values: Iterable[float]) -> List[MACDValue]:
+        return [self.update(v) for v in values]
+
+
+# ------------------------------------------------------------
+# 전체 구간 함수 (NumPy 커널 / 순수 파이썬 폴백)
+# ------------------------------------------------------------
+def ema(values: Sequence[float], period: int, exact: bool = False) -> List[float]:
+    x = _vectorize(values, exact)
+    if x is not None:
+        return _kernels.ema(x, period).tolist()
+    return EMA(period).batch(values)
+
+
+def wilder_rsi(values: Sequence[float], period: int, exact: bool = False) -> List[float]:
+    x = _vectorize(values, exact)
+    if x is not None:
+        return _kernels.wilder_rsi(x, period).tolist()
+    return WilderRSI(period).batch(values)
+
+
+def rolling_std(values: Sequence[float], window: int, exact: bool = False) -> List[float]:
+    x = _vectorize(values, exact)
+    if x is not None:
+        return _kernels.rolling_std(x, window).tolist()
+    return RollingStd(window).batch(values)
+
+
+def bollinger(
+    values: Sequence[float], window: int, k: float, exact: bool = False
+) -> Tuple[List[float], List[float]]:
+    """(upper, lower) = SMA ± k*std (워밍업 구간은 NaN)"""
+    x = _vectorize(values, exact)
+    if x is not None:
+        m = _kernels.sma(x, window)
+        s = _kernels.rolling_std(x, window)
+        return (m + k * s).tolist(), (m - k * s).tolist()
+    rs = RollingStd(window)
+    std, mid = [], []
+    for v in values:
+        std.append(rs.update(v))
+        mid.append(rs.mean if rs.n >= window else nan)
+    upper = [m + k * s if (m == m and s == s) else nan for m, s in zip(mid, std)]
+    lower = [m - k * s if (m == m and s == s) else nan for m, s in zip(mid, std)]
+    return upper, lower
+
+
+def macd(
+    values: Sequence[float],
+    fast: int = 12,
+    slow: int = 26,
+    signal: int = 9,
+    exact: bool = False,
+) -> Tuple[List[float], List[float], List[float]]:
+    """(macd, signal, hist) 리스트"""
+    x = _vectorize(values, exact)
+    if x is not None:
+        line, sig, hist = _kernels.macd(x, fast, slow, signal)
+        return line.tolist(), sig.tolist(), hist.tolist()
+    vals = MACD(fast, slow, signal).batch(values)
+    return [v.macd for v in vals], [v.signal for v in vals], [v.hist for v in vals]
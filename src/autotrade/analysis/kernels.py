@@ -0,0 +1,93 @@
+# src/autotrade/analysis/kernels.py
+# ------------------------------------------------------------
+# 전체 구간 지표의 NumPy 커널 (indicators.py가 NumPy 사용 가능할 때 선택)
+# - SMA: 청크별 cumsum 차분 (청크마다 누적합을 새로 시작해 반올림 오차 누적 제한)
+# - 이동 std: sliding_window_view를 청크 단위로 std (2-pass, 임시 메모리 제한)
+# - EMA는 첫 값 기준 편차를 필터링 (일정한 입력이면 정확히 첫 값 → MACD 부호 잡음 없음)
+# - EMA / Wilder RSI: 선형 재귀 y[i] = a*y[i-1] + b[i]를 로그 단계 prefix scan으로 계산,
+#   a^d가 무시할 만큼 작아지면 조기 종료 (필요한 패스 수 ≈ log2(유효 기억 길이))
+# 순수 파이썬 경로와 상대 오차 1e-9 이내로 일치합니다 (비트 단위 동일은 아님 →
+# 전략 신호는 indicators의 exact=True 경로를 쓰고, 커널은 분석/리포트용 전체 구간 계산에 사용).
+# ------------------------------------------------------------
+from __future__ import annotations
+from typing import Tuple
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+CHUNK = 4096
+_NEGLIGIBLE = 1e-18  # 이보다 작은 감쇠 가중치는 결과에 영향 없음
+
+
+def sma(x: np.ndarray, window: int) -> np.ndarray:
+    n = len(x)
+    out = np.full(n, np.nan)
+    for s in range(window - 1, n, CHUNK):
+        e = min(s + CHUNK, n)
+        cs = np.concatenate(([0.0], np.cumsum(x[s - window + 1 : e])))
+        out[s:e] = (cs[window:] - cs[:-window]) / window
+    return out
+
+
+def rolling_std(x: np.ndarray, window: int) -> np.ndarray:
+    """이동 모표준편차 (ddof=0); window < 2이면 전부 NaN"""
+    n = len(x)
+    out = np.full(n, np.nan)
+    if window < 2 or n < window:
+        return out
+    win = sliding_window_view(x, window)  # (n-window+1, window) 뷰, 복사 없음
+    for s in range(0, len(win), CHUNK):
+        part = win[s : s + CHUNK]
+        out[window - 1 + s : window - 1 + s + len(part)] = part.std(axis=1)
+    return out
+
+
+def linear_filter(b: np.ndarray, a: float) -> np.ndarray:
+    """y[i] = a*y[i-1] + b[i] (y[-1] = 0), 0 <= a < 1"""
+    y = np.array(b, dtype=np.float64)
+    n = len(y)
+    d, ad = 1, a
+    while d < n and ad > _NEGLIGIBLE:
+        # 우변이 먼저 계산되므로 이전 패스 값 기준으로 갱신됨
+        y[d:] += ad * y[:-d]
+        d *= 2
+        ad *= ad
+    return y
+
+
+def ema(x: np.ndarray, period: int) -> np.ndarray:
+    """첫 값으로 시작하는 EMA (k = 2/(period+1))"""
+    if not len(x):
+        return np.empty(0)
+    # 첫 값 기준 편차만 필터링 → 일정한 구간은 편차가 정확히 0이라 잡음 없이 첫 값 그대로
+    k = 2.0 / (period + 1)
+    return x[0] + linear_filter(k * (x - x[0]), 1.0 - k)
+
+
+def wilder_rsi(x: np.ndarray, period: int) -> np.ndarray:
+    n = len(x)
+    out = np.full(n, np.nan)
+    if n <= period:
+        return out
+    d = np.diff(x)
+    gain = np.maximum(d, 0.0)
+    loss = np.maximum(-d, 0.0)
+    a = (period - 1) / period
+    # 봉 period에서 처음 period개 변화량의 평균으로 시작, 이후 (avg*(p-1)+x)/p
+    bg = gain[period - 1 :] / period
+    bl = loss[period - 1 :] / period
+    bg[0] = gain[:period].sum() / period
+    bl[0] = loss[:period].sum() / period
+    ag = linear_filter(bg, a)
+    al = linear_filter(bl, a)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rsi = 100.0 - 100.0 / (1.0 + ag / al)
+    out[period:] = np.where(al == 0, 100.0, rsi)
+    return out
+
+
+def macd(
+    x: np.ndarray, fast: int, slow: int, signal: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    line = ema(x, fast) - ema(x, slow)
+    sig = ema(line, signal)
+    return line, sig, line - sig
@@ -1,6 +1,6 @@
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import List
+from dataclasses import dataclass, field
+from typing import Dict, List
 from autotrade.models.order import OrderRequest, Order
 
 
@@ -13,7 +13,20 @@ class Position:
 @dataclass
 class Portfolio:
     cash: float
-    pos: Position
+    positions: Dict[str, Position] = field(default_factory=dict)  # 심볼별 포지션
+
+    def position(self, symbol: str) -> Position:
+        """심볼 포지션 (없으면 빈 포지션 생성)"""
+        pos = self.positions.get(symbol)
+        if pos is None:
+            pos = self.positions[symbol] = Position()
+        return pos
+
+    def value(self, marks: Dict[str, float]) -> float:
+        """현금 + 심볼별 수량 * 마크 가격"""
+        return self.cash + sum(
+            p.qty * marks.get(sym, 0.0) for sym, p in self.positions.items()
+        )
 
 
 class PaperBroker:
@@ -37,25 +50,26 @@ class PaperBroker:
         )
 
         for i, o in enumerate(orders, start=1):
+            pos = pf.position(o.symbol)
             notional = px * o.qty
             fee = abs(notional) * self.fee_rate
             if o.side == "buy":
                 # 새 평단 = (기존 평가금 + 신규 매수금) / 총수량
-                new_qty = pf.pos.qty + o.qty
+                new_qty = pos.qty + o.qty
                 if new_qty <= 0:
-                    pf.pos.qty = 0.0
-                    pf.pos.avg = 0.0
+                    pos.qty = 0.0
+                    pos.avg = 0.0
                 else:
-                    pf.pos.avg = (pf.pos.qty * pf.pos.avg + notional) / new_qty
-                    pf.pos.qty = new_qty
+                    pos.avg = (pos.qty * pos.avg + notional) / new_qty
+                    pos.qty = new_qty
                 pf.cash -= notional + fee
             else:
                 # 매도: 현금 증가, 수수료 차감, 수량 감소
                 pf.cash += notional - fee
-                pf.pos.qty -= o.qty
-                if pf.pos.qty <= 1e-12:
-                    pf.pos.qty = 0.0
-                    pf.pos.avg = 0.0
+                pos.qty -= o.qty
+                if pos.qty <= 1e-12:
+                    pos.qty = 0.0
+                    pos.avg = 0.0
 
             out.append(
                 Order(
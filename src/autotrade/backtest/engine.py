@@ -2,28 +2,368 @@
 from __future__ import annotations
 from pathlib import Path
 import csv
-from typing import Dict, Iterable, List
+import heapq
+from typing import Dict, Iterable, Iterator, List, Mapping, Sequence, Tuple
 import matplotlib
+import numpy as np
 
 matplotlib.use("Agg")  # GUI 백엔드 사용 안함
 import matplotlib.pyplot as plt  # 차트 저장용
 from autotrade.settings import Settings
-from autotrade.data.csv_loader import load_candles_csv
+from autotrade.data.csv_loader import load_candles_csv, iter_candles_csv
+from autotrade.data.csv_index import known_ascending
 from autotrade.data.candles import CandleService
+from autotrade.data.store import is_store, open_store
+from autotrade.data.resample import resample, resample_frame
 from autotrade.exchanges.fake import FakeExchange
 from autotrade.strategies.registry import create as create_strategy
-from autotrade.models.market import Candle
+from autotrade.strategies.base import IStrategy, IStreamingStrategy, IVectorStrategy
+from autotrade.models.market import INTERVAL_MINUTES, Candle, CandleFrame
 from autotrade.models.order import Order, OrderRequest
 from autotrade.backtest.broker import PaperBroker, Portfolio, Position
-from autotrade.backtest.metrics import (
-    max_drawdown,
-    trade_pnls,
-    sharpe_ratio,
-    cagr,
-    calmar,
-    sortino,
-    drawdown_periods,
-)
+from autotrade.backtest.equity import EquityCurve, EquitySink
+from autotrade.backtest.metrics import MetricsAccumulator, trade_pnls
+
+
+def _mark(curve: EquitySink | None, c: Candle, pf: Portfolio, pos: Position) -> None:
+    """단일 심볼 봉 마감 시점의 마크투마켓 기록"""
+    if curve is not None:
+        curve.append(c.ts, pf.cash + pos.qty * c.c, c.c, pf.cash, pos.qty, pos.avg)
+
+
+def _column(candles: Sequence[Candle], name: str, dtype: type) -> np.ndarray:
+    """캔들 열 → NumPy 배열 (CandleFrame이면 버퍼를 복사 없이 공유)"""
+    if isinstance(candles, CandleFrame):
+        return np.asarray(getattr(candles, name), dtype=dtype)
+    return np.fromiter((getattr(c, name) for c in candles), dtype=dtype, count=len(candles))
+
+
+def simulate_rolling(
+    strat: IStrategy,
+    sym: str,
+    candles: Sequence[Candle],
+    win: int,
+    broker: PaperBroker,
+    pf: Portfolio,
+    curve: EquitySink | None = None,
+) -> List[Order]:
+    """롤링 윈도우 실행: 매 봉마다 candles[:i]로 generate 호출 (서드파티 전략용, O(n²))"""
+    fills: List[Order] = []
+    pos = pf.position(sym)
+    for c in candles[: max(win - 1, 0)]:
+        _mark(curve, c, pf, pos)  # 워밍업 구간
+    for i in range(win, len(candles) + 1):
+        window = candles[:i]
+        orders: List[OrderRequest] = strat.generate({sym: window})
+        last = window[-1]
+        if orders:
+            fills.extend(broker.fill(orders, last.c, pf, ts=last.ts))  # <-- ts 기록
+        _mark(curve, last, pf, pos)
+    return fills
+
+
+def simulate_streaming(
+    strat: IStreamingStrategy,
+    sym: str,
+    candles: Iterable[Candle],
+    win: int,
+    broker: PaperBroker,
+    pf: Portfolio,
+    curve: EquitySink | None = None,
+) -> List[Order]:
+    """스트리밍 실행: 봉마다 on_candle 1회 (O(1)/bar). 처음 win-1개 봉은 워밍업."""
+    fills: List[Order] = []
+    pos = pf.position(sym)
+    for i, c in enumerate(candles, start=1):
+        orders = strat.on_candle(sym, c)
+        if i >= win and orders:
+            fills.extend(broker.fill(orders, c.c, pf, ts=c.ts))
+        _mark(curve, c, pf, pos)
+    return fills
+
+
+def simulate_vectorized(
+    strat: IVectorStrategy,
+    sym: str,
+    candles: Sequence[Candle],
+    win: int,
+    broker: PaperBroker,
+    pf: Portfolio,
+    curve: EquitySink | None = None,
+) -> List[Order]:
+    """
+    벡터 실행: 전체 신호를 한 번에 계산한 뒤 신호가 있는 봉만 브로커로 재생.
+    에쿼티 곡선도 체결 직후 상태를 구간별로 펼쳐 NumPy로 한 번에 기록.
+    """
+    fills: List[Order] = []
+    pos = pf.position(sym)
+    if not candles:
+        return fills
+    closes = _column(candles, "c", np.float64)
+    sig = np.asarray(strat.signals(closes.tolist()), dtype=np.int8)
+    start = max(win - 1, 0)
+    idx = (np.flatnonzero(sig[start:]) + start).tolist()
+
+    # 체결 직후 상태 (0번은 초기 상태)
+    cash, qty, avg = [pf.cash], [pos.qty], [pos.avg]
+    for i in idx:
+        c = candles[i]
+        side = "buy" if sig[i] > 0 else "sell"
+        orders = [OrderRequest.market(sym, side, strat.qty)]
+        fills.extend(broker.fill(orders, c.c, pf, ts=c.ts))
+        cash.append(pf.cash)
+        qty.append(pos.qty)
+        avg.append(pos.avg)
+
+    if curve is not None:
+        n = len(candles)
+        # 봉 j의 상태 = j 이하에서 마지막으로 체결된 직후 상태
+        k = np.searchsorted(np.asarray(idx, dtype=np.int64), np.arange(n), side="right")
+        cash_a = np.asarray(cash)[k]
+        qty_a = np.asarray(qty)[k]
+        curve.extend(
+            _column(candles, "ts", np.int64),
+            equity=cash_a + qty_a * closes,
+            price=closes,
+            cash=cash_a,
+            qty=qty_a,
+            avg=np.asarray(avg)[k],
+        )
+    return fills
+
+
+def simulate(
+    strat: IStrategy,
+    sym: str,
+    candles: Sequence[Candle],
+    win: int,
+    broker: PaperBroker,
+    pf: Portfolio,
+    curve: EquitySink | None = None,
+) -> List[Order]:
+    """
+    exact_signals를 선언한 signals → 벡터 경로, on_candle → 스트리밍 경로,
+    그 외는 기존 롤링 generate 경로. (선언 없는 signals는 체결이 달라질 수 있어 쓰지 않음)
+    """
+    strat.on_start()
+    if isinstance(strat, IVectorStrategy) and getattr(strat, "exact_signals", False):
+        return simulate_vectorized(strat, sym, candles, win, broker, pf, curve)
+    if isinstance(strat, IStreamingStrategy):
+        return simulate_streaming(strat, sym, candles, win, broker, pf, curve)
+    return simulate_rolling(strat, sym, candles, win, broker, pf, curve)
+
+
+def _csv_paths(s: Settings) -> Dict[str, str]:
+    """
+    data.csv 해석:
+      - {심볼: 경로} dict → 심볼별 CSV
+      - 디렉터리 경로   → <dir>/<심볼>.candles 저장소가 있으면 그것, 없으면 <dir>/<심볼>.csv
+                          ('/'는 '-'로 치환, 예: BTC-USDT.csv)
+      - 파일/저장소 경로 → 심볼 1개 전용
+    """
+    symbols = s.strategy.symbols
+    src = s.data["csv"]
+    if isinstance(src, dict):
+        missing = [sym for sym in symbols if sym not in src]
+        if missing:
+            raise ValueError(f"data.csv has no path for symbols {missing}")
+        return {sym: str(src[sym]) for sym in symbols}
+    p = Path(src)
+    if p.is_dir() and not is_store(p):
+        out: Dict[str, str] = {}
+        for sym in symbols:
+            stem = sym.replace("/", "-")
+            store = p / f"{stem}.candles"
+            out[sym] = str(store if store.is_dir() else p / f"{stem}.csv")
+        return out
+    if len(symbols) > 1:
+        raise ValueError(
+            "data.csv is a single file but multiple symbols are configured; "
+            "use a {symbol: path} mapping or a directory of <symbol>.csv files"
+        )
+    return {symbols[0]: str(src)}
+
+
+def _ts_range(s: Settings) -> Tuple[int | None, int | None]:
+    """data.start_ts / data.end_ts (epoch 초, 양끝 포함) — 지정 구간만 읽음"""
+    start, end = s.data.get("start_ts"), s.data.get("end_ts")
+    return (
+        None if start is None else int(start),
+        None if end is None else int(end),
+    )
+
+
+def _source_interval(s: Settings) -> str | None:
+    """
+    data.source_interval: 저장된 캔들 간격 (예: "1m").
+    data.interval과 다르면 로드하면서 data.interval 봉으로 리샘플합니다.
+    """
+    src = s.data.get("source_interval")
+    interval = s.data.get("interval", "1m")
+    return src if src and src != interval else None
+
+
+def load_batches(s: Settings) -> Dict[str, CandleFrame]:
+    """설정에 따라 심볼별 캔들 준비 (CSV 또는 FakeExchange), 열 지향 CandleFrame으로 전체 적재"""
+    batches: Dict[str, CandleFrame] = {}
+    if "csv" in s.data:
+        start, end = _ts_range(s)
+        for sym, path in _csv_paths(s).items():
+            if is_store(path):
+                batches[sym] = open_store(path).between(start, end)
+            else:
+                batches[sym] = load_candles_csv(path, start_ts=start, end_ts=end)
+            src = _source_interval(s)
+            if src is not None:
+                batches[sym] = resample_frame(batches[sym], s.data["interval"], src)
+    else:
+        ex = FakeExchange()
+        candle = CandleService(ex)
+        for sym in s.strategy.symbols:
+            batches[sym] = CandleFrame.from_candles(
+                candle.fetch(sym, s.data["interval"], s.data["window"])
+            )
+    return batches
+
+
+def load_streams(s: Settings) -> Dict[str, Iterable[Candle]]:
+    """
+    심볼별 캔들 스트림 (ts 오름차순).
+    - 저장소: mmap 뷰
+    - CSV: 사이드카 인덱스가 오름차순이라고 기록한 파일만 파일 순서대로 지연 로드,
+      그 외(인덱스 없음/오래됨/비정렬)는 load_candles_csv로 전체 적재 후 정렬
+    """
+    if "csv" in s.data:
+        start, end = _ts_range(s)
+        src = _source_interval(s)
+        streams: Dict[str, Iterable[Candle]] = {}
+        for sym, path in _csv_paths(s).items():
+            it: Iterable[Candle]
+            if is_store(path):
+                it = open_store(path).between(start, end)
+            elif known_ascending(Path(path)):
+                it = iter_candles_csv(path, start_ts=start, end_ts=end, assume_sorted=True)
+            else:
+                it = load_candles_csv(path, start_ts=start, end_ts=end)
+            streams[sym] = it if src is None else resample(it, s.data["interval"], src)
+        return streams
+    return dict(load_batches(s))
+
+
+def _tag(sym: str, candles: Iterable[Candle]) -> Iterator[Tuple[int, str, Candle]]:
+    prev: int | None = None
+    for c in candles:
+        if prev is not None and c.ts < prev:
+            raise ValueError(f"{sym}: candles not in ascending ts order ({c.ts} after {prev})")
+        prev = c.ts
+        yield (c.ts, sym, c)
+
+
+def merge_by_ts(streams: Mapping[str, Iterable[Candle]]) -> Iterator[Tuple[str, Candle]]:
+    """
+    심볼별 스트림을 ts 기준 힙 k-way 병합 → (심볼, 캔들) 이벤트 클럭.
+    같은 ts는 streams의 심볼 순서대로 나옵니다. 메모리는 심볼당 캔들 1개.
+    각 스트림은 ts 오름차순이어야 하며, 순서가 뒤집히면 ValueError.
+    """
+    tagged = [_tag(sym, it) for sym, it in streams.items()]
+    for _, sym, c in heapq.merge(*tagged, key=lambda e: e[0]):
+        yield sym, c
+
+
+def simulate_merged(
+    strat: IStrategy,
+    streams: Mapping[str, Iterable[Candle]],
+    win: int,
+    broker: PaperBroker,
+    pf: Portfolio,
+    curve: EquitySink | None = None,
+) -> List[Order]:
+    """
+    멀티 심볼 실행: 병합된 이벤트 클럭 순서로 '틱한 심볼'만 전략에 전달.
+    - on_candle 지원 전략: 이벤트당 O(1), 메모리는 심볼당 캔들 1개 + 전략 상태
+    - 그 외: 심볼별 최근 win개 봉만 유지해 generate({sym: history}) 호출
+      (라이브 루프가 window개 캔들을 넘기는 것과 같음, 메모리는 심볼당 win개)
+    심볼별로 처음 win-1개 봉은 워밍업. curve에는 ts마다 1행
+    (equity=현금+Σ수량*최근가, price/qty/avg는 첫 심볼 기준)을 기록합니다.
+    """
+    strat.on_start()
+    on_candle = strat.on_candle if isinstance(strat, IStreamingStrategy) else None
+    primary = next(iter(streams), "")
+    main = pf.position(primary)
+    seen: Dict[str, int] = {}
+    marks: Dict[str, float] = {}
+    held = 0.0  # Σ 수량 * 최근가 (틱/체결마다 증분 갱신)
+    last_ts: int | None = None
+    history: Dict[str, List[Candle]] = {}
+    fills: List[Order] = []
+
+    def flush(ts: int) -> None:
+        if curve is not None:
+            curve.append(
+                ts, pf.cash + held, marks.get(primary, 0.0), pf.cash, main.qty, main.avg
+            )
+
+    for sym, c in merge_by_ts(streams):
+        if last_ts is not None and c.ts != last_ts:
+            flush(last_ts)
+        last_ts = c.ts
+        pos = pf.position(sym)
+        held += pos.qty * (c.c - marks.get(sym, 0.0))
+        marks[sym] = c.c
+
+        n = seen[sym] = seen.get(sym, 0) + 1
+        if on_candle is not None:
+            orders = on_candle(sym, c)
+        else:
+            h = history.setdefault(sym, [])
+            h.append(c)
+            if len(h) > win:
+                del h[0]
+            orders = strat.generate({sym: h}) if n >= win else []
+        if n < win or not orders:
+            continue
+        q0 = pos.qty
+        fills.extend(broker.fill(orders, c.c, pf, ts=c.ts))
+        held += (pos.qty - q0) * c.c
+    if last_ts is not None:
+        flush(last_ts)
+    return fills
+
+
+def _years(bars: int, interval: str) -> float:
+    """봉 개수 → 기간(년)"""
+    mins = INTERVAL_MINUTES.get(interval, 1)
+    # 총 기간(년) ≈ (캔들개수 * 캔들분) / (60*24*365)
+    years = (bars * mins) / (60 * 24 * 365)
+    return max(years, 1.0 / 365.0)
+
+
+def summarize_accumulator(
+    acc: MetricsAccumulator, fills: List[Order], interval: str = "1m"
+) -> Dict[str, float]:
+    """누적기 지표 + 체결 수 (곡선을 저장하지 않는 sweep용)"""
+    return {**acc.summary(_years(len(acc), interval)), "trades": len(fills)}
+
+
+def compute_metrics(
+    curve: EquityCurve,
+    fills: List[Order],
+    interval: str = "1m",
+    fee_rate: float = 0.0,
+) -> Dict[str, float]:
+    """봉별 에쿼티 버퍼 + 체결 → 요약 지표 dict (summary.txt용)"""
+    # MDD/샤프/소르티노/CAGR/드로우다운 기간: 에쿼티 1패스 누적
+    acc = MetricsAccumulator.from_equity(curve.equity.tolist())
+    m = summarize_accumulator(acc, fills, interval)
+
+    # 승률/평균PnL: FIFO 로트 청산(수수료 차감) 기준
+    pnls = trade_pnls(fills, fee_rate=fee_rate)
+    wins = sum(1 for p in pnls if p > 0)
+    m["closed_trades"] = len(pnls)
+    m["win_rate"] = (wins / len(pnls) * 100.0) if pnls else 0.0
+    m["avg_trade_pnl"] = (sum(pnls) / len(pnls)) if pnls else 0.0
+    m["last_price"] = float(curve.price[-1]) if len(curve) else 0.0
+    return m
 
 
 def backtest(
@@ -34,58 +374,52 @@ def backtest(
     slippage: float = 0.0,
 ) -> str:
     s = Settings.load(config)
-
-    # 데이터 준비
-    batches: Dict[str, Iterable[Candle]] = {}
-    if "csv" in s.data:
-        for sym in s.strategy.symbols:
-            batches[sym] = list(load_candles_csv(s.data["csv"]))
-    else:
-        ex = FakeExchange()
-        candle = CandleService(ex)
-        for sym in s.strategy.symbols:
-            batches[sym] = list(candle.fetch(sym, s.data["interval"], s.data["window"]))
+    symbols = s.strategy.symbols
 
     # 전략/브로커
-    strat = create_strategy(
-        s.strategy.name, **s.strategy.params, symbols=s.strategy.symbols
-    )
+    strat = create_strategy(s.strategy.name, **s.strategy.params, symbols=symbols)
     broker = PaperBroker(fee_rate=fee_rate, slippage=slippage)
-    pf = Portfolio(cash=cash_start, pos=Position())
-
-    fills: List[Order] = []
-    sym = s.strategy.symbols[0]
-    candles = list(batches[sym])
-
-    # 롤링 윈도우 실행
+    pf = Portfolio(cash=cash_start)
     win = s.data["window"]
-    for i in range(win, len(candles) + 1):
-        window = candles[:i]
-        orders: List[OrderRequest] = strat.generate({sym: window})
-        if not orders:
-            continue
-        last = window[-1]
-        fills.extend(broker.fill(orders, last.c, pf, ts=last.ts))  # <-- ts 기록
+
+    if len(symbols) == 1:
+        # 단일 심볼: 전체 적재 후 벡터/스트리밍/롤링 경로 중 선택
+        sym = symbols[0]
+        candles = load_batches(s)[sym]
+        curve = EquityCurve(capacity=len(candles))
+        fills = simulate(strat, sym, candles, win, broker, pf, curve)
+    else:
+        # 멀티 심볼: ts 병합 이벤트 클럭
+        curve = EquityCurve()
+        fills = simulate_merged(strat, load_streams(s), win, broker, pf, curve)
+    main = pf.position(symbols[0])
 
     # 산출물 디렉토리
     out = Path(out_dir)
     out.mkdir(parents=True, exist_ok=True)
 
-    # 1) 에쿼티 곡선 CSV (최종 상태 기준의 마크투마켓)
+    # 1) 에쿼티 곡선 CSV (봉별 마크투마켓, price/qty/avg는 첫 심볼 기준)
     eq_path = out / "equity_curve.csv"
     with eq_path.open("w", newline="", encoding="utf-8") as f:
         w = csv.writer(f)
         w.writerow(["ts", "equity", "price", "cash", "qty", "avg"])
-        for c in candles:
-            equity = pf.cash + pf.pos.qty * c.c
+        rows = zip(
+            curve.ts.tolist(),
+            curve.equity.tolist(),
+            curve.price.tolist(),
+            curve.cash.tolist(),
+            curve.qty.tolist(),
+            curve.avg.tolist(),
+        )
+        for t_i, e_i, p_i, cash_i, qty_i, avg_i in rows:
             w.writerow(
                 [
-                    c.ts,
-                    f"{equity:.2f}",
-                    f"{c.c:.2f}",
-                    f"{pf.cash:.2f}",
-                    f"{pf.pos.qty:.8f}",
-                    f"{pf.pos.avg:.2f}",
+                    t_i,
+                    f"{e_i:.2f}",
+                    f"{p_i:.2f}",
+                    f"{cash_i:.2f}",
+                    f"{qty_i:.8f}",
+                    f"{avg_i:.2f}",
                 ]
             )
 
@@ -107,83 +441,39 @@ def backtest(
             )
 
     # 3) 요약(summary.txt) + 지표
-    last_price = candles[-1].c if candles else 0.0
-    final_equity = pf.cash + pf.pos.qty * last_price
-
-    # 지표 계산
-    # (a) MDD: 간단히 equity_curve.csv의 equity 열 재구성(최종 포지션 기준)
-    eq_vals = [pf.cash + pf.pos.qty * c.c for c in candles]
-    mdd, peak_v, trough_v = max_drawdown(eq_vals)
-
-    # (b) 승률/평균PnL: 거래쌍(매수→매도) 기준
-    pnls = trade_pnls(fills)
-    wins = sum(1 for p in pnls if p > 0)
-    win_rate = (wins / len(pnls) * 100.0) if pnls else 0.0
-    avg_pnl = (sum(pnls) / len(pnls)) if pnls else 0.0
-
-    # (c) 샤프: 간단히 캔들별 수익률(가격 기준)로 대체(보다 정확히 하려면 포트폴리오 일별 수익률 사용)
-    rets = []
-    for i in range(1, len(candles)):
-        p0 = candles[i - 1].c
-        p1 = candles[i].c
-        if p0 > 0:
-            rets.append(p1 / p0 - 1.0)
-    sharpe = sharpe_ratio(rets)
-
-    # 분봉 간격(분) → 연 단위 환산 계수 계산
-    interval = s.data.get("interval", "1m")
-    mins_map = {
-        "1m": 1,
-        "3m": 3,
-        "5m": 5,
-        "10m": 10,
-        "15m": 15,
-        "30m": 30,
-        "60m": 60,
-        "240m": 240,
-    }
-    mins = mins_map.get(interval, 1)
-    # 총 기간(년) ≈ (캔들개수 * 캔들분) / (60*24*365)
-    years = (len(candles) * mins) / (60 * 24 * 365)
-    years = max(years, 1.0 / 365.0)
-
-    # CAGR/Calmar/Sortino + 드로우다운/리커버리 기간
-    cagr_val = cagr(eq_vals, years)  # eq_vals는 위에서 만든 에쿼티 시퀀스
-    calmar_val = calmar(cagr_val, mdd)  # mdd는 max_drawdown의 첫 반환값(음수 비율)
-    sortino_val = sortino(rets)  # rets는 위에서 만든 수익률 시퀀스
-    mdd_period, recovery_period = drawdown_periods(eq_vals)
+    m = compute_metrics(curve, fills, s.data.get("interval", "1m"), fee_rate)
 
     summary_path = out / "summary.txt"
     with summary_path.open("w", encoding="utf-8") as f:
-        f.write(f"final_equity={final_equity:.2f}\n")
+        f.write(f"final_equity={m['final_equity']:.2f}\n")
         f.write(
-            f"cash={pf.cash:.2f}, qty={pf.pos.qty:.8f}, avg={pf.pos.avg:.2f}, last_price={last_price:.2f}\n"
+            f"cash={pf.cash:.2f}, qty={main.qty:.8f}, avg={main.avg:.2f}, last_price={m['last_price']:.2f}\n"
         )
-        f.write(f"trades={len(fills)}, closed_trades={len(pnls)}\n")
-        f.write(f"win_rate={win_rate:.2f}%\n")
-        f.write(f"avg_trade_pnl={avg_pnl:.4f}\n")
+        if len(symbols) > 1:
+            for sym in symbols:
+                pos = pf.position(sym)
+                f.write(f"position[{sym}]: qty={pos.qty:.8f}, avg={pos.avg:.2f}\n")
+        f.write(f"trades={m['trades']}, closed_trades={m['closed_trades']}\n")
+        f.write(f"win_rate={m['win_rate']:.2f}%\n")
+        f.write(f"avg_trade_pnl={m['avg_trade_pnl']:.4f}\n")
         f.write(
-            f"max_drawdown={mdd*100:.2f}% (peak={peak_v:.2f} -> trough={trough_v:.2f})\n"
+            f"max_drawdown={m['mdd']*100:.2f}% (peak={m['mdd_peak']:.2f} -> trough={m['mdd_trough']:.2f})\n"
         )
-        f.write(f"sharpe={sharpe:.4f}\n")
-        f.write(f"cagr={cagr_val*100:.2f}%\n")
-        f.write(f"calmar={calmar_val:.4f}\n")
-        f.write(f"sortino={sortino_val:.4f}\n")
-        f.write(f"mdd_period={mdd_period}, recovery_period={recovery_period}\n")
+        f.write(f"sharpe={m['sharpe']:.4f}\n")
+        f.write(f"cagr={m['cagr']*100:.2f}%\n")
+        f.write(f"calmar={m['calmar']:.4f}\n")
+        f.write(f"sortino={m['sortino']:.4f}\n")
+        f.write(f"mdd_period={m['mdd_period']}, recovery_period={m['recovery_period']}\n")
 
     # 4) 차트 저장 (equity.png) - 가격 & 에쿼티 같은 축 겹치면 스케일이 달라지므로 보조축 사용
-    if candles:
-        ts = [c.ts for c in candles]
-        px = [c.c for c in candles]
-        eq = [pf.cash + pf.pos.qty * c.c for c in candles]
-
+    if len(curve):
         fig, ax1 = plt.subplots(figsize=(10, 5))
-        ax1.plot(ts, px, label="price")
+        ax1.plot(curve.ts, curve.price, label="price")
         ax1.set_xlabel("ts")
         ax1.set_ylabel("price")
 
         ax2 = ax1.twinx()
-        ax2.plot(ts, eq, label="equity")
+        ax2.plot(curve.ts, curve.equity, label="equity")
         ax2.set_ylabel("equity")
 
         # 간단 범례
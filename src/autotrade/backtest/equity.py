@@ -0,0 +1,108 @@
+# src/autotrade/backtest/equity.py
+# ------------------------------------------------------------
+# 봉별 마크투마켓 기록 버퍼
+# - 시뮬레이션 중 봉마다 (ts, equity, price, cash, qty, avg)를 1번만 기록
+# - 미리 잡아 둔 NumPy 버퍼에 쓰고, 부족하면 2배로 확장
+# - equity_curve.csv / 지표 / 차트가 모두 이 버퍼 하나를 읽음
+# ------------------------------------------------------------
+from __future__ import annotations
+from typing import Dict, Protocol
+import numpy as np
+
+COLUMNS = ("equity", "price", "cash", "qty", "avg")
+
+
+class EquitySink(Protocol):
+    """simulate 함수들이 봉별 상태를 기록하는 대상 (EquityCurve, MetricsAccumulator)"""
+
+    def append(
+        self, ts: int, equity: float, price: float, cash: float, qty: float, avg: float
+    ) -> None: ...
+    def extend(self, ts: np.ndarray, **cols: np.ndarray) -> None: ...
+
+
+class EquityCurve:
+    """
+    봉별 포트폴리오 상태 기록.
+    - capacity: 예상 봉 개수(알면 넘겨서 재할당 없이 기록)
+    - price/qty/avg는 대표(첫) 심볼 기준, equity/cash는 포트폴리오 전체
+    """
+
+    def __init__(self, capacity: int = 1024):
+        cap = max(int(capacity), 1)
+        self._n = 0
+        self._ts = np.empty(cap, dtype=np.int64)
+        self._cols: Dict[str, np.ndarray] = {
+            k: np.empty(cap, dtype=np.float64) for k in COLUMNS
+        }
+
+    def __len__(self) -> int:
+        return self._n
+
+    def _grow(self, need: int) -> None:
+        cap = len(self._ts)
+        if need <= cap:
+            return
+        new_cap = max(need, cap * 2)
+        self._ts = np.resize(self._ts, new_cap)
+        for k, buf in self._cols.items():
+            self._cols[k] = np.resize(buf, new_cap)
+
+    def append(
+        self, ts: int, equity: float, price: float, cash: float, qty: float, avg: float
+    ) -> None:
+        i = self._n
+        if i == len(self._ts):
+            self._grow(i + 1)
+        self._ts[i] = ts
+        cols = self._cols
+        cols["equity"][i] = equity
+        cols["price"][i] = price
+        cols["cash"][i] = cash
+        cols["qty"][i] = qty
+        cols["avg"][i] = avg
+        self._n = i + 1
+
+    def extend(self, ts: np.ndarray, **cols: np.ndarray) -> None:
+        """열 배열 단위로 한 번에 추가 (벡터 경로용)"""
+        m = len(ts)
+        i = self._n
+        self._grow(i + m)
+        self._ts[i : i + m] = ts
+        for k in COLUMNS:
+            self._cols[k][i : i + m] = cols[k]
+        self._n = i + m
+
+    # --- 읽기 전용 뷰 (복사 없음) ---
+    @property
+    def ts(self) -> np.ndarray:
+        return self._ts[: self._n]
+
+    @property
+    def equity(self) -> np.ndarray:
+        return self._cols["equity"][: self._n]
+
+    @property
+    def price(self) -> np.ndarray:
+        return self._cols["price"][: self._n]
+
+    @property
+    def cash(self) -> np.ndarray:
+        return self._cols["cash"][: self._n]
+
+    @property
+    def qty(self) -> np.ndarray:
+        return self._cols["qty"][: self._n]
+
+    @property
+    def avg(self) -> np.ndarray:
+        return self._cols["avg"][: self._n]
+
+    def returns(self) -> np.ndarray:
+        """봉별 에쿼티 수익률 (직전 에쿼티가 0 이하인 봉은 제외)"""
+        eq = self.equity
+        if len(eq) < 2:
+            return np.empty(0, dtype=np.float64)
+        prev, cur = eq[:-1], eq[1:]
+        ok = prev > 0
+        return cur[ok] / prev[ok] - 1.0
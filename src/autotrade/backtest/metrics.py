@@ -1,7 +1,8 @@
 # src/autotrade/backtest/metrics.py
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Iterable, List, Tuple
+from collections import deque
+from typing import Deque, Dict, Iterable, List, Tuple
 from autotrade.models.market import Candle
 from autotrade.models.order import Order
 import statistics
@@ -36,19 +37,112 @@ def max_drawdown(equity: List[float]) -> Tuple[float, float, float]:
     return (mdd, peak_v, trough_v)
 
 
-def trade_pnls(fills: List[Order]) -> List[float]:
-    """아주 단순: buy 후 sell에서 확정(PnL= (sell_px - buy_px)*qty). 포지션 누적이 아닌 1:1 매칭 가정."""
-    pnls: List[float] = []
-    stack: List[Order] = []
-    for f in fills:
-        if f.side.lower() == "buy":
-            stack.append(f)
-        else:
-            if stack:
-                b = stack.pop(0)
-                if b.price is not None and f.price is not None:
-                    pnls.append((f.price - b.price) * min(b.qty, f.qty))
-    return pnls
+@dataclass
+class Lot:
+    """미청산 매수 로트 (수수료는 단위 수량당으로 보관해 부분 청산 시 비례 배분)"""
+
+    qty: float
+    price: float
+    fee_per_unit: float = 0.0
+    ts: int | None = None
+
+
+@dataclass(frozen=True)
+class ClosedLot:
+    """청산된 로트 조각 1개의 실현 손익"""
+
+    symbol: str
+    qty: float
+    entry_price: float
+    exit_price: float
+    pnl: float  # (exit - entry) * qty - 매수/매도 수수료
+    entry_ts: int | None = None
+    exit_ts: int | None = None
+
+
+class LotLedger:
+    """
+    심볼별 로트 원장: 매수는 로트로 쌓고, 매도는 로트를 소진하며 실현 손익을 냄.
+    - method="fifo": 먼저 산 로트부터 (deque popleft, 기본)
+    - method="lifo": 나중에 산 로트부터
+    - method="avg" : 평균단가 (로트 1개로 합산)
+    부분 체결/부분 청산 지원, 체결당 상각 O(1) → 전체 O(n).
+    보유 수량을 넘는 매도분은 무시합니다(숏 미지원).
+    """
+
+    def __init__(self, method: str = "fifo", fee_rate: float = 0.0, eps: float = 1e-12):
+        if method not in ("fifo", "lifo", "avg"):
+            raise ValueError(f"Unsupported lot method: {method}")
+        self.method = method
+        self.fee_rate = fee_rate
+        self.eps = eps
+        self._lots: Dict[str, Deque[Lot]] = {}
+
+    def open_qty(self, symbol: str) -> float:
+        return sum(lot.qty for lot in self._lots.get(symbol, ()))
+
+    def open_lots(self, symbol: str) -> List[Lot]:
+        return list(self._lots.get(symbol, ()))
+
+    def add(self, fill: Order) -> List[ClosedLot]:
+        """체결 1건 반영 → 이번 체결로 청산된 로트 조각 목록"""
+        if fill.price is None or fill.qty <= 0:
+            return []
+        lots = self._lots.setdefault(fill.symbol, deque())
+        fee_per_unit = fill.price * self.fee_rate
+
+        if fill.side.lower() == "buy":
+            if self.method == "avg" and lots:
+                cur = lots[0]
+                qty = cur.qty + fill.qty
+                cur.price = (cur.qty * cur.price + fill.qty * fill.price) / qty
+                cur.fee_per_unit = (
+                    cur.qty * cur.fee_per_unit + fill.qty * fee_per_unit
+                ) / qty
+                cur.qty = qty
+            else:
+                lots.append(Lot(fill.qty, fill.price, fee_per_unit, fill.ts))
+            return []
+
+        closed: List[ClosedLot] = []
+        remaining = fill.qty
+        take_left = self.method != "lifo"
+        while remaining > self.eps and lots:
+            lot = lots[0] if take_left else lots[-1]
+            q = min(lot.qty, remaining)
+            pnl = (fill.price - lot.price) * q - (lot.fee_per_unit + fee_per_unit) * q
+            closed.append(
+                ClosedLot(
+                    symbol=fill.symbol,
+                    qty=q,
+                    entry_price=lot.price,
+                    exit_price=fill.price,
+                    pnl=pnl,
+                    entry_ts=lot.ts,
+                    exit_ts=fill.ts,
+                )
+            )
+            remaining -= q
+            lot.qty -= q
+            if lot.qty <= self.eps:
+                if take_left:
+                    lots.popleft()
+                else:
+                    lots.pop()
+        return closed
+
+    def extend(self, fills: Iterable[Order]) -> List[ClosedLot]:
+        out: List[ClosedLot] = []
+        for f in fills:
+            out.extend(self.add(f))
+        return out
+
+
+def trade_pnls(
+    fills: List[Order], fee_rate: float = 0.0, method: str = "fifo"
+) -> List[float]:
+    """청산된 로트 조각별 실현 손익 (기본 FIFO, 부분 체결/멀티 심볼/수수료 반영)"""
+    return [c.pnl for c in LotLedger(method=method, fee_rate=fee_rate).extend(fills)]
 
 
 def sharpe_ratio(returns: List[float], eps: float = 1e-12) -> float:
@@ -160,3 +254,149 @@ def drawdown_periods(equity_curve: List[float]) -> Tuple[int, int]:
                 break
 
     return (mdd_period, recovery)
+
+
+class MetricsAccumulator:
+    """
+    에쿼티를 1개씩 받아 O(1) 메모리로 지표를 누적하는 단일 패스 계산기.
+    - 수익률 평균/분산: Welford (샤프는 표본분산, sharpe_ratio와 동일 정의)
+    - 하락 수익률 평균/분산: Welford (sortino와 동일하게 모집단 표준편차)
+    - 러닝 피크/트로프: max_drawdown, drawdown_periods와 동일 정의
+    언제든 현재까지의 지표를 읽을 수 있어 라이브/페이퍼 루프나 스윕에서
+    전체 에쿼티 곡선을 저장하지 않고도 쓸 수 있습니다.
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.first = 0.0
+        self.last = 0.0
+        # 수익률 (Welford)
+        self._n = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        # 하락 수익률 (Welford)
+        self._dn = 0
+        self._dmean = 0.0
+        self._dm2 = 0.0
+        # 드로우다운
+        self._peak = -1e30
+        self._peak_idx = 0
+        self._mdd = 0.0
+        self._mdd_peak = 0.0
+        self._mdd_trough = 0.0
+        self._mdd_start = 0
+        self._mdd_end = 0
+        self._ref_peak = 0.0  # 리커버리 기준값 = equity[mdd_start]
+        self._recovery = 0
+        self._recovered = False
+
+    @classmethod
+    def from_equity(cls, equity: Iterable[float]) -> "MetricsAccumulator":
+        acc = cls()
+        for v in equity:
+            acc.update(v)
+        return acc
+
+    def update(self, equity: float) -> None:
+        v = float(equity)
+        i = self.count
+        if i == 0:
+            self.first = v
+            self._ref_peak = v
+        else:
+            prev = self.last
+            if prev > 0:
+                r = v / prev - 1.0
+                self._n += 1
+                d = r - self._mean
+                self._mean += d / self._n
+                self._m2 += d * (r - self._mean)
+                if r < 0:
+                    self._dn += 1
+                    dd_ = r - self._dmean
+                    self._dmean += dd_ / self._dn
+                    self._dm2 += dd_ * (r - self._dmean)
+        self.last = v
+        self.count = i + 1
+
+        if v > self._peak:
+            self._peak = v
+            self._peak_idx = i
+        dd = (v / self._peak - 1.0) if self._peak else 0.0
+        if dd < self._mdd:
+            self._mdd = dd
+            self._mdd_peak = self._peak
+            self._mdd_trough = v
+            self._mdd_start, self._mdd_end = self._peak_idx, i
+            self._ref_peak = self._peak
+            self._recovery = 0
+            self._recovered = False
+        elif not self._recovered and i > self._mdd_end and v >= self._ref_peak:
+            self._recovery = i - self._mdd_end
+            self._recovered = True
+
+    # --- EquityCurve와 같은 기록 인터페이스 (simulate의 curve 자리에 전달 가능) ---
+    def append(
+        self, ts: int, equity: float, price: float, cash: float, qty: float, avg: float
+    ) -> None:
+        self.update(equity)
+
+    def extend(self, ts: Iterable[int], **cols: Iterable[float]) -> None:
+        for v in cols["equity"]:
+            self.update(v)
+
+    def __len__(self) -> int:
+        return self.count
+
+    # --- 현재까지의 지표 ---
+    @property
+    def sharpe(self) -> float:
+        """sharpe_ratio와 동일 (무위험 0, 비연율화)"""
+        if self._n == 0:
+            return 0.0
+        std = (self._m2 / max(self._n - 1, 1)) ** 0.5
+        return self._mean / (std + 1e-12)
+
+    @property
+    def sortino(self) -> float:
+        """sortino와 동일: mean(returns) / pstdev(returns where r<0)"""
+        if self._n == 0:
+            return 0.0
+        if self._dn == 0:
+            return float("inf")
+        downside_std = math.sqrt(max(self._dm2 / self._dn, 0.0))
+        if downside_std <= 1e-12:
+            return float("inf")
+        return self._mean / downside_std
+
+    @property
+    def max_drawdown(self) -> Tuple[float, float, float]:
+        """max_drawdown과 동일: (mdd, peak, trough)"""
+        return (self._mdd, self._mdd_peak, self._mdd_trough)
+
+    @property
+    def drawdown_periods(self) -> Tuple[int, int]:
+        """drawdown_periods와 동일: (MDD 기간, 리커버리 기간)"""
+        return (max(self._mdd_end - self._mdd_start, 0), self._recovery)
+
+    def cagr(self, years: float) -> float:
+        if self.count == 0:
+            return 0.0
+        return cagr([self.first, self.last], years)
+
+    def summary(self, years: float) -> Dict[str, float]:
+        mdd, peak_v, trough_v = self.max_drawdown
+        mdd_period, recovery_period = self.drawdown_periods
+        cagr_val = self.cagr(years)
+        return {
+            "final_equity": self.last,
+            "mdd": mdd,
+            "mdd_peak": peak_v,
+            "mdd_trough": trough_v,
+            "sharpe": self.sharpe,
+            "sortino": self.sortino,
+            "cagr": cagr_val,
+            "calmar": calmar(cagr_val, mdd),
+            "mdd_period": mdd_period,
+            "recovery_period": recovery_period,
+        }
@@ -0,0 +1,112 @@
+# src/autotrade/backtest/sweep.py
+# ------------------------------------------------------------
+# 파라미터 스윕: strategy.params의 YAML 리스트를 그리드로 펼쳐
+# ProcessPoolExecutor로 병렬 백테스트 → 결과 테이블(CSV) 1개
+# - 캔들은 워커 프로세스마다 1번만 로드 (initializer)
+# - 조합별로 reports/를 다시 쓰지 않고 지표만 모음
+# - 워커마다 IndicatorCache 1개를 조합 간에 공유 (같은 EMA/SMA/std는 1번만 계산)
+#   생성자에 cache 인자가 있는 전략에만 넘김
+# - 심볼이 여러 개면 backtest()와 같이 simulate_merged(ts 병합 이벤트 클럭)로 전체 심볼 실행
+# ------------------------------------------------------------
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+import csv
+import itertools
+import os
+from typing import Any, Dict, List
+
+from autotrade.settings import Settings
+from autotrade.analysis.cache import IndicatorCache
+from autotrade.strategies.registry import accepts, create as create_strategy
+from autotrade.models.market import CandleFrame
+from autotrade.backtest.broker import PaperBroker, Portfolio
+from autotrade.backtest.engine import (
+    load_batches,
+    simulate,
+    simulate_merged,
+    summarize_accumulator,
+)
+from autotrade.backtest.metrics import MetricsAccumulator
+
+METRIC_COLS = ["final_equity", "sharpe", "sortino", "calmar", "mdd", "trades"]
+
+# 워커 프로세스 전역 상태 (_init_worker에서 1회 채움)
+_SETTINGS: Settings | None = None
+_CANDLES: Dict[str, CandleFrame] = {}  # 심볼 → 전체 캔들 (설정의 심볼 순서)
+_BROKER_KW: Dict[str, float] = {}
+_CACHE = IndicatorCache()
+
+
+def expand_grid(params: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """리스트 값은 후보 목록으로 보고 데카르트 곱으로 펼침 (스칼라는 고정값)"""
+    keys = list(params)
+    axes = [v if isinstance(v, list) else [v] for v in params.values()]
+    return [dict(zip(keys, combo)) for combo in itertools.product(*axes)]
+
+
+def _init_worker(config: str, broker_kw: Dict[str, float]) -> None:
+    global _SETTINGS, _CANDLES, _BROKER_KW
+    _SETTINGS = Settings.load(config)
+    batches = load_batches(_SETTINGS)
+    _CANDLES = {sym: batches[sym] for sym in _SETTINGS.strategy.symbols}
+    _BROKER_KW = broker_kw
+    _CACHE.clear()
+
+
+def _run_one(params: Dict[str, Any]) -> Dict[str, Any]:
+    s = _SETTINGS
+    assert s is not None, "worker not initialized"
+    symbols = s.strategy.symbols
+    # cache 인자를 받는 전략에만 공유 캐시를 넘김 (없는 전략은 그대로 생성)
+    extra = {"cache": _CACHE} if accepts(s.strategy.name, "cache") else {}
+    strat = create_strategy(
+        s.strategy.name, **params, symbols=s.strategy.symbols, **extra
+    )
+    broker = PaperBroker(
+        fee_rate=_BROKER_KW["fee_rate"], slippage=_BROKER_KW["slippage"]
+    )
+    pf = Portfolio(cash=_BROKER_KW["cash_start"])
+    # 에쿼티 곡선은 저장하지 않고 봉마다 지표만 누적
+    acc = MetricsAccumulator()
+    win = s.data["window"]
+    if len(symbols) == 1:
+        fills = simulate(strat, symbols[0], _CANDLES[symbols[0]], win, broker, pf, acc)
+    else:
+        fills = simulate_merged(strat, _CANDLES, win, broker, pf, acc)
+    m = summarize_accumulator(acc, fills, s.data.get("interval", "1m"))
+    return {**params, **{k: m[k] for k in METRIC_COLS}}
+
+
+def sweep(
+    config: str,
+    out_path: str = "reports/sweep.csv",
+    workers: int | None = None,
+    cash_start: float = 10_000.0,
+    fee_rate: float = 0.0005,
+    slippage: float = 0.0,
+) -> List[Dict[str, Any]]:
+    """
+    config의 strategy.params 그리드를 병렬 실행하고 out_path에 결과 CSV 저장.
+    반환: 조합별 {파라미터..., final_equity, sharpe, sortino, calmar, mdd, trades}
+    """
+    s = Settings.load(config)
+    combos = expand_grid(s.strategy.params)
+    broker_kw = {"cash_start": cash_start, "fee_rate": fee_rate, "slippage": slippage}
+
+    n = workers or os.cpu_count() or 1
+    n = max(1, min(n, len(combos)))
+    # 작업을 워커 수의 몇 배 정도로 묶어 IPC 오버헤드 감소
+    chunksize = max(1, len(combos) // (n * 4))
+    with ProcessPoolExecutor(
+        max_workers=n, initializer=_init_worker, initargs=(config, broker_kw)
+    ) as pool:
+        rows = list(pool.map(_run_one, combos, chunksize=chunksize))
+
+    out = Path(out_path)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    with out.open("w", newline="", encoding="utf-8") as f:
+        w = csv.DictWriter(f, fieldnames=list(s.strategy.params) + METRIC_COLS)
+        w.writeheader()
+        w.writerows(rows)
+    return rows
@@ -1,9 +1,13 @@
+import calendar
+import time
 import typer
 from autotrade.exchanges.upbit import UpbitClient
 from autotrade.exchanges.fake import FakeExchange
-from autotrade.data.downloader import download_candles
+from autotrade.data.downloader import backfill_candles, download_candles
+from autotrade.data.store import csv_to_store, is_store, store_to_csv
 from autotrade.app import run
 from autotrade.backtest.engine import backtest
+from autotrade.backtest.sweep import sweep as run_sweep
 from autotrade.live import run_live
 from autotrade.strategies.registry import available
 from autotrade.exchanges.base import IExchangeClient
@@ -23,6 +27,22 @@ def bt(config: str = "configs/dev.yaml"):
     print(f"Backtest report written to: {out_csv}")
 
 
+@app.command()
+def sweep(
+    config: str = "configs/dev.yaml",
+    out: str = typer.Option("reports/sweep.csv", help="결과 테이블 CSV 경로"),
+    workers: int = typer.Option(0, help="프로세스 수 (0=CPU 코어 수)"),
+    sort_by: str = typer.Option("sharpe", help="정렬 기준 지표"),
+    top: int = typer.Option(10, help="콘솔에 출력할 상위 조합 수"),
+):
+    """strategy.params의 리스트 값을 그리드로 펼쳐 병렬 백테스트."""
+    rows = run_sweep(config, out_path=out, workers=workers or None)
+    rows.sort(key=lambda r: r.get(sort_by, 0.0), reverse=True)
+    for r in rows[:top]:
+        typer.echo(", ".join(f"{k}={v}" for k, v in r.items()))
+    typer.echo(f"Sweep results ({len(rows)} combos) written to: {out}")
+
+
 @app.command()
 def live(
     config: str = "configs/dev.yaml", loops: int = 10, sleep_s: int = 5, live: int = 0
@@ -78,5 +98,53 @@ def download(
     typer.echo(f"Saved: {path}")
 
 
+def _parse_utc(value: str) -> int:
+    """epoch 초 또는 UTC 'YYYY-MM-DD[THH:MM[:SS]]' → epoch 초"""
+    if value.isdigit():
+        return int(value)
+    for fmt in ("%Y-%m-%dT%H:%M:%S", "%Y-%m-%dT%H:%M", "%Y-%m-%d"):
+        try:
+            return calendar.timegm(time.strptime(value, fmt))
+        except ValueError:
+            continue
+    raise typer.BadParameter(f"not an epoch or UTC date: {value}")
+
+
+@app.command("backfill")
+def backfill(
+    symbol: str = typer.Option(..., help="예: KRW-BTC (Upbit 표기)"),
+    interval: str = typer.Option("1m", help="1m/3m/5m/15m/30m/60m/240m"),
+    start: str = typer.Option(..., help="시작 시각 (UTC 날짜 또는 epoch 초, 포함)"),
+    end: str = typer.Option("", help="끝 시각 (UTC 날짜 또는 epoch 초, 미포함; 비우면 현재)"),
+    out: str = typer.Option(..., help="출력 CSV 경로"),
+    use_fake: bool = typer.Option(False, help="FakeExchange로 더미 데이터 저장"),
+) -> None:
+    """
+    과거 캔들 백필. 최신부터 과거로 200개씩 페이지를 받아 디스크에 바로 기록하고,
+    중단되면 같은 명령을 다시 실행해 체크포인트부터 이어 받습니다.
+    """
+    ex: IExchangeClient = FakeExchange() if use_fake else UpbitClient()
+    path = backfill_candles(
+        exchange=ex,
+        symbol=symbol,
+        interval=interval,
+        start_ts=_parse_utc(start),
+        end_ts=_parse_utc(end) if end else None,
+        out_path=out,
+        sleep_s=0.0 if use_fake else 0.1,
+    )
+    typer.echo(f"Saved: {path}")
+
+
+@app.command("convert")
+def convert(
+    src: str = typer.Argument(..., help="입력 경로 (.csv 또는 .candles)"),
+    dst: str = typer.Argument(..., help="출력 경로 (.candles 또는 .csv)"),
+) -> None:
+    """CSV ↔ 바이너리 캔들 저장소(.candles) 변환. 방향은 src 확장자로 결정."""
+    path = store_to_csv(src, dst) if is_store(src) else csv_to_store(src, dst)
+    typer.echo(f"Saved: {path}")
+
+
 if __name__ == "__main__":
     app()
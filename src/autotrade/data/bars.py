@@ -0,0 +1,133 @@
+# src/autotrade/data/bars.py
+# ------------------------------------------------------------
+# 체결(Trade) 스트림 → OHLCV 캔들 (임의 간격, 심볼별)
+# - 봉 ts = 구간 시작 (UTC 정렬, Upbit candle_date_time_utc와 같은 기준)
+# - o=첫 체결가, hi/lo, c=마지막 체결가, v=체결량 합
+# - 체결이 없는 구간은 봉을 만들지 않음 (Upbit 캔들 API와 동일)
+# - 봉 닫힘: 다음 구간 체결이 오거나, tick(now)로 구간 끝 시각이 지났을 때
+#   (체결이 뜸해도 경계가 지나는 즉시 닫힌 봉을 받으려면 주기적으로 tick 호출)
+# - peek(symbol): 진행 중인 부분 봉 (봉 내부 로직용)
+# - 이미 닫힌 구간의 늦은 체결은 버리고 late로 셈
+# ------------------------------------------------------------
+from __future__ import annotations
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+from autotrade.models.market import Candle, Trade, interval_seconds
+
+Bar = Tuple[str, Candle]
+
+
+@dataclass
+class _Partial:
+    ts: int
+    o: float
+    hi: float
+    lo: float
+    c: float
+    v: float
+
+    def candle(self) -> Candle:
+        return Candle(self.ts, self.o, self.hi, self.lo, self.c, self.v)
+
+
+class BarBuilder:
+    """
+    update(trade) / tick(now) → 새로 닫힌 (심볼, 봉) 목록.
+    on_bar를 주면 닫힌 봉마다 바로 호출합니다.
+    grace_ms: 경계 후 늦게 도착하는 체결을 기다리는 시간 (tick 기준, 기본 0)
+    """
+
+    def __init__(
+        self,
+        interval: str,
+        on_bar: Optional[Callable[[str, Candle], None]] = None,
+        grace_ms: int = 0,
+    ):
+        self.step = interval_seconds(interval)
+        self.on_bar = on_bar
+        self.grace_ms = grace_ms
+        self.late = 0
+        self._bars: Dict[str, _Partial] = {}
+        self._closed: Dict[str, int] = {}  # 심볼별 마지막으로 닫힌 봉 ts
+
+    def _close(self, sym: str) -> List[Bar]:
+        bar = self._bars.pop(sym).candle()
+        self._closed[sym] = bar.ts
+        if self.on_bar is not None:
+            self.on_bar(sym, bar)
+        return [(sym, bar)]
+
+    def update(self, t: Trade) -> List[Bar]:
+        sec = t.ts_ms // 1000
+        bucket = sec - sec % self.step
+        sym = t.symbol
+        cur = self._bars.get(sym)
+        if (cur is not None and bucket < cur.ts) or bucket <= self._closed.get(sym, -1):
+            self.late += 1
+            return []
+        out: List[Bar] = []
+        if cur is not None and bucket > cur.ts:
+            out = self._close(sym)
+            cur = None
+        if cur is None:
+            self._bars[sym] = _Partial(bucket, t.price, t.price, t.price, t.price, t.volume)
+        else:
+            if t.price > cur.hi:
+                cur.hi = t.price
+            if t.price < cur.lo:
+                cur.lo = t.price
+            cur.c = t.price
+            cur.v += t.volume
+        return out
+
+    def tick(self, now_ms: int) -> List[Bar]:
+        """now_ms(epoch 밀리초) 기준으로 구간이 끝난 봉을 모두 닫음"""
+        cutoff = (now_ms - self.grace_ms) // 1000
+        out: List[Bar] = []
+        for sym in [s for s, b in self._bars.items() if b.ts + self.step <= cutoff]:
+            out += self._close(sym)
+        return out
+
+    def peek(self, symbol: str) -> Candle | None:
+        cur = self._bars.get(symbol)
+        return cur.candle() if cur is not None else None
+
+    def flush(self) -> List[Bar]:
+        """스트림 끝: 진행 중인 봉을 모두 (미완성 상태 그대로) 내보냄"""
+        out: List[Bar] = []
+        for sym in list(self._bars):
+            out += self._close(sym)
+        return out
+
+
+async def stream_bars(
+    messages: AsyncIterator[Any],
+    builder: BarBuilder,
+    clock: Callable[[], float] = time.time,
+    tick_s: float = 0.25,
+) -> AsyncIterator[Bar]:
+    """
+    메시지 스트림(예: UpbitStream)의 Trade로 봉을 만들어 닫히는 대로 내보냄.
+    체결이 없어도 tick_s마다 시계를 확인해 경계가 지난 봉을 닫습니다.
+    """
+    it = messages.__aiter__()
+    pending: asyncio.Future[Any] = asyncio.ensure_future(it.__anext__())
+    try:
+        while True:
+            done, _ = await asyncio.wait({pending}, timeout=tick_s)
+            if done:
+                try:
+                    msg = pending.result()
+                except StopAsyncIteration:
+                    break
+                pending = asyncio.ensure_future(it.__anext__())
+                if isinstance(msg, Trade):
+                    for bar in builder.update(msg):
+                        yield bar
+            for bar in builder.tick(int(clock() * 1000)):
+                yield bar
+    finally:
+        pending.cancel()
@@ -1,11 +1,138 @@
-from typing import Iterable
-from autotrade.exchanges.base import IExchangeClient
-from autotrade.models.market import Candle
+# src/autotrade/data/candles.py
+# ------------------------------------------------------------
+# 실시간 루프용 캔들 피드
+# - (심볼, 간격)마다 고정 크기 링 버퍼(CandleRing) 1개
+# - 첫 호출(워밍업)만 window개 전체 요청, 이후에는 마지막 ts 이후 봉 수만큼만 요청
+#   (진행 중인 마지막 봉은 같은 ts로 다시 와서 제자리 갱신)
+# - fetch()는 링 버퍼의 복사 없는 CandleFrame 뷰를 돌려줌
+#   뷰는 다음 fetch() 때 내용이 바뀌므로 보관하려면 복사하세요.
+# - AsyncCandleService: 같은 링 버퍼 로직, IAsyncExchangeClient용 (await fetch)
+# ------------------------------------------------------------
+from __future__ import annotations
+from array import array
+import time
+from typing import Callable, Dict, Iterable, Tuple
 
+from autotrade.exchanges.base import IAsyncExchangeClient, IExchangeClient
+from autotrade.models.market import Candle, CandleFrame, interval_seconds
 
-class CandleService:
-    def __init__(self, exchange: IExchangeClient):
+
+class CandleRing:
+    """
+    고정 크기 캔들 링 버퍼 (이중 기록).
+    열 길이를 2*capacity로 잡고 각 봉을 slot과 slot+capacity에 함께 써서
+    최근 n개가 항상 연속 구간 → view()는 memoryview 슬라이스 (복사 없음, O(1)).
+    append는 ts가 마지막과 같으면 제자리 교체, 더 작으면 무시합니다.
+    """
+
+    def __init__(self, capacity: int):
+        if capacity < 1:
+            raise ValueError(f"capacity must be >= 1, got {capacity}")
+        self.capacity = capacity
+        self._ts = array("q", bytes(16 * capacity))
+        self._cols = [array("d", bytes(16 * capacity)) for _ in range(5)]
+        self._pos = -1  # 마지막으로 쓴 slot
+        self._n = 0
+        self._mv = [memoryview(self._ts)] + [memoryview(col) for col in self._cols]
+
+    def __len__(self) -> int:
+        return self._n
+
+    @property
+    def last_ts(self) -> int | None:
+        return self._ts[self._pos] if self._n else None
+
+    def _write(self, slot: int, c: Candle) -> None:
+        o, hi, lo, cl, v = self._cols
+        for i in (slot, slot + self.capacity):
+            self._ts[i] = c.ts
+            o[i], hi[i], lo[i], cl[i], v[i] = c.o, c.hi, c.lo, c.c, c.v
+
+    def append(self, c: Candle) -> bool:
+        """새 봉이면 추가(가장 오래된 봉 덮어씀), 마지막 봉과 같은 ts면 교체. 무시했으면 False"""
+        last = self.last_ts
+        if last is not None and c.ts <= last:
+            if c.ts < last:
+                return False
+            self._write(self._pos, c)
+            return True
+        self._pos = (self._pos + 1) % self.capacity
+        self._write(self._pos, c)
+        self._n = min(self._n + 1, self.capacity)
+        return True
+
+    def extend(self, candles: Iterable[Candle]) -> int:
+        return sum(self.append(c) for c in candles)
+
+    def view(self) -> CandleFrame:
+        """오래된 것부터 최근 len(self)개 (버퍼를 가리키는 뷰)"""
+        end = self._pos + 1 + self.capacity if self._n else 0
+        start = end - self._n
+        ts, o, hi, lo, c, v = (mv[start:end] for mv in self._mv)
+        return CandleFrame(ts, o, hi, lo, c, v)
+
+
+class _RingFeed:
+    """(심볼, 간격)별 링 버퍼와 요청 개수 계산 (동기/비동기 서비스 공용)"""
+
+    def __init__(self, clock: Callable[[], float]):
+        self.clock = clock
+        self.requests = 0
+        self.rows = 0
+        self._rings: Dict[Tuple[str, str], CandleRing] = {}
+
+    def _plan(self, symbol: str, interval: str, window: int) -> Tuple[CandleRing, int]:
+        """이번에 채울 링 버퍼와 요청할 봉 수"""
+        key = (symbol, interval)
+        ring = self._rings.get(key)
+        if ring is None or ring.capacity < window:
+            # 워밍업 (또는 더 큰 window 요청): 전체 다시 받기
+            ring = self._rings[key] = CandleRing(window)
+            return ring, window
+        last = ring.last_ts
+        if last is None:
+            return ring, window
+        # 마지막 봉(진행 중일 수 있음) 포함, 그 뒤로 지나간 봉 수만큼
+        step = interval_seconds(interval)
+        missing = max(0, int(self.clock()) - last) // step + 1
+        return ring, min(missing, window)
+
+    def _ingest(self, ring: CandleRing, candles: Iterable[Candle], window: int) -> CandleFrame:
+        frame = CandleFrame.from_candles(candles)
+        self.requests += 1
+        self.rows += len(frame)
+        ring.extend(frame)
+        return ring.view()[-window:]
+
+
+class CandleService(_RingFeed):
+    """
+    fetch(symbol, interval, window): 최근 window개 캔들.
+    requests / rows로 거래소 요청 수와 받은 봉 수를 셉니다.
+    """
+
+    def __init__(
+        self, exchange: IExchangeClient, clock: Callable[[], float] = time.time
+    ):
+        super().__init__(clock)
+        self.exchange = exchange
+
+    def fetch(self, symbol: str, interval: str, window: int) -> CandleFrame:
+        ring, limit = self._plan(symbol, interval, window)
+        candles = self.exchange.get_candles(symbol, interval, limit=limit)
+        return self._ingest(ring, candles, window)
+
+
+class AsyncCandleService(_RingFeed):
+    """CandleService의 asyncio 버전 (심볼별 fetch를 asyncio.gather로 동시에 실행 가능)"""
+
+    def __init__(
+        self, exchange: IAsyncExchangeClient, clock: Callable[[], float] = time.time
+    ):
+        super().__init__(clock)
         self.exchange = exchange
 
-    def fetch(self, symbol: str, interval: str, window: int) -> Iterable[Candle]:
-        return self.exchange.get_candles(symbol, interval, limit=window)
+    async def fetch(self, symbol: str, interval: str, window: int) -> CandleFrame:
+        ring, limit = self._plan(symbol, interval, window)
+        candles = await self.exchange.get_candles(symbol, interval, limit=limit)
+        return self._ingest(ring, candles, window)
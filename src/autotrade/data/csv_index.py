@@ -0,0 +1,117 @@
+# src/autotrade/data/csv_index.py
+# ------------------------------------------------------------
+# 캔들 CSV 옆의 작은 사이드카 인덱스 (<csv>.idx.json)
+# - 행 수 / 첫·마지막 ts / 누락 슬롯 수 / 오름차순 여부 + 기록 시점의 파일 크기·mtime
+# - 이어쓰기 중복 제거와 갭 검사를 "새 행 수"에 비례하는 비용으로 처리
+# - 인덱스가 없거나 파일과 맞지 않으면(다른 도구가 수정 등) 1회 전체 스캔으로 재생성
+# ------------------------------------------------------------
+from __future__ import annotations
+from dataclasses import asdict, dataclass
+from pathlib import Path
+import json
+import logging
+import os
+from typing import List, Sequence, Tuple
+
+from autotrade.data.csv_loader import iter_candle_chunks
+
+log = logging.getLogger("download")
+
+VERSION = 2  # 2: ascending 추가
+
+
+@dataclass
+class CsvIndex:
+    step: int  # 봉 간격(초)
+    count: int = 0
+    first_ts: int | None = None
+    last_ts: int | None = None
+    missing: int = 0  # first_ts~last_ts 사이 누락 슬롯 수 (step 기준)
+    ascending: bool = True  # 파일 전체가 ts 오름차순(같은 ts 허용)인지
+    size: int = 0
+    mtime_ns: int = 0
+
+    def gaps(self, ts_list: Sequence[int]) -> List[Tuple[int, int]]:
+        """last_ts 뒤에 ts_list(오름차순)를 붙일 때 생기는 (이전 ts, 다음 ts) 갭"""
+        out: List[Tuple[int, int]] = []
+        prev = self.last_ts
+        for ts in ts_list:
+            if prev is not None and ts - prev > self.step:
+                out.append((prev, ts))
+            prev = ts
+        return out
+
+    def observe(self, ts_list: Sequence[int]) -> None:
+        """오름차순 ts를 파일 끝에 추가한 것으로 반영"""
+        for a, b in self.gaps(ts_list):
+            self.missing += (b - a) // self.step - 1
+        for ts in ts_list:
+            if self.first_ts is None:
+                self.first_ts = ts
+            elif self.last_ts is not None and ts < self.last_ts:
+                self.ascending = False
+            self.last_ts = ts
+            self.count += 1
+
+
+def index_path(csv_path: Path) -> Path:
+    return csv_path.with_name(csv_path.name + ".idx.json")
+
+
+def _stamp(csv_path: Path) -> Tuple[int, int]:
+    st = csv_path.stat()
+    return st.st_size, st.st_mtime_ns
+
+
+def rebuild_index(csv_path: Path, step: int) -> CsvIndex:
+    """CSV 전체를 1회 스캔해 인덱스 재생성 (파일 순서 기준)"""
+    idx = CsvIndex(step=step)
+    for chunk in iter_candle_chunks(str(csv_path)):
+        idx.observe(chunk.ts.tolist())
+    return idx
+
+
+def load_index(csv_path: Path, step: int) -> CsvIndex:
+    """사이드카 인덱스를 읽고, 없거나 오래됐으면(크기/mtime/간격 불일치) 재생성"""
+    if not csv_path.exists():
+        return CsvIndex(step=step)
+    p = index_path(csv_path)
+    size, mtime_ns = _stamp(csv_path)
+    if p.exists():
+        try:
+            raw = json.loads(p.read_text(encoding="utf-8"))
+            if raw.pop("version", None) == VERSION:
+                idx = CsvIndex(**raw)
+                if (idx.size, idx.mtime_ns, idx.step) == (size, mtime_ns, step):
+                    return idx
+        except (ValueError, TypeError):
+            pass
+    log.info("rebuilding stale/missing index for %s", csv_path)
+    idx = rebuild_index(csv_path, step)
+    idx.size, idx.mtime_ns = size, mtime_ns
+    return idx
+
+
+def known_ascending(csv_path: Path) -> bool:
+    """최신 사이드카 인덱스가 있고 파일 전체가 오름차순이라고 기록돼 있으면 True (재생성하지 않음)"""
+    p = index_path(csv_path)
+    try:
+        raw = json.loads(p.read_text(encoding="utf-8"))
+        size, mtime_ns = _stamp(csv_path)
+    except (OSError, ValueError):
+        return False
+    return (
+        isinstance(raw, dict)
+        and raw.get("version") == VERSION
+        and (raw.get("size"), raw.get("mtime_ns")) == (size, mtime_ns)
+        and raw.get("ascending") is True
+    )
+
+
+def save_index(csv_path: Path, idx: CsvIndex) -> None:
+    """CSV를 다 쓴 뒤 호출: 현재 크기/mtime을 찍어 원자적으로 저장"""
+    idx.size, idx.mtime_ns = _stamp(csv_path)
+    p = index_path(csv_path)
+    tmp = p.with_name(p.name + ".tmp")
+    tmp.write_text(json.dumps({"version": VERSION, **asdict(idx)}), encoding="utf-8")
+    os.replace(tmp, p)
@@ -1,11 +1,38 @@
 # src/autotrade/data/csv_loader.py
+# ------------------------------------------------------------
+# 캔들 CSV 로더
+# - 헤더에서 열 위치를 한 번 찾고 csv.reader로 위치 기반 파싱
+# - CandleFrame 청크 단위 스트리밍 (전체 적재 없이 처리 가능)
+# - start_ts/end_ts/limit 필터: 구간 밖 행은 ts만 읽고 건너뜀
+#   end_ts를 넘는 행에서 읽기를 멈추는 건 파일이 오름차순으로 알려진 경우만
+#   (assume_sorted=True 또는 최신 사이드카 인덱스가 오름차순이라고 기록)
+# - 정렬 여부는 같은 패스에서 확인 → 이미 오름차순이면 sort 생략
+# - 깨진 행은 세어서 경고 로그로 보고
+# ------------------------------------------------------------
 from __future__ import annotations
+from array import array
+from dataclasses import dataclass
 from pathlib import Path
 import csv
-from typing import Iterable, List
-from autotrade.models.market import Candle
+import logging
+from typing import Iterator, List
+from autotrade.models.market import Candle, CandleFrame
+
+log = logging.getLogger("data")
 
 REQUIRED = ["ts", "o", "hi", "lo", "c", "v"]
+CHUNK_SIZE = 65_536
+
+
+@dataclass
+class CsvLoadStats:
+    """로드 결과 요약 (stats 인자로 넘기면 채워짐)"""
+
+    rows: int = 0  # 읽은 데이터 행 (빈 줄 제외)
+    kept: int = 0  # 필터를 통과해 돌려준 행
+    malformed: int = 0  # 파싱 실패로 건너뛴 행
+    first_bad_line: int | None = None
+    ascending: bool = True  # 돌려준 행이 ts 오름차순(같은 ts 허용)인지
 
 
 def _resolve(path: str) -> Path:
@@ -15,36 +42,145 @@ def _resolve(path: str) -> Path:
     return p
 
 
-def load_candles_csv(path: str) -> Iterable[Candle]:
+def _new_columns() -> List[array]:
+    return [array("q")] + [array("d") for _ in range(5)]
+
+
+def _frame(cols: List[array]) -> CandleFrame:
+    return CandleFrame(*(memoryview(col) for col in cols))
+
+
+def _index_says_sorted(p: Path) -> bool:
+    # csv_index가 이 모듈을 import하므로 여기서는 호출 시점에 import
+    from autotrade.data.csv_index import known_ascending
+
+    return known_ascending(p)
+
+
+def iter_candle_chunks(
+    path: str,
+    start_ts: int | None = None,
+    end_ts: int | None = None,
+    limit: int | None = None,
+    chunk_size: int = CHUNK_SIZE,
+    stats: CsvLoadStats | None = None,
+    assume_sorted: bool = False,
+) -> Iterator[CandleFrame]:
+    """
+    CSV를 파일 순서대로 읽어 최대 chunk_size행짜리 CandleFrame을 생성 (정렬 없음).
+    - start_ts <= ts <= end_ts 인 행만, 최대 limit개
+    - 파일이 오름차순으로 알려져 있으면 end_ts를 넘는 첫 행에서 읽기를 멈춤
+      (모르면 끝까지 읽음: 정렬 안 된 파일에서 뒤쪽 행을 놓치지 않도록)
+    """
     p = _resolve(path)
     if not p.exists():
         raise FileNotFoundError(f"CSV not found: {p}")
+    st = stats if stats is not None else CsvLoadStats()
+    stop_after_end = end_ts is not None and (assume_sorted or _index_says_sorted(p))
 
-    with p.open("r", encoding="utf-8-sig") as f:  # BOM 대응
-        r = csv.DictReader(f)
-        if r.fieldnames is None:
+    def bad(line: int) -> None:
+        st.malformed += 1
+        if st.first_bad_line is None:
+            st.first_bad_line = line
+
+    with p.open("r", encoding="utf-8-sig", newline="") as f:  # BOM 대응
+        r = csv.reader(f)
+        header = next(r, None)
+        if header is None:
             raise ValueError(f"CSV has no header: {p}")
-        missing = [k for k in REQUIRED if k not in r.fieldnames]
+        header = [h.strip() for h in header]
+        missing = [k for k in REQUIRED if k not in header]
         if missing:
             raise ValueError(f"CSV header missing {missing}; expected {REQUIRED}")
+        i_ts, i_o, i_hi, i_lo, i_c, i_v = (header.index(k) for k in REQUIRED)
 
-        out: List[Candle] = []
+        cols = _new_columns()
+        ts_col, o_col, hi_col, lo_col, c_col, v_col = cols
+        prev: int | None = None
         for row in r:
+            if not row:
+                continue
+            st.rows += 1
+            try:
+                ts = int(row[i_ts])
+            except (ValueError, IndexError):
+                bad(r.line_num)
+                continue
+            if start_ts is not None and ts < start_ts:
+                continue
+            if end_ts is not None and ts > end_ts:
+                if stop_after_end:
+                    break
+                continue
             try:
-                out.append(
-                    Candle(
-                        ts=int(row["ts"]),
-                        o=float(row["o"]),
-                        hi=float(row["hi"]),
-                        lo=float(row["lo"]),
-                        c=float(row["c"]),
-                        v=float(row["v"]),
-                    )
-                )
-            except Exception:
-                # 행 단위 스킵(로그는 최소화)
+                o = float(row[i_o])
+                hi = float(row[i_hi])
+                lo = float(row[i_lo])
+                c = float(row[i_c])
+                v = float(row[i_v])
+            except (ValueError, IndexError):
+                bad(r.line_num)
                 continue
+            if prev is not None and ts < prev:
+                st.ascending = False
+            prev = ts
+            ts_col.append(ts)
+            o_col.append(o)
+            hi_col.append(hi)
+            lo_col.append(lo)
+            c_col.append(c)
+            v_col.append(v)
+            st.kept += 1
+            if len(ts_col) >= chunk_size:
+                yield _frame(cols)
+                cols = _new_columns()
+                ts_col, o_col, hi_col, lo_col, c_col, v_col = cols
+            if limit is not None and st.kept >= limit:
+                break
+        if len(ts_col):
+            yield _frame(cols)
+
+    if st.malformed:
+        log.warning(
+            "%s: skipped %d malformed rows of %d (first at line %s)",
+            p,
+            st.malformed,
+            st.rows,
+            st.first_bad_line,
+        )
+
+
+def iter_candles_csv(
+    path: str,
+    start_ts: int | None = None,
+    end_ts: int | None = None,
+    limit: int | None = None,
+    assume_sorted: bool = False,
+) -> Iterator[Candle]:
+    """
+    파일 순서대로 캔들을 1개씩 생성 (정렬/전체 적재 없음).
+    ts 오름차순으로 저장된 파일(다운로더 출력)을 전제로 합니다.
+    """
+    for chunk in iter_candle_chunks(path, start_ts, end_ts, limit, assume_sorted=assume_sorted):
+        yield from chunk
+
 
-    # 시간 오름차순 보장
-    out.sort(key=lambda c: c.ts)
-    return out
+def load_candles_csv(
+    path: str,
+    start_ts: int | None = None,
+    end_ts: int | None = None,
+    limit: int | None = None,
+    stats: CsvLoadStats | None = None,
+    assume_sorted: bool = False,
+) -> CandleFrame:
+    """CSV를 열 지향 CandleFrame으로 적재 (ts 오름차순 보장, 이미 정렬돼 있으면 sort 생략)"""
+    st = stats if stats is not None else CsvLoadStats()
+    cols = _new_columns()
+    chunks = iter_candle_chunks(path, start_ts, end_ts, limit, stats=st, assume_sorted=assume_sorted)
+    for chunk in chunks:
+        for col, name in zip(cols, REQUIRED):
+            col.frombytes(getattr(chunk, name).cast("B"))
+    if not st.ascending:
+        order = sorted(range(len(cols[0])), key=cols[0].__getitem__)
+        cols = [array(col.typecode, (col[i] for i in order)) for col in cols]
+    return _frame(cols)
@@ -2,9 +2,17 @@
 from __future__ import annotations
 from pathlib import Path
 import csv
-from typing import Iterable, Literal
-from autotrade.models.market import Candle
+import json
+import logging
+import os
+import time
+from typing import Any, Dict, Iterable, Literal
+from autotrade.models.market import INTERVAL_MINUTES, Candle
 from autotrade.exchanges.base import IExchangeClient
+from autotrade.data.csv_loader import load_candles_csv
+from autotrade.data.csv_index import CsvIndex, load_index, save_index
+
+log = logging.getLogger("download")
 
 HEADER = ["ts", "o", "hi", "lo", "c", "v"]
 
@@ -13,26 +21,21 @@ def _ensure_parent(path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
 
 
-def _dedup(
-    existing_ts: set[int], rows: list[tuple[int, float, float, float, float, float]]
-):
-    return [r for r in rows if r[0] not in existing_ts]
-
-
-def _read_existing_ts(path: Path) -> set[int]:
-    if not path.exists():
-        return set()
-    out: set[int] = set()
-    with path.open("r", encoding="utf-8") as f:
-        reader = csv.reader(f)
-        next(reader, None)
-        for row in reader:
-            # ts가 첫 컬럼
-            try:
-                out.add(int(row[0]))
-            except Exception:
-                continue
-    return out
+def _step_seconds(interval: str) -> int:
+    return INTERVAL_MINUTES.get(interval, 1) * 60
+
+
+def _warn_gaps(path: Path, idx: CsvIndex, ts_list: list[int]) -> None:
+    gaps = idx.gaps(ts_list)
+    if gaps:
+        missing = sum((b - a) // idx.step - 1 for a, b in gaps)
+        log.warning(
+            "%s: %d gap(s), %d missing bar(s); first after ts=%d",
+            path,
+            len(gaps),
+            missing,
+            gaps[0][0],
+        )
 
 
 def candles_to_rows(
@@ -61,29 +64,168 @@ def download_candles(
     최신 캔들(최대 200개)을 CSV로 저장하는 MVP 다운로더.
     - mode="w": 파일 새로 생성(헤더 포함)
     - mode="a": 이어쓰기(헤더는 파일 없으면 작성)
-    - dedup=True: 같은 ts 중복 제거(append 시 유용)
+    - dedup=True: 이미 저장된 마지막 ts 이하 행은 건너뜀(append 시 유용)
+    중복 제거/갭 검사는 사이드카 인덱스(<out>.idx.json)로 새 행 수에 비례하는 비용만 듭니다.
+    (인덱스가 파일이 오름차순이 아니라고 기록하면 저장된 ts 전체를 읽어 중복만 건너뜀)
     """
     candles = list(exchange.get_candles(symbol, interval, limit))
     rows = candles_to_rows(candles)
 
     path = Path(out_path)
     _ensure_parent(path)
+    step = _step_seconds(interval)
 
     if mode == "w":
+        idx = CsvIndex(step=step)
         with path.open("w", newline="", encoding="utf-8") as f:
             w = csv.writer(f)
             w.writerow(HEADER)
             for r in rows:
                 w.writerow(r)
     else:
-        existing = _read_existing_ts(path) if dedup else set()
-        rows2 = _dedup(existing, rows) if dedup else rows
+        idx = load_index(path, step)
+        last = idx.last_ts
+        if not dedup:
+            rows2 = rows
+        elif idx.ascending:
+            rows2 = [r for r in rows if last is None or r[0] > last]
+        else:
+            # 파일이 오름차순이 아니면 마지막 행 ts가 최대가 아님 → 저장된 ts 전체와 비교
+            stored = set(load_candles_csv(str(path)).ts.tolist())
+            rows2 = [r for r in rows if r[0] not in stored]
+        if len(rows2) < len(rows):
+            log.info("%s: skipped %d already-stored rows", path, len(rows) - len(rows2))
+        rows = rows2
         write_header = not path.exists()
         with path.open("a", newline="", encoding="utf-8") as f:
             w = csv.writer(f)
             if write_header:
                 w.writerow(HEADER)
-            for r in rows2:
+            for r in rows:
                 w.writerow(r)
 
+    ts_list = [r[0] for r in rows]
+    _warn_gaps(path, idx, ts_list)
+    idx.observe(ts_list)
+    save_index(path, idx)
     return str(path)
+
+
+# ------------------------------------------------------------
+# 과거 구간 백필 (페이지 단위, 중단 후 재개)
+# - to 파라미터로 최신 → 과거 방향 페이지 이동
+# - 페이지마다 <out>.part에 바로 이어쓰고 체크포인트(<out>.backfill.json) 갱신
+# - 같은 인자로 다시 실행하면 체크포인트의 next_to부터 이어서 받음
+# - 끝나면 part(+기존 out)를 ts 오름차순/중복 제거로 out에 기록
+# ------------------------------------------------------------
+def _save_checkpoint(path: Path, state: Dict[str, Any]) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(state), encoding="utf-8")
+    os.replace(tmp, path)  # 원자적 교체 (중간에 끊겨도 이전 체크포인트 유지)
+
+
+def _finalize(part: Path, out: Path, step: int) -> int:
+    frames = [load_candles_csv(str(part))]
+    if out.exists():
+        frames.append(load_candles_csv(str(out)))
+    rows = sorted(
+        (r for f in frames for r in zip(f.ts, f.o, f.hi, f.lo, f.c, f.v)),
+        key=lambda r: r[0],
+    )
+    tmp = out.with_name(out.name + ".tmp")
+    kept: list[int] = []
+    with tmp.open("w", newline="", encoding="utf-8") as f:
+        w = csv.writer(f)
+        w.writerow(HEADER)
+        for r in rows:
+            if kept and r[0] == kept[-1]:
+                continue
+            kept.append(r[0])
+            w.writerow(r)
+    os.replace(tmp, out)
+    idx = CsvIndex(step=step)
+    _warn_gaps(out, idx, kept)
+    idx.observe(kept)
+    save_index(out, idx)
+    return len(kept)
+
+
+def backfill_candles(
+    exchange: IExchangeClient,
+    symbol: str,
+    interval: str = "1m",
+    start_ts: int = 0,
+    end_ts: int | None = None,
+    out_path: str = "data/out.csv",
+    page_size: int = 200,
+    sleep_s: float = 0.1,
+) -> str:
+    """
+    [start_ts, end_ts) 구간을 최신 페이지부터 과거로 내려가며 수집해 out_path에 저장.
+    - end_ts=None이면 현재 시각부터
+    - 중단되면 같은 인자로 다시 호출해 이어서 받음 (인자가 다르면 처음부터)
+    - sleep_s: 페이지 사이 대기 (Upbit 시세 API 초당 요청 제한 대응)
+    반환: out_path
+    """
+    out = Path(out_path)
+    _ensure_parent(out)
+    part = out.with_name(out.name + ".part")
+    ckpt = out.with_name(out.name + ".backfill.json")
+
+    job: Dict[str, Any] = {
+        "symbol": symbol,
+        "interval": interval,
+        "start_ts": start_ts,
+        "end_ts": end_ts,
+    }
+    state: Dict[str, Any] = {**job, "next_to": end_ts, "part_bytes": 0, "pages": 0, "rows": 0}
+    if ckpt.exists() and part.exists():
+        saved = json.loads(ckpt.read_text(encoding="utf-8"))
+        if all(saved.get(k) == v for k, v in job.items()):
+            state = saved
+            log.info(
+                "backfill %s: resuming at to=%s (%d rows so far)",
+                symbol,
+                state["next_to"],
+                state["rows"],
+            )
+    if state["pages"] == 0:
+        part.write_text(",".join(HEADER) + "\n", encoding="utf-8")
+        state["part_bytes"] = part.stat().st_size
+
+    with part.open("r+", newline="", encoding="utf-8") as f:
+        # 체크포인트 이후에 쓰다 끊긴 꼬리는 잘라냄
+        f.truncate(state["part_bytes"])
+        f.seek(state["part_bytes"])
+        w = csv.writer(f)
+        to = state["next_to"]
+        done = to is not None and to <= start_ts
+        while not done:
+            page = candles_to_rows(exchange.get_candles(symbol, interval, page_size, to=to))
+            if not page:
+                break
+            oldest = page[0][0]
+            if to is not None and oldest >= to:
+                log.warning("backfill %s: exchange ignored to=%s; stopping", symbol, to)
+                break
+            kept = [r for r in page if r[0] >= start_ts]
+            w.writerows(kept)
+            f.flush()
+            os.fsync(f.fileno())
+            to = oldest
+            done = oldest <= start_ts
+            state.update(
+                next_to=to,
+                part_bytes=f.tell(),
+                pages=state["pages"] + 1,
+                rows=state["rows"] + len(kept),
+            )
+            _save_checkpoint(ckpt, state)
+            if not done and sleep_s > 0:
+                time.sleep(sleep_s)
+
+    n = _finalize(part, out, _step_seconds(interval))
+    part.unlink()
+    ckpt.unlink(missing_ok=True)
+    log.info("backfill %s: %d pages, %d rows → %s", symbol, state["pages"], n, out)
+    return str(out)
@@ -0,0 +1,115 @@
+# src/autotrade/data/resample.py
+# ------------------------------------------------------------
+# 캔들 리샘플러 (예: 1m → 3m/5m/15m/60m/240m/1d), 스트리밍 1패스
+# - 봉 ts = 구간 시작 시각 (UTC 기준 정렬, 1d는 UTC 자정 = KST 09:00)
+# - OHLCV: o=첫 봉 o, hi=max, lo=min, c=마지막 봉 c, v=합
+# - 같은 ts가 다시 오면(실시간 진행 중 봉 갱신) 덮어씀
+# - 가장자리 부분 봉: 구간 중간에서 시작한 첫 봉 / flush 시 미완성 마지막 봉
+#   partial="drop"(기본)이면 버리고, "keep"이면 그대로 내보냄
+# - 입력: CSV 로더 이터레이터, CandleFrame, 실시간 스트림 (Candle 순회만 필요)
+# ------------------------------------------------------------
+from __future__ import annotations
+from typing import Dict, Iterable, Iterator, List, Literal
+
+from autotrade.models.market import Candle, CandleFrame, interval_seconds
+
+Partial = Literal["drop", "keep"]
+
+
+class Resampler:
+    """
+    작은 간격 캔들을 1개씩 받아 완성된 큰 간격 봉을 돌려줌 (캔들당 O(1), 상각).
+    - update(c): 이번 캔들로 닫힌 봉 목록 (보통 0개 또는 1개)
+    - peek(): 진행 중인 봉 (실시간 표시용)
+    - flush(): 스트림 끝에서 남은 봉 처리
+    이미 닫힌 구간에 늦게 도착한 캔들은 버리고 late로 셉니다.
+    """
+
+    def __init__(self, interval: str, source: str = "1m", partial: Partial = "drop"):
+        self.step = interval_seconds(interval)
+        self.src_step = interval_seconds(source)
+        if self.step % self.src_step or self.step < self.src_step:
+            raise ValueError(f"cannot resample {source} into {interval}")
+        if partial not in ("drop", "keep"):
+            raise ValueError(f"partial must be 'drop' or 'keep', got {partial!r}")
+        self.partial = partial
+        self.late = 0
+        self._bucket: int | None = None
+        self._parts: Dict[int, Candle] = {}
+        self._ordered = True
+        self._started = False
+        self._leading = False  # 현재 봉이 구간 중간에서 시작한 첫 봉인지
+
+    def _bar(self) -> Candle:
+        parts = list(self._parts.values())
+        if not self._ordered:
+            parts.sort(key=lambda c: c.ts)
+        assert self._bucket is not None
+        return Candle(
+            ts=self._bucket,
+            o=parts[0].o,
+            hi=max(c.hi for c in parts),
+            lo=min(c.lo for c in parts),
+            c=parts[-1].c,
+            v=sum(c.v for c in parts),
+        )
+
+    def _close(self, complete: bool) -> List[Candle]:
+        if self._bucket is None:
+            return []
+        bar = self._bar()
+        self._bucket = None
+        self._parts = {}
+        self._ordered = True
+        if not complete and self.partial == "drop":
+            return []
+        return [bar]
+
+    def update(self, c: Candle) -> List[Candle]:
+        bucket = c.ts - c.ts % self.step
+        out: List[Candle] = []
+        if self._bucket is not None and bucket < self._bucket:
+            self.late += 1
+            return out
+        if bucket != self._bucket:
+            out = self._close(complete=not self._leading)
+            self._leading = not self._started and c.ts != bucket
+            self._started = True
+            self._bucket = bucket
+        elif c.ts not in self._parts and c.ts < next(reversed(self._parts)):
+            self._ordered = False  # 구간 안에서 순서가 뒤바뀐 캔들 → 봉 계산 시 정렬
+        self._parts[c.ts] = c
+        return out
+
+    def peek(self) -> Candle | None:
+        return self._bar() if self._bucket is not None else None
+
+    def flush(self) -> List[Candle]:
+        """남은 봉 내보내기: 구간 끝 캔들까지 왔으면 완성 봉, 아니면 부분 봉"""
+        if self._bucket is None:
+            return []
+        last = max(self._parts)
+        complete = not self._leading and last >= self._bucket + self.step - self.src_step
+        return self._close(complete)
+
+
+def resample(
+    candles: Iterable[Candle],
+    interval: str,
+    source: str = "1m",
+    partial: Partial = "drop",
+) -> Iterator[Candle]:
+    """캔들 스트림(ts 오름차순)을 interval 봉 스트림으로 (지연 평가)"""
+    r = Resampler(interval, source=source, partial=partial)
+    for c in candles:
+        yield from r.update(c)
+    yield from r.flush()
+
+
+def resample_frame(
+    candles: Iterable[Candle],
+    interval: str,
+    source: str = "1m",
+    partial: Partial = "drop",
+) -> CandleFrame:
+    return CandleFrame.from_candles(resample(candles, interval, source, partial))
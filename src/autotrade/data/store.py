@@ -0,0 +1,107 @@
+# src/autotrade/data/store.py
+# ------------------------------------------------------------
+# 바이너리 캔들 저장소 (열별 고정폭 파일 + mmap)
+# - <이름>.candles/ 디렉터리에 ts.i8 / o.f8 / hi.f8 / lo.f8 / c.f8 / v.f8 + meta.json
+# - open_store()는 파일을 mmap으로 열어 CandleFrame 뷰로 돌려줌
+#   → 파싱/복사 없음, 같은 파일을 여는 프로세스끼리 페이지 캐시 공유
+# - ts 구간 조회는 CandleFrame.between (이진 탐색)
+# ------------------------------------------------------------
+from __future__ import annotations
+from pathlib import Path
+import csv
+import json
+import mmap
+import sys
+from typing import Any, Iterable
+
+from autotrade.models.market import Candle, CandleFrame
+from autotrade.data.csv_loader import load_candles_csv
+
+SUFFIX = ".candles"
+VERSION = 1
+# (열 이름, array/memoryview 형식 코드, 파일 확장자)
+LAYOUT = [
+    ("ts", "q", "i8"),
+    ("o", "d", "f8"),
+    ("hi", "d", "f8"),
+    ("lo", "d", "f8"),
+    ("c", "d", "f8"),
+    ("v", "d", "f8"),
+]
+
+
+def is_store(path: str | Path) -> bool:
+    return Path(path).suffix == SUFFIX
+
+
+def write_store(path: str | Path, candles: Iterable[Candle]) -> Path:
+    """캔들(ts 오름차순)을 저장소로 기록. 기존 저장소는 덮어씀."""
+    frame = CandleFrame.from_candles(candles)
+    ts = frame.ts
+    if any(a > b for a, b in zip(ts, ts[1:])):
+        raise ValueError("candles must be sorted by ts to build a store")
+    p = Path(path)
+    p.mkdir(parents=True, exist_ok=True)
+    for name, _, ext in LAYOUT:
+        (p / f"{name}.{ext}").write_bytes(getattr(frame, name))
+    meta = {
+        "version": VERSION,
+        "count": len(frame),
+        "byteorder": sys.byteorder,
+        "columns": [f"{name}.{ext}" for name, _, ext in LAYOUT],
+    }
+    # 메타는 마지막에 기록 (중간에 끊기면 open_store가 count 불일치로 감지)
+    (p / "meta.json").write_text(json.dumps(meta), encoding="utf-8")
+    return p
+
+
+def _cast(buf: memoryview, fmt: str) -> memoryview[Any]:
+    return buf.cast("q") if fmt == "q" else buf.cast("d")
+
+
+def _map_column(path: Path, fmt: str, count: int) -> memoryview:
+    with path.open("rb") as f:
+        size = f.seek(0, 2)
+        if size != count * 8:
+            raise ValueError(f"{path}: expected {count * 8} bytes, got {size}")
+        if count == 0:
+            return _cast(memoryview(b""), fmt)
+        # mmap은 fd를 복제하므로 파일은 바로 닫아도 됨
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return _cast(memoryview(mm), fmt)
+
+
+def open_store(path: str | Path) -> CandleFrame:
+    """
+    저장소를 읽기 전용 mmap CandleFrame으로 엶 (O(1), 실제 읽기는 접근 시 페이지 단위).
+    뷰가 살아 있는 동안 매핑이 유지되고, 마지막 뷰가 사라지면 해제됩니다.
+    """
+    p = Path(path)
+    meta_path = p / "meta.json"
+    if not meta_path.exists():
+        raise FileNotFoundError(f"Candle store not found: {p}")
+    meta = json.loads(meta_path.read_text(encoding="utf-8"))
+    if meta.get("version") != VERSION:
+        raise ValueError(f"{p}: unsupported store version {meta.get('version')}")
+    if meta.get("byteorder") != sys.byteorder:
+        raise ValueError(f"{p}: store byte order {meta.get('byteorder')} != host")
+    n = int(meta["count"])
+    cols = [_map_column(p / f"{name}.{ext}", fmt, n) for name, fmt, ext in LAYOUT]
+    return CandleFrame(*cols)
+
+
+def csv_to_store(csv_path: str, store_path: str | Path) -> Path:
+    """CSV → 저장소 (1회 변환; 이후 백테스트는 open_store로 즉시 시작)"""
+    return write_store(store_path, load_candles_csv(csv_path))
+
+
+def store_to_csv(store_path: str | Path, csv_path: str | Path) -> Path:
+    """저장소 → CSV (다운로더와 같은 ts,o,hi,lo,c,v 헤더)"""
+    frame = open_store(store_path)
+    out = Path(csv_path)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    with out.open("w", newline="", encoding="utf-8") as f:
+        w = csv.writer(f)
+        w.writerow([name for name, _, _ in LAYOUT])
+        w.writerows(zip(frame.ts, frame.o, frame.hi, frame.lo, frame.c, frame.v))
+    return out
@@ -1,3 +1,4 @@
+from __future__ import annotations
 from typing import Protocol, Iterable
 from autotrade.models.market import Ticker, Candle
 from autotrade.models.order import OrderRequest, Order
@@ -8,6 +9,21 @@ class IExchangeClient(Protocol):
 
     def get_ticker(self, symbol: str) -> Ticker: ...
     def get_candles(
-        self, symbol: str, interval: str, limit: int = 500
-    ) -> Iterable[Candle]: ...
+        self, symbol: str, interval: str, limit: int = 500, to: int | None = None
+    ) -> Iterable[Candle]:
+        """ts 오름차순 캔들. to(epoch 초)를 주면 그 시각 '이전'(미포함) 캔들만."""
+        ...
     def create_order(self, req: OrderRequest) -> Order: ...
+
+
+class IAsyncExchangeClient(Protocol):
+    """IExchangeClient의 asyncio 버전 (여러 심볼을 asyncio.gather로 동시에 조회)"""
+
+    name: str
+
+    async def get_ticker(self, symbol: str) -> Ticker: ...
+    async def get_candles(
+        self, symbol: str, interval: str, limit: int = 500, to: int | None = None
+    ) -> Iterable[Candle]: ...
+    async def create_order(self, req: OrderRequest) -> Order: ...
+    async def aclose(self) -> None: ...
@@ -1,8 +1,7 @@
 import random
 import time
-from typing import Iterable, List
 from autotrade.exchanges.base import IExchangeClient
-from autotrade.models.market import Ticker, Candle
+from autotrade.models.market import Ticker, CandleFrame
 from autotrade.models.order import OrderRequest, Order
 
 
@@ -22,10 +21,11 @@ class FakeExchange(IExchangeClient):
         return Ticker(symbol, self._step())
 
     def get_candles(
-        self, symbol: str, interval: str, limit: int = 60
-    ) -> Iterable[Candle]:
-        out: List[Candle] = []
-        ts = int(time.time()) - limit * 60
+        self, symbol: str, interval: str, limit: int = 60, to: int | None = None
+    ) -> CandleFrame:
+        rows = []
+        end = int(time.time()) if to is None else to - 60  # to는 미포함
+        ts = end - limit * 60
         p = self._p
         for _ in range(limit):
             p *= 1.0 + random.uniform(-0.002, 0.002)
@@ -35,8 +35,8 @@ class FakeExchange(IExchangeClient):
             o = (hi + lo) / 2
             v = random.uniform(1, 10)
             ts += 60
-            out.append(Candle(ts, o, hi, lo, c, v))
-        return out
+            rows.append((ts, o, hi, lo, c, v))
+        return CandleFrame.from_columns(*zip(*rows)) if rows else CandleFrame.empty()
 
     def create_order(self, req: OrderRequest) -> Order:
         self._order_seq += 1
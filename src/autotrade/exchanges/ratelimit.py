@@ -0,0 +1,149 @@
+# src/autotrade/exchanges/ratelimit.py
+# ------------------------------------------------------------
+# 클라이언트 측 요청 속도 제한 (Upbit 요청 그룹별 토큰 버킷)
+# - 그룹: quotation(시세) / order(주문) / exchange(주문 외 Private API)
+# - 토큰 limit개, 쓴 토큰은 period초 뒤에 돌아옴 → 어떤 period 구간에도 limit개 이하
+#   (Upbit의 초 단위 고정 구간 제한을 넘지 않음)
+# - acquire(): 다음 빈 시각을 미리 예약하고 그때까지 대기 (429를 받은 뒤 물러나는 대신 사전 배치)
+#   계산은 잠금 안에서, 대기는 잠금 밖에서 → 스레드와 asyncio 태스크가 같은 인스턴스를 공유 가능
+# - observe(): 응답의 Remaining-Req 헤더(group=...; min=...; sec=N)로 실제 한도를 학습
+#   서버 한도 L은 sec+1 이상, sec+(최근 period 안에 보낸 수) 이하 → 그 범위로 limit 조정
+# - penalize(): 429를 받으면 그 그룹을 period 동안 멈추고, 최근 보낸 수 미만으로 limit을 낮춤
+# ------------------------------------------------------------
+from __future__ import annotations
+import asyncio
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, Optional, Tuple
+
+# Upbit 기본 한도 (초당) — Remaining-Req 헤더를 보면 실제 값으로 조정됨
+DEFAULT_LIMITS = {"quotation": 10, "order": 8, "exchange": 30}
+
+
+def parse_remaining_req(header: Optional[str]) -> Optional[Tuple[str, int]]:
+    """'group=default; min=1800; sec=29' → ('default', 29). 형식이 다르면 None"""
+    if not header:
+        return None
+    fields: Dict[str, str] = {}
+    for part in header.split(";"):
+        k, _, v = part.strip().partition("=")
+        fields[k] = v
+    try:
+        return fields.get("group", ""), int(fields["sec"])
+    except (KeyError, ValueError):
+        return None
+
+
+@dataclass
+class BucketStats:
+    limit: int
+    requests: int = 0
+    waited: int = 0  # 대기가 필요했던 요청 수
+    wait_total: float = 0.0
+    wait_max: float = 0.0
+    throttled: int = 0  # 받은 429 수
+
+
+class _Bucket:
+    def __init__(self, limit: int, period: float):
+        self.period = period
+        self.stats = BucketStats(limit)
+        self.not_before = 0.0
+        self._slots: Deque[float] = deque()  # 예약된(보낸) 요청 시각, 오름차순
+
+    def reserve(self, now: float) -> float:
+        """보낼 시각을 예약하고 돌려줌"""
+        slots, limit = self._slots, self.stats.limit
+        while slots and slots[0] <= now - self.period:
+            slots.popleft()
+        t = max(now, self.not_before)
+        if slots:
+            t = max(t, slots[-1])
+        if len(slots) >= limit:
+            t = max(t, slots[-limit] + self.period)
+        slots.append(t)
+        st = self.stats
+        st.requests += 1
+        wait = t - now
+        if wait > 0:
+            st.waited += 1
+            st.wait_total += wait
+            st.wait_max = max(st.wait_max, wait)
+        return t
+
+    def _sent(self, now: float) -> int:
+        return sum(1 for t in self._slots if now - self.period < t <= now)
+
+    def observe(self, sec: int, now: float) -> None:
+        lo, hi = sec + 1, sec + max(self._sent(now), 1)
+        self.stats.limit = min(max(self.stats.limit, lo), hi)
+
+    def penalize(self, now: float) -> None:
+        # 최근 period 안에 보낸 수로도 거절됐으니 한도는 그보다 작음
+        self.stats.throttled += 1
+        self.stats.limit = max(1, min(self.stats.limit, self._sent(now) - 1))
+        self.not_before = max(self.not_before, now + self.period)
+
+
+class RateLimiter:
+    """
+    limiter.acquire("quotation")           # 동기 (time.sleep)
+    await limiter.acquire_async("order")   # asyncio
+    limiter.observe("quotation", r.headers.get("Remaining-Req"))
+    margin: 네트워크 지연 차이로 서버 쪽 구간이 겹치지 않게 period에 더하는 여유
+    """
+
+    def __init__(
+        self,
+        limits: Optional[Dict[str, int]] = None,
+        period: float = 1.0,
+        margin: float = 0.05,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._period = period + margin
+        self._buckets: Dict[str, _Bucket] = {
+            g: _Bucket(n, self._period) for g, n in {**DEFAULT_LIMITS, **(limits or {})}.items()
+        }
+
+    def _bucket(self, group: str) -> _Bucket:
+        b = self._buckets.get(group)
+        if b is None:
+            raise KeyError(f"unknown rate-limit group {group!r}; expected one of {list(self._buckets)}")
+        return b
+
+    def reserve(self, group: str) -> float:
+        """예약 후 대기해야 할 초 (대기는 호출자가)"""
+        with self._lock:
+            now = self.clock()
+            return max(0.0, self._bucket(group).reserve(now) - now)
+
+    def acquire(self, group: str) -> float:
+        wait = self.reserve(group)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, group: str) -> float:
+        wait = self.reserve(group)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def observe(self, group: str, header: Optional[str]) -> None:
+        parsed = parse_remaining_req(header)
+        if parsed is None:
+            return
+        with self._lock:
+            self._bucket(group).observe(parsed[1], self.clock())
+
+    def penalize(self, group: str) -> None:
+        with self._lock:
+            self._bucket(group).penalize(self.clock())
+
+    def stats(self) -> Dict[str, BucketStats]:
+        with self._lock:
+            return {g: BucketStats(**vars(b.stats)) for g, b in self._buckets.items()}
@@ -0,0 +1,191 @@
+# src/autotrade/exchanges/readcache.py
+# ------------------------------------------------------------
+# 거래소 읽기 요청용 read-through 캐시 (스레드 안전)
+# - 항목별 TTL: ttl=None이면 만료 없음 (닫힌 캔들처럼 바뀌지 않는 응답)
+# - 요청 합치기: 같은 키를 이미 누가 가져오는 중이면 새 요청 없이 그 결과를 기다림
+# - get_many: 없는 키들을 요청 1번으로 한꺼번에 채움 (예: /ticker?markets=A,B,C)
+# - max_entries를 넘으면 가장 오래 안 쓴 항목부터 퇴출
+# - AsyncReadCache: 같은 규칙의 asyncio 버전 (이벤트 루프 1개 안에서 요청 합치기)
+# ------------------------------------------------------------
+from __future__ import annotations
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+
+class _Entries:
+    """TTL + LRU 저장소와 카운터 (동기/비동기 캐시 공통)"""
+
+    def __init__(self, max_entries: int, clock: Callable[[], float]):
+        self.max_entries = max_entries
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0  # 실제로 로더를 호출한 키 수
+        self.coalesced = 0  # 진행 중인 요청을 기다려 받은 키 수
+        self._items: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict()  # 값, 만료 시각
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def _lookup(self, key: Hashable, now: float) -> Tuple[bool, Any]:
+        item = self._items.get(key)
+        if item is None:
+            return False, None
+        if item[1] <= now:
+            del self._items[key]
+            return False, None
+        self._items.move_to_end(key)
+        return True, item[0]
+
+    def _store(self, key: Hashable, value: Any, ttl: Optional[float]) -> None:
+        if ttl is not None and ttl <= 0:
+            return  # 합치기만 하고 저장하지 않음
+        expires = float("inf") if ttl is None else self.clock() + ttl
+        self._items[key] = (value, expires)
+        self._items.move_to_end(key)
+        while len(self._items) > self.max_entries:
+            self._items.popitem(last=False)
+
+
+class ReadCache(_Entries):
+    def __init__(self, max_entries: int = 1024, clock: Callable[[], float] = time.monotonic):
+        super().__init__(max_entries, clock)
+        self._lock = threading.Lock()
+        self._inflight: Dict[Hashable, Future[Any]] = {}
+
+    def get_many(
+        self,
+        keys: Sequence[Hashable],
+        ttl: Optional[float],
+        loader: Callable[[List[Hashable]], Dict[Hashable, Any]],
+    ) -> Dict[Hashable, Any]:
+        """
+        keys의 값 (캐시 → 진행 중 요청 → loader(없는 키 목록) 순).
+        loader는 받은 키마다 값을 돌려줘야 하며, 예외는 같은 키를 기다리던 호출자에게도 전달됩니다.
+        """
+        out: Dict[Hashable, Any] = {}
+        wait: Dict[Hashable, Future[Any]] = {}
+        mine: Dict[Hashable, Future[Any]] = {}
+        with self._lock:
+            now = self.clock()
+            for k in dict.fromkeys(keys):
+                found, value = self._lookup(k, now)
+                if found:
+                    self.hits += 1
+                    out[k] = value
+                elif k in self._inflight:
+                    self.coalesced += 1
+                    wait[k] = self._inflight[k]
+                else:
+                    self.misses += 1
+                    mine[k] = self._inflight[k] = Future()
+        if mine:
+            try:
+                loaded = loader(list(mine))
+                missing = [k for k in mine if k not in loaded]
+                if missing:
+                    raise KeyError(f"loader returned no value for {missing}")
+            except BaseException as e:
+                with self._lock:
+                    for k, f in mine.items():
+                        del self._inflight[k]
+                        f.set_exception(e)
+                raise
+            with self._lock:
+                for k, f in mine.items():
+                    self._store(k, loaded[k], ttl)
+                    del self._inflight[k]
+                    f.set_result(loaded[k])
+                    out[k] = loaded[k]
+        for k, f in wait.items():
+            out[k] = f.result()
+        return out
+
+    def get(self, key: Hashable, ttl: Optional[float], loader: Callable[[], Any]) -> Any:
+        return self.get_many([key], ttl, lambda ks: {ks[0]: loader()})[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+
+class AsyncReadCache(_Entries):
+    """
+    ReadCache의 asyncio 버전: loader는 코루틴 함수.
+    이벤트 루프 1개에서만 쓰므로 잠금 없이, 진행 중 요청은 asyncio.Future로 공유
+    """
+
+    def __init__(self, max_entries: int = 1024, clock: Callable[[], float] = time.monotonic):
+        super().__init__(max_entries, clock)
+        self._inflight: Dict[Hashable, asyncio.Future[Any]] = {}
+
+    async def get_many(
+        self,
+        keys: Sequence[Hashable],
+        ttl: Optional[float],
+        loader: Callable[[List[Hashable]], Awaitable[Dict[Hashable, Any]]],
+    ) -> Dict[Hashable, Any]:
+        out: Dict[Hashable, Any] = {}
+        wait: Dict[Hashable, asyncio.Future[Any]] = {}
+        mine: Dict[Hashable, asyncio.Future[Any]] = {}
+        now = self.clock()
+        loop = asyncio.get_running_loop()
+        for k in dict.fromkeys(keys):
+            found, value = self._lookup(k, now)
+            if found:
+                self.hits += 1
+                out[k] = value
+            elif k in self._inflight:
+                self.coalesced += 1
+                wait[k] = self._inflight[k]
+            else:
+                self.misses += 1
+                mine[k] = self._inflight[k] = loop.create_future()
+        if mine:
+            try:
+                loaded = await loader(list(mine))
+                missing = [k for k in mine if k not in loaded]
+                if missing:
+                    raise KeyError(f"loader returned no value for {missing}")
+            except BaseException as e:
+                for k, f in mine.items():
+                    del self._inflight[k]
+                    if isinstance(e, asyncio.CancelledError):
+                        f.cancel()
+                    else:
+                        f.set_exception(e)
+                        f.exception()  # 기다리는 쪽이 없어도 경고가 나지 않게 조회 처리
+                raise
+            for k, f in mine.items():
+                self._store(k, loaded[k], ttl)
+                del self._inflight[k]
+                f.set_result(loaded[k])
+                out[k] = loaded[k]
+        for k, f in wait.items():
+            # shield: 기다리던 호출자가 취소돼도 공유 Future는 취소되지 않음
+            out[k] = await asyncio.shield(f)
+        return out
+
+    async def get(
+        self, key: Hashable, ttl: Optional[float], loader: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        async def load(ks: List[Hashable]) -> Dict[Hashable, Any]:
+            return {ks[0]: await loader()}
+
+        return (await self.get_many([key], ttl, load))[key]
+
+    def clear(self) -> None:
+        self._items.clear()
@@ -1,17 +1,26 @@
 # src/autotrade/exchanges/upbit.py
 from __future__ import annotations
-from typing import Iterable, List, Dict, Any, Optional
+from typing import List, Dict, Any, Hashable, Optional, Sequence, Tuple, cast
 from dataclasses import dataclass
+import calendar
 import time
 import hashlib
 import uuid
 import logging
-from urllib.parse import urlencode
+from urllib.parse import unquote, urlencode
 import requests
 import jwt  # PyJWT
 
 from autotrade.exchanges.base import IExchangeClient
-from autotrade.models.market import Ticker, Candle
+from autotrade.exchanges.ratelimit import RateLimiter
+from autotrade.exchanges.readcache import ReadCache
+from autotrade.models.market import (
+    INTERVAL_MINUTES,
+    Ticker,
+    Candle,
+    CandleFrame,
+    interval_seconds,
+)
 from autotrade.models.order import OrderRequest, Order
 
 log = logging.getLogger("upbit")
@@ -25,6 +34,117 @@ class UpbitCreds:
     secret_key: str
 
 
+# --- 동기/비동기 클라이언트 공용 헬퍼 (upbit_async.py도 사용) ---
+def jwt_headers(creds: UpbitCreds, query: Dict[str, Any]) -> Dict[str, str]:
+    # 업비트는 query_string(SHA512) 해시를 JWT payload에 포함
+    # 배열 파라미터(uuids[] 등)는 키를 반복하고, 해시는 디코딩된 문자열 기준
+    query_string = unquote(urlencode(query, doseq=True)) if query else ""
+    query_hash = (
+        hashlib.sha512(query_string.encode()).hexdigest() if query_string else None
+    )
+
+    payload = {
+        "access_key": creds.access_key,
+        "nonce": str(uuid.uuid4()),
+    }
+    if query_hash:
+        payload["query_hash"] = query_hash
+        payload["query_hash_alg"] = "SHA512"
+
+    # HS256 서명
+    token = jwt.encode(payload, creds.secret_key, algorithm="HS256")
+    return {"Authorization": f"Bearer {token}"}
+
+
+def candles_request(
+    symbol: str, interval: str, limit: int, to: int | None
+) -> Tuple[str, Dict[str, str]]:
+    """캔들 조회 경로와 쿼리 파라미터"""
+    # 일봉은 /candles/days, 그 외는 /candles/minutes/{분}
+    if interval == "1d":
+        path = "candles/days"
+    else:
+        path = f"candles/minutes/{INTERVAL_MINUTES.get(interval, 1)}"
+    params = {"market": symbol, "count": str(min(limit, 200))}
+    if to is not None:
+        params["to"] = time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(to))
+    return path, params
+
+
+def parse_candles(rows: List[Dict[str, Any]]) -> CandleFrame:
+    """캔들 응답(최신순) → ts 오름차순 CandleFrame"""
+    out: List[Candle] = []
+    for row in reversed(rows):  # 과거→현재
+        # candle_date_time_utc: "YYYY-MM-DDTHH:MM:SS" (UTC → timegm, 로컬 타임존 무관)
+        ts = calendar.timegm(
+            time.strptime(row["candle_date_time_utc"][:19], "%Y-%m-%dT%H:%M:%S")
+        )
+        out.append(
+            Candle(
+                ts=ts,
+                o=float(row["opening_price"]),
+                hi=float(row["high_price"]),
+                lo=float(row["low_price"]),
+                c=float(row["trade_price"]),
+                v=float(row["candle_acc_trade_volume"]),
+            )
+        )
+    return CandleFrame.from_candles(out)
+
+
+def parse_order_fill(row: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    주문 조회 응답 1건 → {state, filled_qty, price(체결 VWAP), fee}.
+    VWAP = 체결 금액 / 체결 수량 (executed_funds, 없으면 trades[].funds 합).
+    체결이 없으면 price는 None.
+    """
+    vol = float(row.get("executed_volume") or 0.0)
+    funds = row.get("executed_funds")
+    if funds is None and row.get("trades"):
+        funds = sum(float(t["funds"]) for t in row["trades"])
+    price = float(funds) / vol if funds is not None and vol > 0 else None
+    return {
+        "state": row.get("state"),
+        "filled_qty": vol,
+        "price": price,
+        "fee": float(row.get("paid_fee") or 0.0),
+    }
+
+
+def candles_cache_ttl(interval: str, to: int | None, ttl: float) -> Optional[float]:
+    """캔들 응답의 캐시 TTL: to가 현재 봉 시작 이전이면 모두 닫힌 봉 → None(만료 없음)"""
+    if to is not None:
+        step = interval_seconds(interval)
+        now = int(time.time())
+        if to <= now - now % step:
+            return None
+    return ttl
+
+
+def order_query(market: str, req: OrderRequest) -> Dict[str, Any]:
+    """
+    시장가 주문 파라미터:
+      - 매수: ord_type=price, price=투입 금액 (req.qty를 '금액'으로 해석)
+      - 매도: ord_type=market, volume=수량
+    """
+    side = req.side.lower()
+    if side == "buy":
+        return {
+            "market": market,
+            "side": "bid",  # bid=매수
+            "ord_type": "price",  # 금액 지정 시장가
+            "price": f"{req.qty:.8f}",  # qty를 '금액'으로 해석
+        }
+    if side == "sell":
+        return {
+            "market": market,
+            "side": "ask",  # ask=매도
+            "ord_type": "market",  # 수량 지정 시장가
+            "volume": f"{req.qty:.8f}",
+        }
+    raise ValueError(f"Unsupported side: {req.side}")
+
+
 class UpbitClient(IExchangeClient):
     """Upbit Public + (안전 장치 포함) Private 주문"""
 
@@ -37,12 +157,23 @@ class UpbitClient(IExchangeClient):
         live: bool = False,
         timeout: int = 10,
         session: Optional[requests.Session] = None,
+        limiter: Optional[RateLimiter] = None,
+        cache: Optional[ReadCache] = None,
+        ticker_ttl: float = 0.25,
+        candle_ttl: float = 0.0,
     ):
         self.base = base_url.rstrip("/")
         self.creds = creds
         self.live = live
         self.timeout = timeout
         self.s = session or requests.Session()
+        # 여러 클라이언트/스레드가 같은 계정·IP 한도를 쓰면 같은 limiter를 넘기세요
+        self.limiter = limiter or RateLimiter()
+        # 읽기 캐시: 현재가는 ticker_ttl초, 진행 중 봉이 포함된 캔들은 candle_ttl초
+        # (0이면 저장 없이 동시 요청 합치기만), 모두 닫힌 캔들(to가 과거)은 만료 없음
+        self.cache = cache if cache is not None else ReadCache()
+        self.ticker_ttl = ticker_ttl
+        self.candle_ttl = candle_ttl
 
     # --- Helper: 시장 심볼 ---
     def _market(self, symbol: str) -> str:
@@ -55,102 +186,99 @@ class UpbitClient(IExchangeClient):
     # --- Helper: 쿼리해시 + JWT ---
     def _jwt_headers(self, query: Dict[str, Any]) -> Dict[str, str]:
         assert self.creds is not None, "Private endpoint requires credentials"
+        return jwt_headers(self.creds, query)
 
-        # 업비트는 query_string(SHA512) 해시를 JWT payload에 포함
-        query_string = urlencode(query) if query else ""
-        query_hash = (
-            hashlib.sha512(query_string.encode()).hexdigest() if query_string else None
-        )
-
-        payload = {
-            "access_key": self.creds.access_key,
-            "nonce": str(uuid.uuid4()),
-        }
-        if query_hash:
-            payload["query_hash"] = query_hash
-            payload["query_hash_alg"] = "SHA512"
-
-        # HS256 서명
-        token = jwt.encode(payload, self.creds.secret_key, algorithm="HS256")
-        return {"Authorization": f"Bearer {token}"}
+    # --- Helper: 속도 제한을 거친 GET ---
+    def _get(
+        self,
+        path: str,
+        params: Dict[str, Any],
+        group: str = "quotation",
+        auth: bool = False,
+    ) -> requests.Response:
+        """limiter로 미리 간격을 맞춰 보내고, 그래도 429면 그룹을 멈춘 뒤 재시도"""
+        for attempt in range(3):
+            self.limiter.acquire(group)
+            # nonce가 매번 달라야 하므로 서명은 시도마다 새로
+            extra: Dict[str, Any] = {"headers": self._jwt_headers(params)} if auth else {}
+            r = self.s.get(f"{self.base}/{path}", params=params, timeout=self.timeout, **extra)
+            self.limiter.observe(group, r.headers.get("Remaining-Req"))
+            if r.status_code != 429:
+                break
+            log.warning(f"GET {path} throttled (429), waiting for next window...")
+            self.limiter.penalize(group)
+        r.raise_for_status()
+        return r
 
     # --- Public API ---
     def get_ticker(self, symbol: str) -> Ticker:
-        m = self._market(symbol)
-        params = {"markets": m}
-        r = self.s.get(f"{self.base}/ticker", params=params, timeout=self.timeout)
-        r.raise_for_status()
-        data = r.json()[0]
-        return Ticker(symbol=symbol, price=float(data["trade_price"]))
+        return self.get_tickers([symbol])[symbol]
+
+    def get_tickers(self, symbols: Sequence[str]) -> Dict[str, Ticker]:
+        """여러 심볼 현재가: 캐시에 없는 심볼만 /ticker?markets=A,B,C 1번으로 조회"""
+
+        def load(keys: List[Hashable]) -> Dict[Hashable, Any]:
+            wanted = {self._market(sym): sym for _, sym in cast(List[Tuple[str, str]], keys)}
+            r = self._get("ticker", {"markets": ",".join(wanted)})
+            out: Dict[Hashable, Any] = {}
+            for row in r.json():
+                sym = wanted.get(row.get("market"))
+                if sym is not None:
+                    out[("ticker", sym)] = Ticker(symbol=sym, price=float(row["trade_price"]))
+            return out
+
+        got = self.cache.get_many([("ticker", s) for s in symbols], self.ticker_ttl, load)
+        return {s: got[("ticker", s)] for s in symbols}
 
     def get_candles(
-        self, symbol: str, interval: str, limit: int = 200
-    ) -> Iterable[Candle]:
-        unit_map = {
-            "1m": 1,
-            "3m": 3,
-            "5m": 5,
-            "10m": 10,
-            "15m": 15,
-            "30m": 30,
-            "60m": 60,
-            "240m": 240,
-        }
-        unit = unit_map.get(interval, 1)
-        m = self._market(symbol)
-        params = {"market": m, "count": str(min(limit, 200))}
-        r = self.s.get(
-            f"{self.base}/candles/minutes/{unit}",
-            params=params,
-            timeout=self.timeout,
-        )
-        r.raise_for_status()
-        out: List[Candle] = []
-        for row in reversed(r.json()):  # 과거→현재
-            # candle_date_time_utc: "YYYY-MM-DDTHH:MM:SS"
-            ts = int(
-                time.mktime(
-                    time.strptime(row["candle_date_time_utc"][:19], "%Y-%m-%dT%H:%M:%S")
-                )
-            )
-            out.append(
-                Candle(
-                    ts=ts,
-                    o=float(row["opening_price"]),
-                    hi=float(row["high_price"]),
-                    lo=float(row["low_price"]),
-                    c=float(row["trade_price"]),
-                    v=float(row["candle_acc_trade_volume"]),
-                )
-            )
-        return out
+        self, symbol: str, interval: str, limit: int = 200, to: int | None = None
+    ) -> CandleFrame:
+        """
+        캔들 최대 200개 (ts 오름차순, 분봉/일봉).
+        to(epoch 초, UTC)를 주면 그 시각 이전(미포함) 캔들 → 과거로 페이지 이동용.
+        """
+        path, params = candles_request(self._market(symbol), interval, limit, to)
+        ttl = candles_cache_ttl(interval, to, self.candle_ttl)
+        key = ("candles", path, tuple(sorted(params.items())))
+        return self.cache.get(key, ttl, lambda: parse_candles(self._get(path, params).json()))
+
+    # --- Private: 주문 조회 ---
+    def get_orders(self, uuids: Sequence[str]) -> List[Dict[str, Any]]:
+        """주문 여러 개를 요청 1번으로 조회 (GET /orders/uuids, 최대 100개)"""
+        if not uuids:
+            return []
+        r = self._get("orders/uuids", {"uuids[]": list(uuids)}, group="exchange", auth=True)
+        rows: List[Dict[str, Any]] = r.json()
+        return rows
 
     # --- Private: 주문 생성 ---
     def _post(self, path: str, query: Dict[str, Any]) -> Dict[str, Any]:
-        # 429/5xx 간단 백오프
+        # order 그룹 한도에 맞춰 사전 대기, 429는 그룹 정지, 5xx는 간단 백오프
+        # 그 외 4xx(잔고 부족/잘못된 파라미터 등)는 재시도하지 않고 바로 HTTPError
         backoff = 0.5
         for attempt in range(5):
-            headers = self._jwt_headers(query)
-            try:
-                r = self.s.post(
-                    f"{self.base}{path}",
-                    params=query,
-                    headers=headers,
-                    timeout=self.timeout,
-                )
-                if r.status_code == 429 or 500 <= r.status_code < 600:
-                    raise requests.HTTPError(
-                        f"retryable status {r.status_code}", response=r
-                    )
-                r.raise_for_status()
-                return r.json()
-            except requests.HTTPError as e:
-                status = getattr(e.response, "status_code", None)
+            self.limiter.acquire("order")
+            r = self.s.post(
+                f"{self.base}{path}",
+                params=query,
+                headers=self._jwt_headers(query),
+                timeout=self.timeout,
+            )
+            self.limiter.observe("order", r.headers.get("Remaining-Req"))
+            if r.status_code == 429:
+                self.limiter.penalize("order")
+                log.warning(f"POST {path} throttled (429), waiting for next window...")
+                continue
+            if 500 <= r.status_code < 600:
                 log.warning(
-                    f"POST {path} failed (status={status}), retrying in {backoff:.1f}s..."
+                    f"POST {path} failed (status={r.status_code}), retrying in {backoff:.1f}s..."
                 )
                 time.sleep(backoff)
                 backoff = min(backoff * 2, 8.0)
+                continue
+            r.raise_for_status()
+            data: Dict[str, Any] = r.json()
+            return data
         raise RuntimeError(f"POST {path} failed after retries")
 
     def create_order(self, req: OrderRequest) -> Order:
@@ -185,26 +313,7 @@ class UpbitClient(IExchangeClient):
             )
 
         # --- 실주문 ---
-        # 파라미터 직렬화
-        if side == "buy":
-            # 시장가 매수: 금액 기반
-            query = {
-                "market": m,
-                "side": "bid",  # bid=매수
-                "ord_type": "price",  # 금액 지정 시장가
-                "price": f"{req.qty:.8f}",  # qty를 '금액'으로 해석
-            }
-        elif side == "sell":
-            # 시장가 매도: 수량 기반
-            query = {
-                "market": m,
-                "side": "ask",  # ask=매도
-                "ord_type": "market",  # 수량 지정 시장가
-                "volume": f"{req.qty:.8f}",
-            }
-        else:
-            raise ValueError(f"Unsupported side: {req.side}")
-
+        query = order_query(m, req)
         data = self._post("/orders", query)
         # 응답 예시에서 체결가를 바로 제공하지 않을 수 있으므로, 이력 조회가 필요할 수 있습니다.
         # 여기서는 단순히 요청 직후의 ticker로 ‘근사’ 체결가를 기록합니다.
@@ -0,0 +1,209 @@
+# src/autotrade/exchanges/upbit_async.py
+# ------------------------------------------------------------
+# UpbitClient의 asyncio 버전 (httpx.AsyncClient 연결 풀 1개를 공유)
+# - 요청 파라미터/응답 파싱/JWT 서명은 upbit.py 헬퍼를 그대로 사용 → 동기 클라이언트와 같은 결과
+# - 여러 심볼을 asyncio.gather로 동시에 요청하면 한 루프의 시간이
+#   요청 수의 합이 아니라 가장 느린 요청 1개 정도로 줄어듦
+# - DRY-RUN / 실주문 규칙은 UpbitClient.create_order와 동일
+# - 요청 속도는 RateLimiter로 사전 조정 (동기 클라이언트와 같은 인스턴스를 공유해도 됨)
+# - 읽기 캐시는 AsyncReadCache (TTL 규칙은 UpbitClient와 같음)
+#   같은 틱에 들어온 get_ticker 호출은 /ticker?markets=A,B,C 1번으로 묶음
+#   → asyncio.gather로 주문 N개를 동시에 내도 현재가 조회는 1번
+# ------------------------------------------------------------
+from __future__ import annotations
+import asyncio
+import logging
+import time
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple, cast
+
+import httpx
+
+from autotrade.exchanges.base import IAsyncExchangeClient
+from autotrade.exchanges.ratelimit import RateLimiter
+from autotrade.exchanges.readcache import AsyncReadCache
+from autotrade.exchanges.upbit import (
+    BASE,
+    UpbitCreds,
+    candles_cache_ttl,
+    candles_request,
+    jwt_headers,
+    order_query,
+    parse_candles,
+)
+from autotrade.models.market import CandleFrame, Ticker
+from autotrade.models.order import Order, OrderRequest
+
+log = logging.getLogger("upbit")
+
+
+class AsyncUpbitClient(IAsyncExchangeClient):
+    """Upbit Public + (안전 장치 포함) Private 주문, asyncio용"""
+
+    name = "upbit"
+
+    def __init__(
+        self,
+        base_url: str = BASE,
+        creds: UpbitCreds | None = None,
+        live: bool = False,
+        timeout: int = 10,
+        max_connections: int = 20,
+        client: Optional[httpx.AsyncClient] = None,
+        limiter: Optional[RateLimiter] = None,
+        cache: Optional[AsyncReadCache] = None,
+        ticker_ttl: float = 0.25,
+        candle_ttl: float = 0.0,
+    ):
+        self.base = base_url.rstrip("/")
+        self.creds = creds
+        self.live = live
+        self.timeout = timeout
+        self.c = client or httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+        )
+        self.limiter = limiter or RateLimiter()
+        self.cache = cache if cache is not None else AsyncReadCache()
+        self.ticker_ttl = ticker_ttl
+        self.candle_ttl = candle_ttl
+        # 이번 틱에 모인 get_ticker 요청 (심볼 → 결과 Future)와 그걸 보낼 태스크
+        self._ticker_batch: Dict[str, asyncio.Future[Ticker]] = {}
+        self._ticker_flush: Optional[asyncio.Task[None]] = None
+
+    async def aclose(self) -> None:
+        await self.c.aclose()
+
+    async def __aenter__(self) -> AsyncUpbitClient:
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        await self.aclose()
+
+    async def _get(
+        self, path: str, params: Dict[str, Any], group: str = "quotation"
+    ) -> httpx.Response:
+        """limiter로 미리 간격을 맞춰 보내고, 그래도 429면 그룹을 멈춘 뒤 재시도"""
+        for attempt in range(3):
+            await self.limiter.acquire_async(group)
+            r = await self.c.get(f"{self.base}/{path}", params=params)
+            self.limiter.observe(group, r.headers.get("Remaining-Req"))
+            if r.status_code != 429:
+                break
+            log.warning(f"GET {path} throttled (429), waiting for next window...")
+            self.limiter.penalize(group)
+        r.raise_for_status()
+        return r
+
+    # --- Public API ---
+    async def get_ticker(self, symbol: str) -> Ticker:
+        """같은 틱의 다른 get_ticker 호출과 묶어 get_tickers 1번으로 조회"""
+        fut = self._ticker_batch.get(symbol)
+        if fut is None:
+            loop = asyncio.get_running_loop()
+            fut = self._ticker_batch[symbol] = loop.create_future()
+            if self._ticker_flush is None:
+                self._ticker_flush = loop.create_task(self._flush_tickers())
+        return await asyncio.shield(fut)
+
+    async def _flush_tickers(self) -> None:
+        await asyncio.sleep(0)  # 같은 틱에 시작된 다른 태스크들의 요청을 모음
+        batch, self._ticker_batch = self._ticker_batch, {}
+        self._ticker_flush = None
+        try:
+            got = await self.get_tickers(list(batch))
+        except BaseException as e:
+            for f in batch.values():
+                if isinstance(e, asyncio.CancelledError):
+                    f.cancel()
+                else:
+                    f.set_exception(e)
+                    f.exception()  # 기다리는 쪽이 없어도 경고가 나지 않게 조회 처리
+            if isinstance(e, asyncio.CancelledError):
+                raise
+            return
+        for sym, f in batch.items():
+            f.set_result(got[sym])
+
+    async def get_tickers(self, symbols: Sequence[str]) -> Dict[str, Ticker]:
+        """여러 심볼 현재가: 캐시에 없는 심볼만 /ticker?markets=A,B,C 1번으로 조회"""
+
+        async def load(keys: List[Hashable]) -> Dict[Hashable, Any]:
+            wanted = [sym for _, sym in cast(List[Tuple[str, str]], keys)]
+            r = await self._get("ticker", {"markets": ",".join(wanted)})
+            out: Dict[Hashable, Any] = {}
+            for row in r.json():
+                sym = row.get("market")
+                if sym in wanted:
+                    out[("ticker", sym)] = Ticker(symbol=sym, price=float(row["trade_price"]))
+            return out
+
+        got = await self.cache.get_many([("ticker", s) for s in symbols], self.ticker_ttl, load)
+        return {s: got[("ticker", s)] for s in symbols}
+
+    async def get_candles(
+        self, symbol: str, interval: str, limit: int = 200, to: int | None = None
+    ) -> CandleFrame:
+        """캔들 최대 200개 (ts 오름차순). to와 캐시 규칙은 UpbitClient.get_candles와 같음"""
+        path, params = candles_request(symbol, interval, limit, to)
+        ttl = candles_cache_ttl(interval, to, self.candle_ttl)
+
+        async def load() -> CandleFrame:
+            return parse_candles((await self._get(path, params)).json())
+
+        key = ("candles", path, tuple(sorted(params.items())))
+        frame: CandleFrame = await self.cache.get(key, ttl, load)
+        return frame
+
+    # --- Private: 주문 생성 ---
+    async def _post(self, path: str, query: Dict[str, Any]) -> Dict[str, Any]:
+        # order 그룹 한도에 맞춰 사전 대기, 429는 그룹 정지, 5xx는 간단 백오프
+        assert self.creds is not None, "Private endpoint requires credentials"
+        backoff = 0.5
+        for attempt in range(5):
+            await self.limiter.acquire_async("order")
+            r = await self.c.post(
+                f"{self.base}{path}",
+                params=query,
+                headers=jwt_headers(self.creds, query),
+            )
+            self.limiter.observe("order", r.headers.get("Remaining-Req"))
+            if r.status_code == 429:
+                self.limiter.penalize("order")
+                log.warning(f"POST {path} throttled (429), waiting for next window...")
+                continue
+            if 500 <= r.status_code < 600:
+                log.warning(
+                    f"POST {path} failed (status={r.status_code}), retrying in {backoff:.1f}s..."
+                )
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 8.0)
+                continue
+            r.raise_for_status()
+            data: Dict[str, Any] = r.json()
+            return data
+        raise RuntimeError(f"POST {path} failed after retries")
+
+    async def create_order(self, req: OrderRequest) -> Order:
+        side = req.side.lower()
+        if not self.live or self.creds is None:
+            # DRY-RUN (기본): 주문 없이 현재가로 기록
+            px = (await self.get_ticker(req.symbol)).price
+            return Order(
+                id=f"DRY-{int(time.time())}",
+                symbol=req.symbol,
+                side=side,
+                qty=req.qty,
+                price=px,
+            )
+        data = await self._post("/orders", order_query(req.symbol, req))
+        px = (await self.get_ticker(req.symbol)).price
+        return Order(
+            id=str(data.get("uuid", f"UP-{int(time.time())}")),
+            symbol=req.symbol,
+            side=side,
+            qty=req.qty,
+            price=px,
+        )
@@ -0,0 +1,213 @@
+# src/autotrade/exchanges/upbit_ws.py
+# ------------------------------------------------------------
+# Upbit WebSocket 시세 스트림 (ticker / trade)
+# - 연결 → 구독 메시지 전송 → 수신 메시지를 Ticker / Trade로 변환
+# - 연결이 끊기면 지수 백오프로 재연결하고 같은 구독을 다시 보냄
+# - 수신 → 소비 사이는 크기 제한 큐: 가득 차면 가장 오래된 항목을 버림 (dropped로 셈)
+#   느린 소비자가 수신 루프를 막지 않고, 항상 최신 시세가 남음
+# - 소비: async for msg in stream (비동기 이터레이터) 또는 on_message 콜백
+#   수신 태스크가 예외로 죽으면 소비자의 __anext__ / close에서 그 예외가 다시 발생
+# ------------------------------------------------------------
+from __future__ import annotations
+import asyncio
+import json
+import logging
+import uuid
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Union
+
+from websockets.asyncio.client import connect
+from websockets.exceptions import WebSocketException
+
+from autotrade.models.market import Ticker, Trade
+
+log = logging.getLogger("upbit.ws")
+
+WS_URL = "wss://api.upbit.com/websocket/v1"
+
+Message = Union[Ticker, Trade]
+
+
+def parse_message(data: Dict[str, Any]) -> Optional[Message]:
+    """Upbit DEFAULT 포맷 메시지 → Ticker / Trade (그 외 타입은 None)"""
+    kind = data.get("type")
+    if kind == "ticker":
+        return Ticker(symbol=data["code"], price=float(data["trade_price"]))
+    if kind == "trade":
+        return Trade(
+            symbol=data["code"],
+            ts_ms=int(data["trade_timestamp"]),
+            price=float(data["trade_price"]),
+            volume=float(data["trade_volume"]),
+            side="buy" if data.get("ask_bid") == "BID" else "sell",
+            seq=int(data.get("sequential_id", 0)),
+        )
+    return None
+
+
+class DropOldestQueue:
+    """크기 제한 asyncio 큐: put은 막히지 않고, 가득 차면 가장 오래된 항목을 버림"""
+
+    def __init__(self, maxsize: int):
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be >= 1, got {maxsize}")
+        self.maxsize = maxsize
+        self.dropped = 0
+        self._items: Deque[Message] = deque()
+        self._ready = asyncio.Event()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def put(self, item: Message) -> None:
+        if len(self._items) >= self.maxsize:
+            self._items.popleft()
+            self.dropped += 1
+        self._items.append(item)
+        self._ready.set()
+
+    def get_nowait(self) -> Optional[Message]:
+        return self._items.popleft() if self._items else None
+
+    async def wait(self) -> None:
+        """항목이 들어오거나 wake()가 불릴 때까지 대기"""
+        if not self._items:
+            self._ready.clear()
+            await self._ready.wait()
+
+    def wake(self) -> None:
+        self._ready.set()
+
+    async def get(self) -> Message:
+        while not self._items:
+            await self.wait()
+        return self._items.popleft()
+
+
+class UpbitStream:
+    """
+    사용 예:
+        async with UpbitStream(["KRW-BTC"], types=("trade",)) as stream:
+            async for msg in stream:
+                ...
+    on_message를 주면 수신 태스크에서 메시지마다 바로 호출합니다 (큐에도 넣음).
+    """
+
+    def __init__(
+        self,
+        symbols: Sequence[str],
+        types: Sequence[str] = ("ticker", "trade"),
+        url: str = WS_URL,
+        maxsize: int = 10_000,
+        reconnect_delay: float = 1.0,
+        max_reconnect_delay: float = 30.0,
+        on_message: Optional[Callable[[Message], None]] = None,
+    ):
+        self.symbols = list(symbols)
+        self.types = list(types)
+        self.url = url
+        self.queue = DropOldestQueue(maxsize)
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self.on_message = on_message
+        self.received = 0
+        self.reconnects = 0
+        self._task: Optional[asyncio.Task[None]] = None
+        self._closed = False
+
+    @property
+    def dropped(self) -> int:
+        return self.queue.dropped
+
+    def subscription(self) -> List[Dict[str, Any]]:
+        """구독 요청 (재연결 때마다 새 ticket으로 다시 보냄)"""
+        req: List[Dict[str, Any]] = [{"ticket": str(uuid.uuid4())}]
+        req += [{"type": t, "codes": self.symbols} for t in self.types]
+        req.append({"format": "DEFAULT"})
+        return req
+
+    def _dispatch(self, raw: Union[str, bytes]) -> None:
+        try:
+            data = json.loads(raw)
+            if "error" in data:
+                log.warning("upbit ws error: %s", data["error"])
+                return
+            msg = parse_message(data)
+        except (ValueError, KeyError, TypeError) as e:
+            log.warning("malformed ws message skipped: %s", e)
+            return
+        if msg is None:
+            return
+        self.received += 1
+        self.queue.put(msg)
+        if self.on_message is not None:
+            self.on_message(msg)
+
+    async def run(self) -> None:
+        """close()까지 수신 (끊기면 재연결 + 재구독)"""
+        delay = self.reconnect_delay
+        while not self._closed:
+            try:
+                async with connect(self.url) as ws:
+                    await ws.send(json.dumps(self.subscription()))
+                    log.info("subscribed %s %s", self.types, self.symbols)
+                    async for raw in ws:
+                        delay = self.reconnect_delay  # 수신에 성공하면 백오프 초기화
+                        self._dispatch(raw)
+            except asyncio.CancelledError:
+                raise
+            except (WebSocketException, OSError, asyncio.TimeoutError) as e:
+                # 끊김(ConnectionClosed)뿐 아니라 핸드셰이크 거절(InvalidStatus 등)도 재연결
+                log.warning("websocket disconnected: %s", e)
+            if self._closed:
+                break
+            self.reconnects += 1
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.max_reconnect_delay)
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self.run())
+            # 태스크가 끝나면(예외 포함) 대기 중인 소비자를 깨움
+            self._task.add_done_callback(lambda _: self.queue.wake())
+
+    def _reader_error(self) -> Optional[BaseException]:
+        t = self._task
+        if t is None or not t.done() or t.cancelled():
+            return None
+        return t.exception()
+
+    async def close(self) -> None:
+        """수신 태스크 종료. 태스크가 예외로 죽어 있었다면 그 예외를 다시 발생"""
+        self._closed = True
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()  # 이미 끝난 태스크면 효과 없음 → await가 그 예외를 그대로 발생
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def __aenter__(self) -> UpbitStream:
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        await self.close()
+
+    def __aiter__(self) -> UpbitStream:
+        self.start()
+        return self
+
+    async def __anext__(self) -> Message:
+        while True:
+            msg = self.queue.get_nowait()
+            if msg is not None:
+                return msg
+            err = self._reader_error()
+            if err is not None:
+                raise err
+            if self._closed or (self._task is not None and self._task.done()):
+                raise StopAsyncIteration
+            await self.queue.wait()
@@ -1,7 +1,8 @@
+import asyncio
 import logging
 
 from autotrade.models.order import OrderRequest
-from autotrade.exchanges.base import IExchangeClient
+from autotrade.exchanges.base import IAsyncExchangeClient, IExchangeClient
 from autotrade.execution.risk import RiskManager
 
 log = logging.getLogger("executor")
@@ -26,3 +27,31 @@ class Executor:
                 f"Executed {order.side} {order.qty} {order.symbol} @ {order.price} (id={order.id})"
             )
         return executed
+
+
+class AsyncExecutor:
+    """Executor의 asyncio 버전: 리스크 검증은 같고, 통과한 주문은 동시에 제출"""
+
+    def __init__(self, exchange: IAsyncExchangeClient):
+        self.exchange = exchange
+        self.risk = RiskManager(max_orders=5, min_qty=0.0001, cooldown_s=2)
+
+    def update_equity(self, equity: float):
+        self.risk.update_equity(equity)
+
+    async def submit(self, orders: list[OrderRequest]):
+        """체결된 주문만 반환 (일부 주문이 실패해도 나머지 결과는 유지하고 실패는 로그로)"""
+        safe_orders = self.risk.validate(orders)
+        results = await asyncio.gather(
+            *(self.exchange.create_order(o) for o in safe_orders), return_exceptions=True
+        )
+        executed = []
+        for req, res in zip(safe_orders, results):
+            if isinstance(res, BaseException):
+                log.error(f"Order failed {req.side} {req.qty} {req.symbol}: {res!r}")
+                continue
+            executed.append(res)
+            log.info(
+                f"Executed {res.side} {res.qty} {res.symbol} @ {res.price} (id={res.id})"
+            )
+        return executed
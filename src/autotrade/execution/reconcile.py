@@ -0,0 +1,129 @@
+# src/autotrade/execution/reconcile.py
+# ------------------------------------------------------------
+# 실주문 체결 대조 (백그라운드 스레드)
+# - 주문 직후 기록되는 가격은 현재가 추정치 → 실제 체결 VWAP/수수료/상태로 갱신
+# - 미완료 주문을 모아 GET /orders/uuids 요청 1번(최대 batch_size개)으로 조회
+#   (주문마다 GET /order를 부르면 exchange 그룹 한도를 주문 수만큼 씀)
+# - done / cancel 상태가 되면 추적 목록에서 빠짐
+# - 메인 루프는 track()만 부르고 기다리지 않음
+# ------------------------------------------------------------
+from __future__ import annotations
+import dataclasses
+import logging
+import threading
+from typing import Any, Callable, Dict, List, Optional, Protocol, Sequence
+
+from autotrade.exchanges.upbit import parse_order_fill
+from autotrade.models.order import Order
+
+log = logging.getLogger("reconcile")
+
+FINAL_STATES = ("done", "cancel")
+
+
+class IOrderLookup(Protocol):
+    def get_orders(self, uuids: Sequence[str]) -> List[Dict[str, Any]]: ...
+
+
+class OrderReconciler:
+    """
+    rec = OrderReconciler(client); rec.start()
+    rec.track(order)      # 주문 제출 직후
+    rec.get(order.id)     # 가장 최근에 대조된 Order (price = 체결 VWAP)
+    rec.stop()
+    """
+
+    def __init__(
+        self,
+        client: IOrderLookup,
+        interval_s: float = 1.0,
+        batch_size: int = 100,
+        on_update: Optional[Callable[[Order], None]] = None,
+    ):
+        self.client = client
+        self.interval_s = interval_s
+        self.batch_size = batch_size
+        self.on_update = on_update
+        self.polls = 0
+        self.requests = 0
+        self.errors = 0
+        self._lock = threading.Lock()
+        self._orders: Dict[str, Order] = {}
+        self._pending: Dict[str, None] = {}  # 삽입 순서 유지
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def track(self, order: Order) -> None:
+        with self._lock:
+            self._orders[order.id] = order
+            if order.state not in FINAL_STATES:
+                self._pending[order.id] = None
+
+    def get(self, uuid: str) -> Optional[Order]:
+        with self._lock:
+            return self._orders.get(uuid)
+
+    @property
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def poll_once(self) -> List[Order]:
+        """미완료 주문을 batch_size개씩 조회해 갱신하고, 바뀐 Order 목록을 돌려줌"""
+        with self._lock:
+            ids = list(self._pending)
+        self.polls += 1
+        updated: List[Order] = []
+        for i in range(0, len(ids), self.batch_size):
+            batch = ids[i : i + self.batch_size]
+            self.requests += 1
+            try:
+                rows = self.client.get_orders(batch)
+            except Exception as e:
+                self.errors += 1
+                log.warning("order lookup failed (%d orders): %s", len(batch), e)
+                continue
+            with self._lock:
+                for row in rows:
+                    uuid = str(row.get("uuid"))
+                    old = self._orders.get(uuid)
+                    if old is None:
+                        continue
+                    fill = parse_order_fill(row)
+                    new = dataclasses.replace(
+                        old,
+                        price=fill["price"] if fill["price"] is not None else old.price,
+                        state=fill["state"],
+                        filled_qty=fill["filled_qty"],
+                        fee=fill["fee"],
+                    )
+                    self._orders[uuid] = new
+                    if new.state in FINAL_STATES:
+                        self._pending.pop(uuid, None)
+                    if new != old:
+                        updated.append(new)
+        if self.on_update is not None:
+            for o in updated:
+                self.on_update(o)
+        return updated
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_s):
+            if self.pending:
+                self.poll_once()
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="order-reconciler", daemon=True)
+        self._thread.start()
+
+    def stop(self, flush: bool = True) -> None:
+        """스레드 종료. flush=True면 남은 미완료 주문을 마지막으로 한 번 더 조회"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if flush and self.pending:
+            self.poll_once()
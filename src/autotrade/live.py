@@ -1,25 +1,120 @@
 # src/autotrade/live.py
+# ------------------------------------------------------------
+# 실시간 루프 (asyncio)
+# - data.feed: rest (기본) — sleep_s마다 모든 심볼의 캔들을 asyncio.gather로 동시에 조회
+#   → 루프 1회 시간 ≈ 가장 느린 요청 1개 (심볼 수에 비례하지 않음)
+# - data.feed: ws — Upbit 체결 WebSocket(UpbitStream)을 BarBuilder로 봉으로 만들어
+#   닫힌 봉 이벤트가 곧 신호 시점 (sleep_s 대기 없음). loops = 닫힌 봉 이벤트 수
+#   REST 캔들 조회는 워밍업과 구독 시점에 진행 중이던 봉(심볼당 1번)뿐이고,
+#   이후 봉은 스트림에서 만든 봉을 그대로 on_candle로 넘김
+#   (on_candle이 없는 전략은 봉 이벤트마다 그 심볼만 조회해 generate)
+# - on_candle 지원 전략은 새로 닫힌 봉만 받아 상태를 갱신 (ClosedBarFeed, 봉당 O(1))
+#   그 외 전략은 기존처럼 {심볼: 캔들} 전체를 generate로 받음
+# - 실주문은 OrderReconciler 스레드가 묶음 조회로 실제 체결가/수수료를 채움
+# ------------------------------------------------------------
 from __future__ import annotations
+import asyncio
 import os  # NEW: .env 값 읽기
-import time
 import logging
+import time
 import traceback
+from typing import Callable, Dict, List, Mapping, Sequence
 
 from autotrade.settings import Settings
 from autotrade.exchanges.upbit import UpbitClient, UpbitCreds
-from autotrade.data.candles import CandleService
+from autotrade.exchanges.upbit_async import AsyncUpbitClient
+from autotrade.exchanges.upbit_ws import UpbitStream
+from autotrade.data.bars import BarBuilder, stream_bars
+from autotrade.data.candles import AsyncCandleService
+from autotrade.models.market import Candle, CandleFrame, interval_seconds
+from autotrade.models.order import OrderRequest
+from autotrade.strategies.base import IStrategy, IStreamingStrategy
 from autotrade.strategies.registry import create as create_strategy
-from autotrade.execution.executor import Executor
+from autotrade.execution.executor import AsyncExecutor
+from autotrade.execution.reconcile import OrderReconciler
 
 from autotrade.logging_config import setup as setup_logging  # NEW: 로깅 구성
-from autotrade.notify.hooks import Notifier  # NEW: Slack/Telegram 알림
+from autotrade.logging_config import shutdown as shutdown_logging
+from autotrade.notify.hooks import Notifier, QueuedNotifier  # NEW: Slack/Telegram 알림
 
 log = logging.getLogger("live")
 
 
+async def fetch_all(
+    feed: AsyncCandleService, symbols: Sequence[str], interval: str, window: int
+) -> Dict[str, CandleFrame]:
+    """심볼별 최근 window개 캔들을 동시에 조회 (실패한 심볼은 로그만 남기고 제외)"""
+    results = await asyncio.gather(
+        *(feed.fetch(sym, interval, window) for sym in symbols), return_exceptions=True
+    )
+    out: Dict[str, CandleFrame] = {}
+    for sym, res in zip(symbols, results):
+        if isinstance(res, BaseException):
+            log.error("fetch %s failed: %s", sym, res)
+        else:
+            out[sym] = res
+    return out
+
+
+class ClosedBarFeed:
+    """
+    심볼별로 전략에 넘긴 마지막 봉 ts를 기억하고, 그 뒤에 '닫힌' 봉만 on_candle로 전달.
+    - 심볼의 첫 step은 워밍업: 받은 닫힌 봉을 모두 넣어 상태만 채우고 주문은 버림
+    - 한 번에 여러 봉이 새로 닫혔으면 차례로 넣되, 주문은 가장 최근 봉의 것만 (지난 신호는 버림)
+    - 진행 중인 봉(ts + 간격 > 현재 시각)은 닫힐 때까지 넣지 않음
+    on_candle이 없는 전략은 매번 generate(frames)를 부르는 기존 경로로 대체합니다.
+    """
+
+    def __init__(
+        self, strat: IStrategy, interval: str, clock: Callable[[], float] = time.time
+    ):
+        self.strat = strat
+        self.step_s = interval_seconds(interval)
+        self.clock = clock
+        self.on_candle = strat.on_candle if isinstance(strat, IStreamingStrategy) else None
+        self.bars = 0  # on_candle로 넣은 봉 수
+        self.last_ts: Dict[str, int] = {}
+
+    def push(self, sym: str, bar: Candle, warmup: bool = False) -> List[OrderRequest]:
+        """닫힌 봉 1개 → 주문 (이미 넣은 ts 이하면 무시)"""
+        last = self.last_ts.get(sym)
+        if last is not None and bar.ts <= last:
+            return []
+        self.last_ts[sym] = bar.ts
+        self.bars += 1
+        assert self.on_candle is not None
+        orders = self.on_candle(sym, bar)
+        return [] if warmup else list(orders)
+
+    def step(self, frames: Mapping[str, Sequence[Candle]]) -> List[OrderRequest]:
+        if self.on_candle is None:
+            return self.strat.generate(dict(frames))
+        now = self.clock()
+        orders: List[OrderRequest] = []
+        for sym, frame in frames.items():
+            warmup = sym not in self.last_ts
+            last = self.last_ts.get(sym, -1)
+            new = [c for c in frame if c.ts > last and c.ts + self.step_s <= now]
+            for k, bar in enumerate(new):
+                got = self.push(sym, bar, warmup=warmup or k < len(new) - 1)
+                orders.extend(got)
+        return orders
+
+
 def run_live(config_path: str, loops: int = 10, sleep_s: int = 5):
+    try:
+        asyncio.run(run_live_async(config_path, loops=loops, sleep_s=sleep_s))
+    finally:
+        shutdown_logging()  # queued 모드면 남은 로그를 모두 쓰고 종료
+
+
+async def run_live_async(config_path: str, loops: int = 10, sleep_s: int = 5):
     # --- (1) 로깅 세팅: 콘솔(INFO) + 파일(DEBUG) ---
-    setup_logging()  # NEW
+    # LOG_QUEUE=1: 로그 I/O를 전용 스레드에서 / LOG_JSON=1: 파일 로그를 JSON lines로
+    setup_logging(  # NEW
+        queued=os.getenv("LOG_QUEUE", "") in ("1", "true"),
+        json_lines=os.getenv("LOG_JSON", "") in ("1", "true"),
+    )
 
     # --- (2) 설정 로드 (.env는 settings.py에서 load_dotenv()로 자동 로드됨) ---
     s = Settings.load(config_path)
@@ -41,46 +136,121 @@ def run_live(config_path: str, loops: int = 10, sleep_s: int = 5):
             s.live = False
 
     # --- (5) 거래소/서비스/전략/실행기 생성 ---
-    upbit = UpbitClient(
+    upbit = AsyncUpbitClient(
         base_url=s.exchange.base_url,
         creds=creds,
         live=bool(s.live),
         timeout=s.exchange.timeout_s,
     )
-    candle = CandleService(upbit)
+    candle = AsyncCandleService(upbit)
     strat = create_strategy(
         s.strategy.name, **s.strategy.params, symbols=s.strategy.symbols
     )
-    execu = Executor(upbit)
+    strat.on_start()
+    execu = AsyncExecutor(upbit)
+    interval = s.data.get("interval", "1m")
+    feed = ClosedBarFeed(strat, interval)
 
-    # --- (6) 알림 훅 준비 (환경변수에서 자동 읽기) ---
-    notifier = Notifier(  # NEW
-        slack_webhook=os.getenv("SLACK_WEBHOOK"),  # NEW
-        telegram_bot=os.getenv("TELEGRAM_BOT"),  # NEW
-        telegram_chat_id=os.getenv("TELEGRAM_CHAT_ID"),  # NEW
+    # 체결 대조: 동기 클라이언트를 백그라운드 스레드에서 사용 (한도는 같은 limiter로 공유)
+    reconciler = None
+    if s.live and creds is not None:
+        rest = UpbitClient(
+            base_url=s.exchange.base_url,
+            creds=creds,
+            timeout=s.exchange.timeout_s,
+            limiter=upbit.limiter,
+        )
+        reconciler = OrderReconciler(
+            rest,
+            on_update=lambda o: log.info(
+                "fill %s %s %s @ %s fee=%s (%s)",
+                o.id, o.symbol, o.filled_qty, o.price, o.fee, o.state,
+            ),
+        )
+        reconciler.start()
+
+    # --- (6) 알림 훅 준비 (환경변수에서 자동 읽기, 전송은 백그라운드 스레드) ---
+    notifier = QueuedNotifier(
+        Notifier(  # NEW
+            slack_webhook=os.getenv("SLACK_WEBHOOK"),  # NEW
+            telegram_bot=os.getenv("TELEGRAM_BOT"),  # NEW
+            telegram_chat_id=os.getenv("TELEGRAM_CHAT_ID"),  # NEW
+        )
     )
 
-    sym = s.strategy.symbols[0]
-    interval = s.data.get("interval", "1m")
+    symbols = s.strategy.symbols
     window = int(s.data.get("window", 60))
+    source = s.data.get("feed", "rest")
+    if source not in ("rest", "ws"):
+        raise ValueError(f"data.feed must be 'rest' or 'ws', got {source!r}")
 
-    for i in range(loops):
-        try:
-            candles = list(candle.fetch(sym, interval, window))
-            orders = strat.generate({sym: candles})
-
-            if not orders:
-                log.info(f"[{i+1}/{loops}] no signal")
-            else:
-                executed = execu.submit(orders)
-                # --- (7) 체결 알림 전송 ---
-                for o in executed:  # NEW
-                    notifier.send(  # NEW
-                        f"[{s.env}] {o.side.upper()} {o.qty} {o.symbol} @ {o.price} (id={o.id})"
-                    )
-                log.info(f"[{i+1}/{loops}] executed={len(executed)}")
-
-        except Exception as e:
-            log.error("loop error: %s", e)
-            log.debug(traceback.format_exc())
-        time.sleep(sleep_s)
+    async def act(orders: List[OrderRequest], tag: str) -> None:
+        if not orders:
+            log.info(f"{tag} no signal")
+            return
+        executed = await execu.submit(orders)
+        if reconciler is not None:
+            for o in executed:
+                if not o.id.startswith("DRY-"):
+                    reconciler.track(o)
+        # --- (7) 체결 알림: 큐에 넣기만 함 (전송이 느려도 루프는 기다리지 않음) ---
+        for o in executed:  # NEW
+            notifier.send(
+                f"[{s.env}] {o.side.upper()} {o.qty} {o.symbol} @ {o.price} (id={o.id})"
+            )
+        log.info(f"{tag} executed={len(executed)}")
+
+    async with upbit:
+        if source == "ws":
+            # 체결 스트림으로 봉 경계를 감지 → 봉이 닫힌 심볼만 그때 조회 (sleep_s 대기 없음)
+            stream = UpbitStream(symbols, types=("trade",), url=s.exchange.ws_url)
+            async with stream:
+                try:
+                    frames = await fetch_all(candle, symbols, interval, window)
+                    await act(feed.step(frames), "[warmup]")
+                except Exception as e:
+                    log.error("warmup error: %s", e)
+                    log.debug(traceback.format_exc())
+                i = 0
+                # 구독 시점에 진행 중이던 봉은 앞부분 체결을 못 받았으므로 그 봉만 REST로 받음
+                partial = set(symbols)
+                async for sym, bar in stream_bars(stream, BarBuilder(interval)):
+                    i += 1
+                    try:
+                        if sym in partial or feed.on_candle is None:
+                            partial.discard(sym)
+                            frames = await fetch_all(candle, [sym], interval, window)
+                            orders = feed.step(frames)
+                        else:
+                            orders = feed.push(sym, bar)  # 캔들 조회 없이 닫힌 봉 그대로
+                        await act(orders, f"[{i}/{loops}] {sym}")
+                    except Exception as e:
+                        log.error("loop error: %s", e)
+                        log.debug(traceback.format_exc())
+                    if i >= loops:
+                        break
+            log.info(
+                "ws: received=%d reconnects=%d dropped=%d",
+                stream.received, stream.reconnects, stream.dropped,
+            )
+        else:
+            for i in range(loops):
+                try:
+                    candles = await fetch_all(candle, symbols, interval, window)
+                    await act(feed.step(candles), f"[{i+1}/{loops}]")
+                except Exception as e:
+                    log.error("loop error: %s", e)
+                    log.debug(traceback.format_exc())
+                await asyncio.sleep(sleep_s)
+        if reconciler is not None:
+            await asyncio.to_thread(reconciler.stop)
+            log.info(
+                "reconcile: polls=%d requests=%d errors=%d pending=%d",
+                reconciler.polls, reconciler.requests, reconciler.errors, reconciler.pending,
+            )
+        log.info("rate limit stats: %s", upbit.limiter.stats())
+    await asyncio.to_thread(notifier.close, 30.0)
+    log.info(
+        "notify: enqueued=%d dropped=%d flushes=%d errors=%d",
+        notifier.enqueued, notifier.dropped, notifier.flushes, notifier.errors,
+    )
@@ -1,12 +1,66 @@
+# src/autotrade/logging_config.py
+# ------------------------------------------------------------
+# 로깅 구성: 콘솔(INFO) + 회전 파일(DEBUG)
+# - queued=True: 루트에는 QueueHandler만 달고, 포맷/파일 쓰기/회전은
+#   QueueListener 전용 스레드가 처리 → 매매 루프의 log.info가 I/O를 기다리지 않음
+#   종료 시 shutdown()(atexit에도 등록)이 큐에 남은 레코드를 모두 쓰고 멈춤
+# - json_lines=True: 파일 로그를 한 줄에 JSON 1개로 (기계 파싱용)
+# ------------------------------------------------------------
 from __future__ import annotations
+import atexit
+import copy
+import json
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
+from typing import Any, Dict, Optional
 
 
 DEFAULT_FMT = "%(asctime)s | %(levelname)s | %(name)s | %(message)s"
 CONSOLE_FMT = "%(asctime)s | %(levelname)s | %(message)s"
 
+_listener: Optional[QueueListener] = None
+_queue_handler: Optional[QueueHandler] = None
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """{"ts": ISO8601(UTC, ms), "level", "logger", "msg"[, "exc"]} 한 줄"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        ts = datetime.fromtimestamp(record.created, tz=timezone.utc)
+        out: Dict[str, Any] = {
+            "ts": ts.isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:  # queued 모드에서는 _QueueHandler가 미리 렌더링해 둠
+            out["exc"] = record.exc_text
+        return json.dumps(out, ensure_ascii=False, separators=(",", ":"))
+
+
+class _QueueHandler(QueueHandler):
+    """
+    stdlib prepare()는 트레이스백을 msg에 합치고 exc_info를 지움 → JSON의 exc 필드가 사라짐.
+    여기서는 msg에는 메시지만, 트레이스백은 exc_text에 문자열로 남김 (프레임 참조는 넘기지 않음)
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = record.exc_text or _EXC_FORMATTER.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+_EXC_FORMATTER = logging.Formatter()
+
 
 def setup(
     log_dir: str = "logs",
@@ -15,7 +69,10 @@ def setup(
     filename: str = "trader.log",
     max_bytes: int = 5_000_000,
     backup_count: int = 3,
+    queued: bool = False,
+    json_lines: bool = False,
 ) -> None:
+    global _listener, _queue_handler
     Path(log_dir).mkdir(parents=True, exist_ok=True)
 
     root = logging.getLogger()
@@ -29,7 +86,6 @@ def setup(
     ch = logging.StreamHandler()
     ch.setLevel(console_level)
     ch.setFormatter(logging.Formatter(CONSOLE_FMT))
-    root.addHandler(ch)
 
     # 파일 핸들러(회전)
     fh = RotatingFileHandler(
@@ -39,8 +95,20 @@ def setup(
         encoding="utf-8",
     )
     fh.setLevel(file_level)
-    fh.setFormatter(logging.Formatter(DEFAULT_FMT))
-    root.addHandler(fh)
+    fh.setFormatter(JsonLinesFormatter() if json_lines else logging.Formatter(DEFAULT_FMT))
+
+    if queued:
+        q: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        _queue_handler = _QueueHandler(q)
+        root.addHandler(_queue_handler)
+        # 핸들러별 레벨(콘솔 INFO / 파일 DEBUG)은 리스너 쪽에서 적용
+        _listener = QueueListener(q, ch, fh, respect_handler_level=True)
+        _listener.start()
+        atexit.unregister(shutdown)
+        atexit.register(shutdown)
+    else:
+        root.addHandler(ch)
+        root.addHandler(fh)
 
     # 소음 줄이기(서드파티)
     logging.getLogger("urllib3").setLevel(logging.WARNING)
@@ -53,3 +121,18 @@ def setup(
     logging.getLogger("download").setLevel(logging.INFO)
 
     root._autotrade_logging_installed = True  # type: ignore[attr-defined]
+
+
+def shutdown() -> None:
+    """queued 모드의 리스너 정지: 큐에 남은 레코드를 모두 처리하고 핸들러를 닫음 (여러 번 불러도 안전)"""
+    global _listener, _queue_handler
+    if _listener is None:
+        return
+    root = logging.getLogger()
+    if _queue_handler is not None:
+        root.removeHandler(_queue_handler)
+    _listener.stop()
+    for h in _listener.handlers:
+        h.close()
+    _listener = _queue_handler = None
+    root._autotrade_logging_installed = False  # type: ignore[attr-defined]
@@ -1,4 +1,33 @@
+from __future__ import annotations
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Sequence
 from dataclasses import dataclass
+from typing import Iterable, Iterator, List, cast, overload
+
+
+# 봉 간격 문자열 → 분 (엔진 연환산, 거래소 요청, 다운로더, 리샘플러가 공유)
+INTERVAL_MINUTES = {
+    "1m": 1,
+    "3m": 3,
+    "5m": 5,
+    "10m": 10,
+    "15m": 15,
+    "30m": 30,
+    "60m": 60,
+    "240m": 240,
+    "1d": 1440,
+}
+
+
+def interval_seconds(interval: str) -> int:
+    """'15m' → 900. 모르는 간격이면 ValueError"""
+    try:
+        return INTERVAL_MINUTES[interval] * 60
+    except KeyError:
+        raise ValueError(
+            f"unknown interval {interval!r}; expected one of {list(INTERVAL_MINUTES)}"
+        ) from None
 
 
 @dataclass(frozen=True)
@@ -7,7 +36,19 @@ class Ticker:
     price: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
+class Trade:
+    """체결 1건 (ts_ms: 체결 시각 epoch 밀리초, side: 매수/매도 주도 "buy"/"sell")"""
+
+    symbol: str
+    ts_ms: int
+    price: float
+    volume: float
+    side: str
+    seq: int = 0
+
+
+@dataclass(frozen=True, slots=True)
 class Candle:
     ts: int
     o: float
@@ -15,3 +56,110 @@ class Candle:
     lo: float
     c: float
     v: float
+
+
+class CandleFrame(Sequence):
+    """
+    열 지향 캔들 묶음: ts(int64) / o·hi·lo·c·v(float64)를 연속 버퍼로 보관.
+    - 봉당 48바이트 (list[Candle]의 객체+박싱 float 대비 수 배 작음)
+    - frame[a:b]는 복사 없는 뷰(memoryview 슬라이스)
+    - frame[i] / 순회는 Candle을 즉석에서 만들어 기존 list[Candle] 코드와 호환
+    - 열은 memoryview라 np.frombuffer(frame.c)로 복사 없이 NumPy 배열로 볼 수 있음
+    """
+
+    __slots__ = ("ts", "o", "hi", "lo", "c", "v")
+
+    def __init__(
+        self,
+        ts: memoryview,
+        o: memoryview,
+        hi: memoryview,
+        lo: memoryview,
+        c: memoryview,
+        v: memoryview,
+    ):
+        n = len(ts)
+        if any(len(col) != n for col in (o, hi, lo, c, v)):
+            raise ValueError("CandleFrame columns must have the same length")
+        self.ts = ts
+        self.o = o
+        self.hi = hi
+        self.lo = lo
+        self.c = c
+        self.v = v
+
+    @classmethod
+    def from_columns(
+        cls,
+        ts: Iterable[int],
+        o: Iterable[float],
+        hi: Iterable[float],
+        lo: Iterable[float],
+        c: Iterable[float],
+        v: Iterable[float],
+    ) -> CandleFrame:
+        return cls(
+            memoryview(array("q", ts)),
+            memoryview(array("d", o)),
+            memoryview(array("d", hi)),
+            memoryview(array("d", lo)),
+            memoryview(array("d", c)),
+            memoryview(array("d", v)),
+        )
+
+    @classmethod
+    def from_candles(cls, candles: Iterable[Candle]) -> CandleFrame:
+        if isinstance(candles, CandleFrame):
+            return candles
+        cols: List[array] = [array("q")] + [array("d") for _ in range(5)]
+        ts, o, hi, lo, c, v = cols
+        for x in candles:
+            ts.append(x.ts)
+            o.append(x.o)
+            hi.append(x.hi)
+            lo.append(x.lo)
+            c.append(x.c)
+            v.append(x.v)
+        return cls(*(memoryview(col) for col in cols))
+
+    @classmethod
+    def empty(cls) -> CandleFrame:
+        return cls.from_columns((), (), (), (), (), ())
+
+    def __len__(self) -> int:
+        return len(self.ts)
+
+    @overload
+    def __getitem__(self, i: int) -> Candle: ...
+    @overload
+    def __getitem__(self, i: slice) -> CandleFrame: ...
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return CandleFrame(
+                self.ts[i], self.o[i], self.hi[i], self.lo[i], self.c[i], self.v[i]
+            )
+        return Candle(self.ts[i], self.o[i], self.hi[i], self.lo[i], self.c[i], self.v[i])
+
+    def __iter__(self) -> Iterator[Candle]:
+        for row in zip(self.ts, self.o, self.hi, self.lo, self.c, self.v):
+            yield Candle(*row)
+
+    def between(
+        self, start_ts: int | None = None, end_ts: int | None = None
+    ) -> CandleFrame:
+        """start_ts <= ts <= end_ts 구간 뷰 (ts 오름차순 전제, 이진 탐색 O(log n))"""
+        lo = 0 if start_ts is None else bisect_left(self.ts, start_ts)
+        hi = len(self) if end_ts is None else bisect_right(self.ts, end_ts)
+        return self[lo:hi]
+
+    def __repr__(self) -> str:
+        if not len(self):
+            return "CandleFrame(n=0)"
+        return f"CandleFrame(n={len(self)}, ts={self.ts[0]}..{self.ts[-1]})"
+
+
+def closes_of(candles: Iterable[Candle]) -> List[float]:
+    """종가 리스트 (CandleFrame이면 열 버퍼에서 바로 꺼냄)"""
+    if isinstance(candles, CandleFrame):
+        return cast(List[float], candles.c.tolist())
+    return [c.c for c in candles]
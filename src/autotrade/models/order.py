@@ -22,3 +22,7 @@ class Order:
     qty: float
     price: Optional[float] = None
     ts: Optional[int] = None
+    # 거래소 체결 조회로 채워지는 값 (OrderReconciler)
+    state: Optional[str] = None  # Upbit: wait / watch / done / cancel
+    filled_qty: Optional[float] = None
+    fee: Optional[float] = None
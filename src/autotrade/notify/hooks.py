@@ -1,7 +1,9 @@
 from __future__ import annotations
 import logging
+import queue
+import threading
 import time
-from typing import Optional
+from typing import List, Optional
 import requests
 
 log = logging.getLogger("notify")
@@ -59,3 +61,104 @@ class Notifier:
                 time.sleep(backoff)
                 backoff = min(backoff * 2, 6.0)
         return False
+
+
+class QueuedNotifier:
+    """
+    Notifier를 백그라운드 스레드로 보내는 래퍼.
+    - send(): 크기 제한 큐에 넣기만 함 (웹훅 상태와 무관하게 바로 반환). 큐가 차면 버리고 dropped 증가
+    - 작업 스레드: 첫 메시지 후 flush_interval초 동안 들어온 메시지를 줄바꿈으로 합쳐 1건으로 전송
+      (max_chars를 넘으면 나눠 전송, Telegram 메시지 한도 4096자)
+    - close(): 남은 메시지를 보내고 스레드 종료
+    """
+
+    def __init__(
+        self,
+        notifier: Notifier,
+        maxsize: int = 1000,
+        flush_interval: float = 1.0,
+        max_chars: int = 3500,
+    ):
+        self.notifier = notifier
+        self.flush_interval = flush_interval
+        self.max_chars = max_chars
+        self.enqueued = 0
+        self.dropped = 0
+        self.flushes = 0  # notifier.send 호출 수
+        self.errors = 0
+        self._q: queue.Queue[str] = queue.Queue(maxsize)
+        self._closed = threading.Event()
+        self._reported_drops = 0
+        self._thread = threading.Thread(target=self._run, name="notifier", daemon=True)
+        self._thread.start()
+
+    def send(self, text: str) -> None:
+        if self._closed.is_set():
+            self.dropped += 1
+            return
+        try:
+            self._q.put_nowait(text)
+            self.enqueued += 1
+        except queue.Full:
+            self.dropped += 1
+
+    def _collect(self) -> List[str]:
+        """첫 메시지를 기다린 뒤 flush_interval 동안 모음 (종료 중이면 남은 것 전부)"""
+        try:
+            batch = [self._q.get(timeout=0.1)]
+        except queue.Empty:
+            return []
+        deadline = time.monotonic() + self.flush_interval
+        while True:
+            remaining = 0.0 if self._closed.is_set() else deadline - time.monotonic()
+            try:
+                if remaining > 0:
+                    batch.append(self._q.get(timeout=remaining))
+                else:
+                    batch.append(self._q.get_nowait())
+            except queue.Empty:
+                return batch
+
+    def _chunks(self, lines: List[str]) -> List[str]:
+        out: List[str] = []
+        cur: List[str] = []
+        size = 0
+        for line in lines:
+            if cur and size + len(line) + 1 > self.max_chars:
+                out.append("\n".join(cur))
+                cur, size = [], 0
+            cur.append(line)
+            size += len(line) + 1
+        if cur:
+            out.append("\n".join(cur))
+        return out
+
+    def _deliver(self, batch: List[str]) -> None:
+        dropped = self.dropped - self._reported_drops
+        if dropped:
+            self._reported_drops += dropped
+            batch.append(f"(알림 {dropped}건 생략: 큐 가득 참)")
+        for text in self._chunks(batch):
+            self.flushes += 1
+            try:
+                self.notifier.send(text)
+            except Exception as e:
+                self.errors += 1
+                log.warning("notify send failed: %s", e)
+
+    def _run(self) -> None:
+        while not (self._closed.is_set() and self._q.empty()):
+            batch = self._collect()
+            if batch:
+                self._deliver(batch)
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """남은 메시지를 보내고 종료 (timeout초 안에 못 끝내면 포기, 데몬 스레드라 종료를 막지 않음)"""
+        self._closed.set()
+        self._thread.join(timeout)
+
+    def __enter__(self) -> QueuedNotifier:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
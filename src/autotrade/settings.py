@@ -19,6 +19,7 @@ class ApiCfg(BaseModel):
 class ExchangeCfg(BaseModel):
     name: str = "upbit"
     base_url: str = "https://api.upbit.com/v1"
+    ws_url: str = "wss://api.upbit.com/websocket/v1"  # data.feed: ws일 때 체결 스트림
     timeout_s: int = 10
 
 
@@ -1,4 +1,4 @@
-from typing import Protocol, Iterable
+from typing import Protocol, Iterable, Sequence, runtime_checkable
 from autotrade.models.market import Candle
 from autotrade.models.order import OrderRequest
 
@@ -9,3 +9,37 @@ class IStrategy(Protocol):
 
     def on_start(self) -> None: ...
     def generate(self, candles: dict[str, Iterable[Candle]]) -> list[OrderRequest]: ...
+
+
+@runtime_checkable
+class IStreamingStrategy(Protocol):
+    """
+    캔들 1개씩 받아 내부 상태를 갱신하는 스트리밍 전략.
+    - on_start(): 내부 상태 초기화
+    - on_candle(sym, candle): 새로 닫힌 캔들 1개 → 그 시점의 주문 (O(1))
+    generate(candles[:i])[-1]과 같은 주문을 내도록 구현합니다.
+    """
+
+    name: str
+    symbols: list[str]
+
+    def on_start(self) -> None: ...
+    def on_candle(self, sym: str, candle: Candle) -> list[OrderRequest]: ...
+
+
+@runtime_checkable
+class IVectorStrategy(Protocol):
+    """
+    전체 종가 배열을 한 번에 받아 신호 벡터(1=매수, -1=매도, 0=대기)를 돌려주는 전략.
+    signals(closes)[i]는 generate(candles[:i+1])가 내는 신호와 같아야 합니다.
+    주문 수량은 qty 속성을 사용합니다.
+    엔진은 클래스에 exact_signals = True가 있을 때만 벡터 경로를 씁니다
+    (신호가 스트리밍/롤링 경로와 비트 단위로 같다는 선언; 근사 커널을 쓰면 선언하지 말 것).
+    """
+
+    name: str
+    symbols: list[str]
+    qty: float
+
+    def on_start(self) -> None: ...
+    def signals(self, closes: Sequence[float]) -> Sequence[int]: ...
@@ -3,52 +3,35 @@
 # Bollinger Bands 전략: SMA ± k*std 밴드 돌파/복귀 교차로 신호 생성
 # ------------------------------------------------------------
 from __future__ import annotations
-from typing import Iterable, List, Dict
-from collections import deque
-from typing import Deque
-from math import sqrt
-from autotrade.models.market import Candle
+from dataclasses import dataclass
+from typing import Iterable, List, Dict, Sequence
+from autotrade.models.market import Candle, closes_of
 from autotrade.models.order import OrderRequest
+from autotrade.analysis.cache import IndicatorCache
+from autotrade.analysis.indicators import RollingStd, bollinger
 from autotrade.strategies.registry import register
 
+# 밴드 비교 허용 오차 (밴드 값 대비 상대값): m ± k*std 계산의 반올림만큼 걸친 종가는
+# 돌파로 보지 않음 (평탄 구간에서 종가 == 밴드일 때 신호가 켜졌다 꺼지는 것 방지)
+BAND_TOL = 1e-12
+
+
+def _above(c: float, band: float) -> bool:
+    return c > band + abs(band) * BAND_TOL
+
+
+def _below(c: float, band: float) -> bool:
+    return c < band - abs(band) * BAND_TOL
 
-def _sma(values: List[float], window: int) -> List[float]:
-    out: List[float] = []
-    if window <= 0:
-        return out
-    s = 0.0
-    for i, v in enumerate(values):
-        s += v
-        if i >= window:
-            s -= values[i - window]
-        out.append(s / window if i + 1 >= window else float("nan"))
-    return out
-
-
-def _rolling_std(values: List[float], window: int) -> List[float]:
-    # Welford라기보단 간단 이동표준편차 (성능 OK)
-    out: List[float] = []
-    if window <= 1:
-        return [float("nan")] * len(values)
-
-    q: Deque[float] = deque()
-    s1 = 0.0
-    s2 = 0.0
-    for i, v in enumerate(values):
-        q.append(v)
-        s1 += v
-        s2 += v * v
-        if len(q) > window:
-            old = q.popleft()
-            s1 -= old
-            s2 -= old * old
-        if len(q) == window:
-            mean = s1 / window
-            var = max(s2 / window - mean * mean, 0.0)
-            out.append(sqrt(var))
-        else:
-            out.append(float("nan"))
-    return out
+
+@dataclass
+class _BBandsState:
+    """on_candle용 심볼별 상태 (signals()의 bollinger()와 같은 RollingStd 1개로 평균/std)"""
+
+    std: RollingStd
+    prev_close: float = float("nan")
+    prev_upper: float = float("nan")
+    prev_lower: float = float("nan")
 
 
 @register("bbands")
@@ -61,8 +44,12 @@ class BBandsStrategy:
       use_crossover: bool = True  # 밴드 '처음' 돌파(복귀)만 신호
       cooldown: int = 0
       qty: float = 0.001
+      cache: IndicatorCache | None  # 지정하면 signals()의 SMA/std를 캐시에서 공유
     """
 
+    # signals()가 exact 지표 경로라 on_candle/generate와 비트 단위 같은 신호 → 벡터 백테스트 허용
+    exact_signals = True
+
     def __init__(
         self,
         symbols: list[str],
@@ -72,6 +59,7 @@ class BBandsStrategy:
         use_crossover: bool = True,
         cooldown: int = 0,
         qty: float = 0.001,
+        cache: IndicatorCache | None = None,
     ):
         assert mode in ("breakout", "revert")
         self.name = "bbands"
@@ -82,26 +70,21 @@ class BBandsStrategy:
         self.use_crossover = use_crossover
         self.cooldown = cooldown
         self.qty = qty
+        self.cache = cache
+        self._state: Dict[str, _BBandsState] = {}
 
     def on_start(self) -> None:
-        pass
+        self._state.clear()
 
     def _signals(self, closes: List[float]) -> List[int]:
-        sma = _sma(closes, self.window)
-        std = _rolling_std(closes, self.window)
         n = len(closes)
         sig = [0] * n
         if n < self.window + 2:
             return sig
-
-        upper = [
-            m + self.k * s if (m == m and s == s) else float("nan")
-            for m, s in zip(sma, std)
-        ]
-        lower = [
-            m - self.k * s if (m == m and s == s) else float("nan")
-            for m, s in zip(sma, std)
-        ]
+        if self.cache is not None:
+            upper, lower = self.cache.bollinger(closes, self.window, self.k)
+        else:
+            upper, lower = bollinger(closes, self.window, self.k, exact=True)
 
         if self.mode == "breakout":
             # 상단 돌파=매수, 하단 돌파=매도 (추세 추종)
@@ -110,15 +93,15 @@ class BBandsStrategy:
                     c0, c1 = closes[i - 1], closes[i]
                     up0, up1 = upper[i - 1], upper[i]
                     lo0, lo1 = lower[i - 1], lower[i]
-                    if up0 == up0 and up1 == up1 and c0 <= up0 and c1 > up1:
+                    if up0 == up0 and up1 == up1 and not _above(c0, up0) and _above(c1, up1):
                         sig[i] = 1
-                    elif lo0 == lo0 and lo1 == lo1 and c0 >= lo0 and c1 < lo1:
+                    elif lo0 == lo0 and lo1 == lo1 and not _below(c0, lo0) and _below(c1, lo1):
                         sig[i] = -1
             else:
                 for i in range(n):
-                    if upper[i] == upper[i] and closes[i] > upper[i]:
+                    if upper[i] == upper[i] and _above(closes[i], upper[i]):
                         sig[i] = 1
-                    elif lower[i] == lower[i] and closes[i] < lower[i]:
+                    elif lower[i] == lower[i] and _below(closes[i], lower[i]):
                         sig[i] = -1
         else:
             # revert(평균회귀): 상단 밴드 복귀=매도, 하단 밴드 복귀=매수
@@ -127,22 +110,22 @@ class BBandsStrategy:
                     c0, c1 = closes[i - 1], closes[i]
                     up0, up1 = upper[i - 1], upper[i]
                     lo0, lo1 = lower[i - 1], lower[i]
-                    if up0 == up0 and up1 == up1 and c0 >= up0 and c1 < up1:
+                    if up0 == up0 and up1 == up1 and not _below(c0, up0) and _below(c1, up1):
                         sig[i] = -1
-                    elif lo0 == lo0 and lo1 == lo1 and c0 <= lo0 and c1 > lo1:
+                    elif lo0 == lo0 and lo1 == lo1 and not _above(c0, lo0) and _above(c1, lo1):
                         sig[i] = 1
             else:
                 for i in range(n):
                     if (
                         upper[i] == upper[i]
-                        and closes[i] < upper[i]
-                        and closes[i - 1] >= upper[i - 1]
+                        and _below(closes[i], upper[i])
+                        and not _below(closes[i - 1], upper[i - 1])
                     ):
                         sig[i] = -1
                     elif (
                         lower[i] == lower[i]
-                        and closes[i] > lower[i]
-                        and closes[i - 1] <= lower[i - 1]
+                        and _above(closes[i], lower[i])
+                        and not _above(closes[i - 1], lower[i - 1])
                     ):
                         sig[i] = 1
 
@@ -156,16 +139,69 @@ class BBandsStrategy:
                     sig[i] = 0
         return sig
 
+    def signals(self, closes: Sequence[float]) -> List[int]:
+        """전체 종가 → 봉별 신호 (generate(candles[:i+1])의 신호와 동일)"""
+        sig = self._signals(list(closes))
+        # 워밍업 구간(캔들 수 < window + 2)은 주문 없음
+        warmup = min(self.window + 1, len(sig))
+        sig[:warmup] = [0] * warmup
+        return sig
+
     def generate(self, candles: Dict[str, Iterable[Candle]]) -> List[OrderRequest]:
         orders: List[OrderRequest] = []
         for sym in self.symbols:
-            cs = list(candles.get(sym, []))
-            if not cs:
+            closes = closes_of(candles.get(sym, []))
+            if not closes:
                 continue
-            closes = [c.c for c in cs]
-            sig = self._signals(closes)
+            sig = self.signals(closes)
             if sig and sig[-1] == 1:
                 orders.append(OrderRequest.market(sym, "buy", self.qty))
             elif sig and sig[-1] == -1:
                 orders.append(OrderRequest.market(sym, "sell", self.qty))
         return orders
+
+    def on_candle(self, sym: str, candle: Candle) -> List[OrderRequest]:
+        """
+        스트리밍 경로: generate(candles[:i])와 같은 주문을 O(1)로 계산.
+        쿨다운은 배치 경로에서도 이미 0인 신호만 0으로 만들므로 별도 상태가 없습니다.
+        """
+        st = self._state.get(sym)
+        if st is None:
+            st = self._state[sym] = _BBandsState(RollingStd(self.window))
+        c1 = float(candle.c)
+        sd = st.std.update(c1)
+        m = st.std.mean
+
+        up1 = lo1 = float("nan")
+        if m == m and sd == sd:
+            up1 = m + self.k * sd
+            lo1 = m - self.k * sd
+        c0, up0, lo0 = st.prev_close, st.prev_upper, st.prev_lower
+        st.prev_close, st.prev_upper, st.prev_lower = c1, up1, lo1
+
+        if st.std.n < self.window + 2:
+            return []
+        sig = 0
+        if self.mode == "breakout":
+            if self.use_crossover:
+                if up0 == up0 and up1 == up1 and not _above(c0, up0) and _above(c1, up1):
+                    sig = 1
+                elif lo0 == lo0 and lo1 == lo1 and not _below(c0, lo0) and _below(c1, lo1):
+                    sig = -1
+            elif up1 == up1 and _above(c1, up1):
+                sig = 1
+            elif lo1 == lo1 and _below(c1, lo1):
+                sig = -1
+        else:
+            if self.use_crossover:
+                if up0 == up0 and up1 == up1 and not _below(c0, up0) and _below(c1, up1):
+                    sig = -1
+                elif lo0 == lo0 and lo1 == lo1 and not _above(c0, lo0) and _above(c1, lo1):
+                    sig = 1
+            elif up1 == up1 and _below(c1, up1) and not _below(c0, up0):
+                sig = -1
+            elif lo1 == lo1 and _above(c1, lo1) and not _above(c0, lo0):
+                sig = 1
+        if sig == 0:
+            return []
+        return [OrderRequest.market(sym, "buy" if sig == 1 else "sell", self.qty)]
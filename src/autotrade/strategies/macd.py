@@ -6,25 +6,21 @@
 # - 마지막 캔들 신호만 주문으로 변환 (AutoTrade 표준)
 # ------------------------------------------------------------
 from __future__ import annotations
-from typing import Iterable, List, Dict
-from autotrade.models.market import Candle
+from dataclasses import dataclass
+from typing import Iterable, List, Dict, Sequence
+from autotrade.models.market import Candle, closes_of
 from autotrade.models.order import OrderRequest
+from autotrade.analysis.cache import IndicatorCache
+from autotrade.analysis.indicators import MACD, macd
 from autotrade.strategies.registry import register
 
 
-def _ema(values: List[float], period: int) -> List[float]:
-    if period <= 0 or not values:
-        return []
-    k = 2.0 / (period + 1)
-    out: List[float] = []
-    avg = 0.0
-    for i, v in enumerate(values):
-        if i == 0:
-            avg = v
-        else:
-            avg = v * k + avg * (1 - k)
-        out.append(avg)
-    return out
+@dataclass
+class _MACDState:
+    """on_candle용 심볼별 상태 (signals()와 같은 MACD로 누적)"""
+
+    macd: MACD
+    hist: float = 0.0
 
 
 @register("macd")
@@ -37,8 +33,12 @@ class MACDStrategy:
       use_crossover: bool = True  # 히스토그램 0선 '처음' 교차만 신호
       cooldown: int = 0
       qty: float = 0.001
+      cache: IndicatorCache | None  # 지정하면 signals()의 MACD/EMA를 캐시에서 공유
     """
 
+    # signals()가 exact 지표 경로라 on_candle/generate와 비트 단위 같은 신호 → 벡터 백테스트 허용
+    exact_signals = True
+
     def __init__(
         self,
         symbols: list[str],
@@ -48,6 +48,7 @@ class MACDStrategy:
         use_crossover: bool = True,
         cooldown: int = 0,
         qty: float = 0.001,
+        cache: IndicatorCache | None = None,
     ):
         self.name = "macd"
         self.symbols = symbols
@@ -57,9 +58,11 @@ class MACDStrategy:
         self.use_crossover = use_crossover
         self.cooldown = cooldown
         self.qty = qty
+        self.cache = cache
+        self._state: Dict[str, _MACDState] = {}
 
     def on_start(self) -> None:
-        pass
+        self._state.clear()
 
     def _signals_from_hist(self, hist: List[float]) -> List[int]:
         n = len(hist)
@@ -90,28 +93,56 @@ class MACDStrategy:
                     sig[i] = 0
         return sig
 
+    def signals(self, closes: Sequence[float]) -> List[int]:
+        """전체 종가 → 봉별 신호 (generate(candles[:i+1])의 신호와 동일)"""
+        if self.cache is not None:
+            _, _, hist = self.cache.macd(closes, self.fast, self.slow, self.signal)
+        else:
+            _, _, hist = macd(closes, self.fast, self.slow, self.signal, exact=True)
+
+        sig = self._signals_from_hist(hist)
+        # 워밍업 구간(캔들 수 < max(fast, slow, signal) + 2)은 주문 없음
+        warmup = min(max(self.fast, self.slow, self.signal) + 1, len(sig))
+        sig[:warmup] = [0] * warmup
+        return sig
+
     def generate(self, candles: Dict[str, Iterable[Candle]]) -> List[OrderRequest]:
         orders: List[OrderRequest] = []
         for sym in self.symbols:
-            cs = list(candles.get(sym, []))
-            if not cs:
-                continue
-            closes = [c.c for c in cs]
+            closes = closes_of(candles.get(sym, []))
             if len(closes) < max(self.fast, self.slow, self.signal) + 2:
                 continue
-
-            ema_fast = _ema(closes, self.fast)
-            ema_slow = _ema(closes, self.slow)
-            macd_line = [f - s for f, s in zip(ema_fast, ema_slow)]
-            signal_line = _ema(macd_line, self.signal)
-            # 길이 보정
-            L = min(len(macd_line), len(signal_line))
-            macd_line, signal_line = macd_line[-L:], signal_line[-L:]
-            hist = [m - s for m, s in zip(macd_line, signal_line)]
-
-            sig = self._signals_from_hist(hist)
+            sig = self.signals(closes)
             if sig and sig[-1] == 1:
                 orders.append(OrderRequest.market(sym, "buy", self.qty))
             elif sig and sig[-1] == -1:
                 orders.append(OrderRequest.market(sym, "sell", self.qty))
         return orders
+
+    def on_candle(self, sym: str, candle: Candle) -> List[OrderRequest]:
+        """
+        스트리밍 경로: generate(candles[:i])와 같은 주문을 O(1)로 계산.
+        쿨다운은 배치 경로에서도 이미 0인 신호만 0으로 만들므로 별도 상태가 없습니다.
+        """
+        st = self._state.get(sym)
+        if st is None:
+            st = self._state[sym] = _MACDState(MACD(self.fast, self.slow, self.signal))
+        prev = st.hist
+        hist = st.macd.update(float(candle.c)).hist
+        st.hist = hist
+
+        if st.macd.n < max(self.fast, self.slow, self.signal) + 2:
+            return []
+        sig = 0
+        if self.use_crossover:
+            if prev <= 0 and hist > 0:
+                sig = 1
+            elif prev >= 0 and hist < 0:
+                sig = -1
+        elif hist > 0:
+            sig = 1
+        elif hist < 0:
+            sig = -1
+        if sig == 0:
+            return []
+        return [OrderRequest.market(sym, "buy" if sig == 1 else "sell", self.qty)]
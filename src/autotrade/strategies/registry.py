@@ -1,3 +1,4 @@
+import inspect
 from typing import Dict, Type, Any
 
 _REGISTRY: Dict[str, Type] = {}
@@ -17,5 +18,15 @@ def create(name: str, **kwargs: Any):
     return _REGISTRY[name](**kwargs)
 
 
+def accepts(name: str, param: str) -> bool:
+    """등록된 전략의 생성자가 param 키워드(또는 **kwargs)를 받는지"""
+    if name not in _REGISTRY:
+        raise KeyError(f"Strategy '{name}' not found. Registered: {list(_REGISTRY)}")
+    params = inspect.signature(_REGISTRY[name]).parameters
+    return param in params or any(
+        p.kind is inspect.Parameter.VAR_KEYWORD for p in params.values()
+    )
+
+
 def available() -> list[str]:
     return sorted(_REGISTRY)
@@ -6,49 +6,22 @@
 # - SMA Cross와 동일한 인터페이스로 symbols 파라미터를 받습니다.
 # ------------------------------------------------------------
 from __future__ import annotations
-from typing import Iterable, List, Dict
-from autotrade.models.market import Candle
+from dataclasses import dataclass
+from typing import Iterable, List, Dict, Sequence
+from autotrade.models.market import Candle, closes_of
 from autotrade.models.order import OrderRequest
+from autotrade.analysis.cache import IndicatorCache
+from autotrade.analysis.indicators import WilderRSI, wilder_rsi
 from autotrade.strategies.registry import register
 
 
-def _wilder_rsi(closes: List[float], period: int) -> List[float]:
-    """
-    Wilder's RSI (EMA 형태의 평균 상승/하락)
-    반환: RSI 리스트 (초기 period-1 구간은 float('nan'))
-    """
-    n = len(closes)
-    if n == 0:
-        return []
-    import math
-
-    rsi = [math.nan] * n
-    gains = [0.0] * n
-    losses = [0.0] * n
-    for i in range(1, n):
-        delta = closes[i] - closes[i - 1]
-        gains[i] = max(delta, 0.0)
-        losses[i] = max(-delta, 0.0)
-
-    # 초기 평균
-    avg_gain = sum(gains[1 : period + 1]) / period if n > period else 0.0
-    avg_loss = sum(losses[1 : period + 1]) / period if n > period else 0.0
-
-    # 첫 유효 RSI
-    if n > period:
-        rs = (avg_gain / avg_loss) if avg_loss != 0 else float("inf")
-        rsi[period] = 100.0 - (100.0 / (1.0 + rs))
-
-    # 이후 EMA 방식의 평균
-    for i in range(period + 1, n):
-        avg_gain = (avg_gain * (period - 1) + gains[i]) / period
-        avg_loss = (avg_loss * (period - 1) + losses[i]) / period
-        if avg_loss == 0:
-            rsi[i] = 100.0  # 손실 0이면 RSI=100
-        else:
-            rs = avg_gain / avg_loss
-            rsi[i] = 100.0 - (100.0 / (1.0 + rs))
-    return rsi
+@dataclass
+class _RSIState:
+    """on_candle용 심볼별 상태 (signals()와 같은 WilderRSI로 누적)"""
+
+    rsi: WilderRSI
+    below: bool = False
+    above: bool = False
 
 
 @register("rsi")
@@ -64,8 +37,12 @@ class RSIStrategy:
       use_crossover: bool = True    # 임계선 '처음' 교차 시에만 신호
       cooldown: int = 0             # 신호 후 N캔들 동안 추가 신호 억제
       qty: float = 0.001            # 주문 수량(데모용)
+      cache: IndicatorCache | None  # 지정하면 signals()의 RSI를 캐시에서 공유
     """
 
+    # signals()가 exact 지표 경로라 on_candle/generate와 비트 단위 같은 신호 → 벡터 백테스트 허용
+    exact_signals = True
+
     def __init__(
         self,
         symbols: list[str],
@@ -75,6 +52,7 @@ class RSIStrategy:
         use_crossover: bool = True,
         cooldown: int = 0,
         qty: float = 0.001,
+        cache: IndicatorCache | None = None,
     ):
         self.name = "rsi"
         self.symbols = symbols
@@ -84,9 +62,11 @@ class RSIStrategy:
         self.use_crossover = use_crossover
         self.cooldown = cooldown
         self.qty = qty
+        self.cache = cache
+        self._state: Dict[str, _RSIState] = {}
 
     def on_start(self) -> None:
-        pass
+        self._state.clear()
 
     def _signals_from_rsi(self, rsi: List[float]) -> List[int]:
         """
@@ -138,17 +118,24 @@ class RSIStrategy:
 
         return sig
 
+    def signals(self, closes: Sequence[float]) -> List[int]:
+        """전체 종가 → 봉별 신호 (generate(candles[:i+1])의 신호와 동일)"""
+        if self.cache is not None:
+            rsi = self.cache.wilder_rsi(closes, self.period)
+        else:
+            rsi = wilder_rsi(closes, self.period, exact=True)
+        sig = self._signals_from_rsi(rsi)
+        if sig:
+            sig[0] = 0  # 캔들 2개 미만이면 주문 없음
+        return sig
+
     def generate(self, candles: Dict[str, Iterable[Candle]]) -> List[OrderRequest]:
         orders: List[OrderRequest] = []
         for sym in self.symbols:
-            cs = list(candles.get(sym, []))
-            if not cs:
-                continue
-            closes = [c.c for c in cs]
-            rsi = _wilder_rsi(closes, self.period)
-            sig = self._signals_from_rsi(rsi)
-            if len(sig) < 2:
+            closes = closes_of(candles.get(sym, []))
+            if len(closes) < 2:
                 continue
+            sig = self.signals(closes)
 
             # 마지막 캔들의 신호만 주문으로 변환(백테스트 루프에서 순차 처리 가정)
             if sig[-1] == 1:
@@ -156,3 +143,33 @@ class RSIStrategy:
             elif sig[-1] == -1:
                 orders.append(OrderRequest.market(sym, "sell", self.qty))
         return orders
+
+    def on_candle(self, sym: str, candle: Candle) -> List[OrderRequest]:
+        """
+        스트리밍 경로: generate(candles[:i])와 같은 주문을 O(1)로 계산.
+        쿨다운은 배치 경로에서도 이미 0인 신호만 0으로 만들므로 별도 상태가 없습니다.
+        """
+        st = self._state.get(sym)
+        if st is None:
+            st = self._state[sym] = _RSIState(WilderRSI(self.period))
+        rsi = st.rsi.update(float(candle.c))
+        n = st.rsi.n
+
+        sig = 0
+        below = rsi == rsi and rsi <= self.buy_th
+        above = rsi == rsi and rsi >= self.sell_th
+        if self.use_crossover:
+            if n > 1:
+                if below and not st.below:
+                    sig = 1
+                elif above and not st.above:
+                    sig = -1
+        elif below:
+            sig = 1
+        elif above:
+            sig = -1
+        st.below, st.above = below, above
+
+        if n < 2 or sig == 0:
+            return []
+        return [OrderRequest.market(sym, "buy" if sig == 1 else "sell", self.qty)]
@@ -1,33 +1,82 @@
-from typing import Iterable
+from dataclasses import dataclass
+from typing import Iterable, Sequence
 from autotrade.strategies.base import IStrategy
 from autotrade.strategies.registry import register
-from autotrade.models.market import Candle
+from autotrade.models.market import Candle, closes_of
 from autotrade.models.order import OrderRequest
-from autotrade.analysis.indicators import sma
+from autotrade.analysis.cache import IndicatorCache
+from autotrade.analysis.indicators import SMA, sma
+
+
+@dataclass
+class _SmaState:
+    """on_candle용 심볼별 상태 (SMA는 indicators.sma와 같은 순서로 누적)"""
+
+    fast: SMA
+    slow: SMA
+    f: float = float("nan")
+    s: float = float("nan")
 
 
 @register("sma_cross")
 class SmaCross(IStrategy):
-    def __init__(self, symbols, fast=5, slow=10):
+    # signals()가 exact 지표 경로라 on_candle/generate와 비트 단위 같은 신호 → 벡터 백테스트 허용
+    exact_signals = True
+
+    def __init__(self, symbols, fast=5, slow=10, qty=0.001, cache: IndicatorCache | None = None):
         self.name = "sma_cross"
         self.symbols = symbols
         self.fast = fast
         self.slow = slow
+        self.qty = qty
+        self.cache = cache  # 지정하면 signals()의 SMA를 캐시에서 공유
+        self._state: dict[str, _SmaState] = {}
 
     def on_start(self):
-        pass
+        self._state.clear()
+
+    def signals(self, closes: Sequence[float]) -> list[int]:
+        """전체 종가 → 봉별 신호 (generate(candles[:i+1])의 신호와 동일)"""
+        values = list(closes)
+        if self.cache is not None:
+            f = self.cache.sma(values, self.fast)
+            s = self.cache.sma(values, self.slow)
+        else:
+            f = sma(values, self.fast, exact=True)
+            s = sma(values, self.slow, exact=True)
+        sig = [0] * len(values)
+        for i in range(self.slow, len(values)):
+            if f[i - 1] <= s[i - 1] and f[i] > s[i]:
+                sig[i] = 1
+            elif f[i - 1] >= s[i - 1] and f[i] < s[i]:
+                sig[i] = -1
+        return sig
 
     def generate(self, candles: dict[str, Iterable[Candle]]):
         orders: list[OrderRequest] = []
         for sym in self.symbols:
-            cs = list(candles[sym])
-            closes = [c.c for c in cs]
-            f = sma(closes, self.fast)
-            s = sma(closes, self.slow)
+            closes = closes_of(candles.get(sym, []))
             if len(closes) < self.slow + 1:
                 continue
-            if f[-2] <= s[-2] and f[-1] > s[-1]:
-                orders.append(OrderRequest.market(sym, "buy", 0.001))
-            elif f[-2] >= s[-2] and f[-1] < s[-1]:
-                orders.append(OrderRequest.market(sym, "sell", 0.001))
+            sig = self.signals(closes)
+            if sig[-1] == 1:
+                orders.append(OrderRequest.market(sym, "buy", self.qty))
+            elif sig[-1] == -1:
+                orders.append(OrderRequest.market(sym, "sell", self.qty))
         return orders
+
+    def on_candle(self, sym: str, candle: Candle) -> list[OrderRequest]:
+        """스트리밍 경로: generate(candles[:i])와 같은 주문을 O(1)로 계산."""
+        st = self._state.get(sym)
+        if st is None:
+            st = self._state[sym] = _SmaState(SMA(self.fast), SMA(self.slow))
+        f0, s0 = st.f, st.s
+        st.f = st.fast.update(candle.c)
+        st.s = st.slow.update(candle.c)
+        if st.slow.n < self.slow + 1:
+            return []
+        if f0 <= s0 and st.f > st.s:
+            return [OrderRequest.market(sym, "buy", self.qty)]
+        if f0 >= s0 and st.f < st.s:
+            return [OrderRequest.market(sym, "sell", self.qty)]
+        return []
@@ -0,0 +1,184 @@
+import asyncio
+import json
+import logging
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+import requests
+
+from autotrade.data.candles import AsyncCandleService
+from autotrade.exchanges.ratelimit import RateLimiter
+from autotrade.exchanges.upbit import UpbitClient, UpbitCreds
+from autotrade.exchanges.upbit_async import AsyncUpbitClient
+from autotrade.execution.executor import AsyncExecutor
+from autotrade.execution.risk import RiskManager
+from autotrade.live import fetch_all
+from autotrade.models.order import Order, OrderRequest
+
+ROWS = json.loads((Path(__file__).parent / "data" / "upbit_candles_krw-btc_1m.json").read_text())
+SYMBOLS = [f"KRW-C{i:02d}" for i in range(24)]
+DELAY = 0.2
+
+
+def _transport(calls: list, fail: str | None = None) -> httpx.MockTransport:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        await asyncio.sleep(DELAY)  # 느린 거래소 응답
+        if request.url.path.endswith("/ticker"):
+            markets = request.url.params["markets"].split(",")
+            return httpx.Response(200, json=[{"market": m, "trade_price": 123.0} for m in markets])
+        if request.url.params["market"] == fail:
+            return httpx.Response(500)
+        return httpx.Response(200, json=ROWS[: int(request.url.params["count"])])
+
+    return httpx.MockTransport(handler)
+
+
+def _client(calls: list, fail: str | None = None) -> AsyncUpbitClient:
+    return AsyncUpbitClient(
+        client=httpx.AsyncClient(transport=_transport(calls, fail)),
+        limiter=RateLimiter({"quotation": 100}),  # 동시성만 보도록 한도는 넉넉히
+    )
+
+
+class _Resp:
+    status_code = 200
+    headers: dict = {}
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return ROWS
+
+
+class _Session:
+    def get(self, url, params=None, timeout=None):
+        return _Resp()
+
+
+def test_candles_match_sync_client():
+    async def run():
+        calls: list = []
+        async with _client(calls) as c:
+            frame = await c.get_candles("KRW-BTC", "1m", limit=5, to=1_704_067_500)
+        return frame, calls[0]
+
+    frame, req = asyncio.run(run())
+    sync = UpbitClient(session=_Session()).get_candles("KRW-BTC", "1m", limit=5)
+    assert list(frame) == list(sync)
+    assert req.url.path == "/v1/candles/minutes/1"
+    assert req.url.params["to"] == "2024-01-01 00:05:00"
+
+
+def test_fetch_all_runs_symbols_concurrently():
+    async def run():
+        calls: list = []
+        async with _client(calls, fail="KRW-C03") as c:
+            feed = AsyncCandleService(c, clock=lambda: 1_704_067_500)
+            t0 = time.perf_counter()
+            out = await fetch_all(feed, SYMBOLS, "1m", 5)
+            return out, time.perf_counter() - t0, feed
+
+    out, elapsed, feed = asyncio.run(run())
+    # 직렬이면 24 * 0.2s = 4.8s
+    assert elapsed < DELAY * 5
+    assert set(out) == set(SYMBOLS) - {"KRW-C03"}
+    assert all(len(f) == 5 for f in out.values())
+    assert feed.requests == len(SYMBOLS) - 1
+
+
+def test_dry_run_order_uses_ticker():
+    async def run():
+        calls: list = []
+        async with _client(calls) as c:
+            order = await c.create_order(OrderRequest.market("KRW-BTC", "buy", 10000))
+        return order, calls
+
+    order, calls = asyncio.run(run())
+    assert order.id.startswith("DRY-") and order.price == 123.0
+    assert [r.method for r in calls] == ["GET"]
+
+
+def test_concurrent_orders_share_one_ticker_request():
+    syms = ["KRW-BTC", "KRW-ETH", "KRW-XRP"]
+    reqs = [OrderRequest.market(syms[i % 3], "buy", 1.0) for i in range(12)]
+
+    async def run():
+        calls: list = []
+        async with _client(calls) as c:
+            first = await asyncio.gather(*(c.create_order(r) for r in reqs))
+            again = await asyncio.gather(*(c.create_order(r) for r in reqs))  # ticker_ttl 안
+            return first + again, calls, c.cache
+
+    orders, calls, cache = asyncio.run(run())
+    assert len(calls) == 1  # 주문 24개, 심볼 3개 → /ticker 1번
+    assert sorted(calls[0].url.params["markets"].split(",")) == sorted(syms)
+    assert [o.symbol for o in orders] == [r.symbol for r in reqs] * 2
+    assert all(o.price == 123.0 for o in orders)
+    assert (cache.misses, cache.hits) == (3, 3)
+
+
+def test_concurrent_same_candles_are_coalesced():
+    async def run():
+        calls: list = []
+        async with _client(calls) as c:
+            frames = await asyncio.gather(*(c.get_candles("KRW-BTC", "1m", limit=5) for _ in range(6)))
+            return frames, calls, c.cache
+
+    frames, calls, cache = asyncio.run(run())
+    assert len(calls) == 1 and cache.coalesced == 5
+    assert all(list(f) == list(frames[0]) for f in frames)
+
+
+def test_executor_keeps_successful_orders_when_one_fails(caplog):
+    class _Exchange:
+        async def create_order(self, req):
+            if req.symbol == "KRW-BAD":
+                raise httpx.ConnectError("down")
+            return Order(id=f"X-{req.symbol}", symbol=req.symbol, side=req.side, qty=req.qty, price=1.0)
+
+    orders = [OrderRequest.market(s, "buy", 1.0) for s in ("KRW-A", "KRW-BAD", "KRW-B")]
+    with caplog.at_level(logging.ERROR, logger="executor"):
+        execu = AsyncExecutor(_Exchange())
+        execu.risk = RiskManager(max_orders=5, min_qty=0.0001, cooldown_s=0)
+        executed = asyncio.run(execu.submit(orders))
+    assert [o.symbol for o in executed] == ["KRW-A", "KRW-B"]
+    assert "KRW-BAD" in caplog.text and "down" in caplog.text
+
+
+class _PostSession:
+    """POST마다 정해 둔 상태 코드를 차례로 돌려주는 requests.Session 대역"""
+
+    def __init__(self, *statuses):
+        self.statuses = list(statuses)
+        self.posts = 0
+
+    def post(self, url, params=None, headers=None, timeout=None):
+        self.posts += 1
+        r = requests.Response()
+        r.status_code = self.statuses.pop(0)
+        r._content = b'{"uuid": "U-1"}'
+        r.url = url
+        return r
+
+
+@pytest.mark.parametrize(
+    "statuses, posts", [((400,), 1), ((503, 429, 200), 3)]
+)
+def test_sync_post_retries_only_429_and_5xx(monkeypatch, statuses, posts):
+    monkeypatch.setattr(time, "sleep", lambda s: None)
+    sess = _PostSession(*statuses)
+    c = UpbitClient(
+        creds=UpbitCreds("k", "s"),
+        session=sess,
+        limiter=RateLimiter({"order": 100}),
+    )
+    if statuses[-1] >= 400:
+        with pytest.raises(requests.HTTPError):
+            c._post("/orders", {"market": "KRW-BTC"})
+    else:
+        assert c._post("/orders", {"market": "KRW-BTC"}) == {"uuid": "U-1"}
+    assert sess.posts == posts
@@ -0,0 +1,109 @@
+import calendar
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+import requests
+
+from autotrade.data.csv_loader import load_candles_csv
+from autotrade.data.downloader import backfill_candles
+from autotrade.exchanges.upbit import UpbitClient
+
+T0 = calendar.timegm((2024, 1, 1, 0, 0, 0))
+N = 450
+
+
+def _record(i: int) -> dict:
+    ts = T0 + i * 60
+    p = 50_000_000.0 + i
+    return {
+        "market": "KRW-BTC",
+        "candle_date_time_utc": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(ts)),
+        "opening_price": p,
+        "high_price": p + 5,
+        "low_price": p - 5,
+        "trade_price": p + 1,
+        "candle_acc_trade_volume": 0.5,
+        "_ts": ts,
+    }
+
+
+# 녹화된 분봉 (Upbit 응답 형식)
+RECORDED = [_record(i) for i in range(N)]
+
+
+class _Upbit(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        srv = self.server
+        srv.requests.append(self.path)
+        if srv.fail_at is not None and len(srv.requests) == srv.fail_at:
+            self.send_response(500)
+            self.end_headers()
+            return
+        q = parse_qs(urlparse(self.path).query)
+        count = int(q["count"][0])
+        to = (
+            calendar.timegm(time.strptime(q["to"][0], "%Y-%m-%d %H:%M:%S"))
+            if "to" in q
+            else T0 + N * 60
+        )
+        rows = [r for r in RECORDED if r["_ts"] < to][::-1][:count]  # 최신순
+        body = json.dumps([{k: v for k, v in r.items() if k != "_ts"} for r in rows])
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.end_headers()
+        self.wfile.write(body.encode())
+
+
+@pytest.fixture
+def server():
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), _Upbit)
+    srv.requests = []
+    srv.fail_at = None
+    th = threading.Thread(target=srv.serve_forever, daemon=True)
+    th.start()
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+
+
+def _client(srv) -> UpbitClient:
+    return UpbitClient(base_url=f"http://127.0.0.1:{srv.server_address[1]}/v1")
+
+
+def test_backfill_walks_pages_backwards(server, tmp_path: Path):
+    out = tmp_path / "btc.csv"
+    start = T0 + 30 * 60
+    backfill_candles(_client(server), "KRW-BTC", "1m", start_ts=start, out_path=str(out), sleep_s=0)
+
+    frame = load_candles_csv(str(out))
+    assert frame.ts.tolist() == [T0 + i * 60 for i in range(30, N)]
+    assert frame.c[0] == RECORDED[30]["trade_price"]
+    assert len(server.requests) == 3  # 200 + 200 + 50
+    assert not (tmp_path / "btc.csv.part").exists()
+    assert not (tmp_path / "btc.csv.backfill.json").exists()
+
+
+def test_backfill_resumes_from_checkpoint(server, tmp_path: Path):
+    out = tmp_path / "btc.csv"
+    kw = dict(start_ts=T0, out_path=str(out), sleep_s=0)
+    server.fail_at = 2
+    with pytest.raises(requests.HTTPError):
+        backfill_candles(_client(server), "KRW-BTC", "1m", **kw)
+    ckpt = json.loads((tmp_path / "btc.csv.backfill.json").read_text())
+    assert ckpt["pages"] == 1 and ckpt["rows"] == 200
+
+    server.fail_at = None
+    server.requests.clear()
+    backfill_candles(_client(server), "KRW-BTC", "1m", **kw)
+    # 첫 페이지는 다시 받지 않음
+    assert "to=" in server.requests[0]
+    assert len(server.requests) == 2
+    assert load_candles_csv(str(out)).ts.tolist() == [r["_ts"] for r in RECORDED]
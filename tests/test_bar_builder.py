@@ -0,0 +1,98 @@
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+from autotrade.data.bars import BarBuilder, stream_bars
+from autotrade.exchanges.upbit import UpbitClient
+from autotrade.exchanges.upbit_ws import parse_message
+from autotrade.models.market import Candle, Trade
+
+DATA = Path(__file__).parent / "data"
+_LINES = (DATA / "upbit_ws_messages.jsonl").read_text(encoding="utf-8").splitlines()
+TRADES = [m for m in map(parse_message, map(json.loads, _LINES)) if isinstance(m, Trade)]
+T0 = 1_704_067_200
+
+
+class _Resp:
+    status_code = 200
+    headers: dict = {}
+
+    def __init__(self, payload):
+        self.payload = payload
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.payload
+
+
+class _Session:
+    """녹화된 /candles/minutes/1 응답을 돌려주는 requests.Session 대역"""
+
+    def get(self, url, params=None, timeout=None):
+        assert url.endswith("/candles/minutes/1") and params["market"] == "KRW-BTC"
+        rows = json.loads((DATA / "upbit_candles_krw-btc_1m.json").read_text())
+        return _Resp(rows[: int(params["count"])])
+
+
+def _build(trades, interval="1m", symbol="KRW-BTC"):
+    b = BarBuilder(interval)
+    bars = []
+    for t in trades:
+        bars += b.update(t)
+    bars += b.flush()
+    return [c for s, c in bars if s == symbol]
+
+
+def test_matches_upbit_candles_for_recorded_trades():
+    rest = list(UpbitClient(session=_Session()).get_candles("KRW-BTC", "1m", limit=200))
+    local = _build(TRADES)
+    assert [c.ts for c in local] == [c.ts for c in rest]
+    for a, b in zip(local, rest):
+        assert (a.o, a.hi, a.lo, a.c) == (b.o, b.hi, b.lo, b.c)
+        assert a.v == pytest.approx(b.v, rel=1e-9)
+
+
+def test_boundary_tick_closes_bar_without_next_trade():
+    got = []
+    b = BarBuilder("1m", on_bar=lambda s, c: got.append((s, c)))
+    b.update(Trade("X", (T0 + 5) * 1000, 10.0, 1.0, "buy"))
+    b.update(Trade("X", (T0 + 30) * 1000, 12.0, 2.0, "sell"))
+    assert b.peek("X") == Candle(T0, 10.0, 12.0, 10.0, 12.0, 3.0)
+    assert b.tick((T0 + 59) * 1000 + 999) == []
+    closed = b.tick((T0 + 60) * 1000)
+    assert closed == [("X", Candle(T0, 10.0, 12.0, 10.0, 12.0, 3.0))] == got
+    assert b.peek("X") is None
+    # 이미 닫힌 구간의 늦은 체결은 버림
+    assert b.update(Trade("X", (T0 + 50) * 1000, 99.0, 1.0, "buy")) == []
+    assert b.late == 1
+
+
+def test_symbols_are_independent_and_intervals_align():
+    bars = _build(TRADES, "3m", "KRW-ETH")
+    eth = [t for t in TRADES if t.symbol == "KRW-ETH"]
+    assert [c.ts % 180 for c in bars] == [0] * len(bars)
+    assert sum(c.v for c in bars) == pytest.approx(sum(t.volume for t in eth))
+    assert bars[0].o == eth[0].price and bars[-1].c == eth[-1].price
+
+
+def test_stream_bars_closes_on_clock():
+    now = [T0 + 10.0]
+
+    async def source():
+        yield Trade("X", (T0 + 1) * 1000, 5.0, 1.0, "buy")
+        yield Trade("X", (T0 + 2) * 1000, 6.0, 1.0, "buy")
+        now[0] = T0 + 61.0  # 다음 체결 없이 경계가 지남
+        await asyncio.sleep(1)
+
+    async def run():
+        out = []
+        async for bar in stream_bars(source(), BarBuilder("1m"), clock=lambda: now[0], tick_s=0.01):
+            out.append(bar)
+            break
+        return out
+
+    assert asyncio.run(run()) == [("X", Candle(T0, 5.0, 6.0, 5.0, 6.0, 2.0))]
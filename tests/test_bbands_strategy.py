@@ -1,3 +1,5 @@
+from autotrade.backtest.broker import PaperBroker, Portfolio
+from autotrade.backtest.engine import simulate_streaming
 from autotrade.models.market import Candle
 from autotrade.strategies.bbands import BBandsStrategy
 
@@ -36,3 +38,13 @@ def test_bbands_instantiation_and_generate():
     )
     orders = strat.generate({"BTC/USDT": candles})
     assert isinstance(orders, list)
+
+
+def test_flat_decimal_prices_only_signal_after_steps():
+    closes = [0.1] * 300 + [0.3] * 300 + [0.7] * 300
+    candles = [Candle(ts=i, o=c, hi=c, lo=c, c=c, v=1.0) for i, c in enumerate(closes)]
+    strat = BBandsStrategy(symbols=["X"], window=20, k=2.0, use_crossover=False)
+    strat.on_start()
+    fills = simulate_streaming(strat, "X", candles, 1, PaperBroker(), Portfolio(cash=10_000.0))
+    # 계단 직후 window 봉 안에서만 신호 (평탄한 창에서는 종가 == 평균, std == 0)
+    assert fills and all(f.ts % 300 < 20 for f in fills)
@@ -0,0 +1,78 @@
+import random
+
+import numpy as np
+
+from autotrade.backtest.broker import PaperBroker, Portfolio
+from autotrade.backtest.engine import _column, simulate
+from autotrade.data.csv_loader import load_candles_csv
+from autotrade.exchanges.fake import FakeExchange
+from autotrade.models.market import Candle, CandleFrame, closes_of
+from autotrade.strategies.macd import MACDStrategy
+from autotrade.strategies.sma_cross import SmaCross
+
+SYM = "KRW-BTC"
+
+
+def _candles(n: int = 300, seed: int = 3) -> list[Candle]:
+    rnd = random.Random(seed)
+    p = 100.0
+    out = []
+    for i in range(n):
+        p *= 1.0 + rnd.uniform(-0.01, 0.01)
+        out.append(Candle(ts=i * 60, o=p, hi=p * 1.001, lo=p * 0.999, c=p, v=1.0 + i))
+    return out
+
+
+def test_frame_roundtrip_and_views():
+    candles = _candles()
+    frame = CandleFrame.from_candles(candles)
+    assert len(frame) == len(candles)
+    assert list(frame) == candles
+    assert frame[10] == candles[10]
+    assert frame[-1] == candles[-1]
+    assert closes_of(frame) == [c.c for c in candles]
+
+    # 슬라이스는 같은 버퍼를 공유하는 뷰
+    view = frame[5:50]
+    assert isinstance(view, CandleFrame)
+    assert list(view) == candles[5:50]
+    assert view.c.obj is frame.c.obj
+    assert frame.c.nbytes == 8 * len(candles)
+
+
+def test_numpy_column_shares_buffer():
+    frame = CandleFrame.from_candles(_candles())
+    closes = _column(frame, "c", np.float64)
+    assert np.shares_memory(closes, np.asarray(frame.c))
+    assert _column(frame[7:20], "ts", np.int64).tolist() == [i * 60 for i in range(7, 20)]
+
+
+def test_simulate_same_fills_for_frame_and_list():
+    candles = _candles()
+    frame = CandleFrame.from_candles(candles)
+    for make in (
+        lambda: SmaCross(symbols=[SYM], fast=3, slow=8),
+        lambda: MACDStrategy(symbols=[SYM], fast=5, slow=13, signal=4),
+    ):
+        pf_a, pf_b = Portfolio(cash=10_000.0), Portfolio(cash=10_000.0)
+        a = simulate(make(), SYM, candles, 20, PaperBroker(), pf_a)
+        b = simulate(make(), SYM, frame, 20, PaperBroker(), pf_b)
+        assert a and a == b
+        assert pf_a == pf_b
+
+
+def test_csv_loader_returns_sorted_frame(tmp_path):
+    p = tmp_path / "c.csv"
+    p.write_text("ts,o,hi,lo,c,v\n120,3,3,3,3,1\n60,2,2,2,2,1\n180,4,4,4,4,1\n")
+    frame = load_candles_csv(str(p))
+    assert isinstance(frame, CandleFrame)
+    assert frame.ts.tolist() == [60, 120, 180]
+    assert closes_of(frame) == [2.0, 3.0, 4.0]
+
+
+def test_fake_exchange_returns_frame():
+    frame = FakeExchange(seed=1).get_candles(SYM, "1m", limit=30)
+    assert isinstance(frame, CandleFrame)
+    assert len(frame) == 30
+    ts = frame.ts.tolist()
+    assert ts == sorted(ts)
@@ -0,0 +1,77 @@
+import pytest
+
+from autotrade.data.candles import CandleRing, CandleService
+from autotrade.models.market import Candle, CandleFrame
+
+T0 = 1_704_067_200
+
+
+def _bar(i: int, c: float | None = None) -> Candle:
+    p = 100.0 + i if c is None else c
+    return Candle(T0 + i * 60, p, p + 1, p - 1, p, 1.0)
+
+
+class _Exchange:
+    """now 분까지의 1분봉을 돌려주는 거래소 대역 (마지막 봉은 진행 중: 종가가 바뀜)"""
+
+    def __init__(self):
+        self.now = 100  # 분
+        self.tick = 0.0
+        self.limits: list[int] = []
+
+    def clock(self) -> float:
+        return T0 + self.now * 60 + 30
+
+    def get_candles(self, symbol, interval, limit=200, to=None):
+        self.limits.append(limit)
+        bars = [_bar(i) for i in range(self.now - limit + 1, self.now + 1)]
+        bars[-1] = _bar(self.now, 100.0 + self.now + self.tick)
+        return CandleFrame.from_candles(bars)
+
+
+def test_ring_wraps_and_view_is_contiguous():
+    r = CandleRing(4)
+    assert len(r.view()) == 0 and r.last_ts is None
+    r.extend(_bar(i) for i in range(3))
+    assert [c.ts for c in r.view()] == [_bar(i).ts for i in range(3)]
+    r.extend(_bar(i) for i in range(3, 10))
+    v = r.view()
+    assert list(v) == [_bar(i) for i in range(6, 10)]
+    assert v.c.contiguous and v.c.obj is r.view().c.obj  # 같은 버퍼를 가리키는 뷰
+    # 마지막 봉 제자리 갱신, 더 오래된 봉 무시
+    assert r.append(_bar(9, 1.5))
+    assert not r.append(_bar(7))
+    assert list(r.view()) == [_bar(6), _bar(7), _bar(8), _bar(9, 1.5)]
+    with pytest.raises(ValueError):
+        CandleRing(0)
+
+
+def test_service_fetches_only_new_bars():
+    ex = _Exchange()
+    svc = CandleService(ex, clock=ex.clock)
+    first = svc.fetch("KRW-BTC", "1m", 60)
+    assert list(first) == [_bar(i) for i in range(41, 101)]
+    assert ex.limits == [60]
+
+    # 같은 분 안에서 다시: 진행 중 봉 1개만, 제자리 갱신
+    ex.tick = 0.5
+    again = svc.fetch("KRW-BTC", "1m", 60)
+    assert ex.limits[-1] == 1
+    assert again[-1].c == 200.5 and len(again) == 60 and again[0] == _bar(41)
+
+    # 3분 경과: 이전 마지막 봉(확정) + 새 봉 3개
+    ex.now, ex.tick = 103, 0.0
+    later = svc.fetch("KRW-BTC", "1m", 60)
+    assert ex.limits[-1] == 4
+    assert list(later) == [_bar(i) for i in range(44, 104)]
+    assert (svc.requests, svc.rows) == (3, 65)
+
+    # 오래 멈췄다 재개하면 window까지만 요청
+    ex.now = 1000
+    assert list(svc.fetch("KRW-BTC", "1m", 60)) == [_bar(i) for i in range(941, 1001)]
+    assert ex.limits[-1] == 60
+
+    # 더 짧은 window는 같은 버퍼의 꼬리, 더 긴 window는 다시 워밍업
+    assert len(svc.fetch("KRW-BTC", "1m", 10)) == 10
+    assert len(svc.fetch("KRW-BTC", "1m", 120)) == 120
+    assert ex.limits[-1] == 120
@@ -0,0 +1,81 @@
+from pathlib import Path
+
+import pytest
+import yaml
+from typer.testing import CliRunner
+
+from autotrade.backtest.engine import load_batches
+from autotrade.cli import app
+from autotrade.data.csv_loader import load_candles_csv
+from autotrade.data.store import csv_to_store, open_store, store_to_csv, write_store
+from autotrade.models.market import Candle
+from autotrade.settings import Settings
+
+
+def _candles(n: int = 50) -> list[Candle]:
+    return [
+        Candle(ts=1_700_000_000 + i * 60, o=100 + i / 3, hi=101 + i, lo=99 - i, c=100.1 * i, v=0.5)
+        for i in range(n)
+    ]
+
+
+def test_roundtrip_and_range_lookup(tmp_path: Path):
+    candles = _candles()
+    store = write_store(tmp_path / "btc.candles", candles)
+    frame = open_store(store)
+    assert list(frame) == candles
+
+    t0 = candles[10].ts
+    t1 = candles[19].ts
+    assert list(frame.between(t0, t1)) == candles[10:20]
+    assert list(frame.between(t0 + 1, t1 - 1)) == candles[11:19]
+    assert list(frame.between(start_ts=candles[-3].ts)) == candles[-3:]
+    assert len(frame.between(end_ts=candles[0].ts - 1)) == 0
+
+
+def test_csv_conversion_is_lossless(tmp_path: Path):
+    candles = _candles()
+    store = write_store(tmp_path / "a.candles", candles)
+    csv_path = store_to_csv(store, tmp_path / "a.csv")
+    assert list(load_candles_csv(str(csv_path))) == candles
+    store2 = csv_to_store(str(csv_path), tmp_path / "b.candles")
+    assert list(open_store(store2)) == candles
+
+
+def test_empty_store(tmp_path: Path):
+    frame = open_store(write_store(tmp_path / "e.candles", []))
+    assert len(frame) == 0
+
+
+def test_rejects_unsorted_and_truncated(tmp_path: Path):
+    candles = _candles(5)
+    with pytest.raises(ValueError):
+        write_store(tmp_path / "u.candles", list(reversed(candles)))
+    store = write_store(tmp_path / "t.candles", candles)
+    (store / "c.f8").write_bytes(b"\0" * 8)
+    with pytest.raises(ValueError):
+        open_store(store)
+
+
+def test_backtest_reads_store_from_directory(tmp_path: Path):
+    candles = _candles()
+    write_store(tmp_path / "KRW-BTC.candles", candles)
+    cfg = tmp_path / "cfg.yaml"
+    cfg.write_text(
+        yaml.safe_dump(
+            {
+                "strategy": {"name": "sma_cross", "params": {}, "symbols": ["KRW-BTC"]},
+                "data": {"interval": "1m", "window": 10, "csv": str(tmp_path)},
+            }
+        )
+    )
+    batches = load_batches(Settings.load(str(cfg)))
+    assert list(batches["KRW-BTC"]) == candles
+
+
+def test_cli_convert(tmp_path: Path):
+    store = write_store(tmp_path / "x.candles", _candles())
+    out = tmp_path / "x.csv"
+    result = CliRunner().invoke(app, ["convert", str(store), str(out)])
+    assert result.exit_code == 0, result.output
+    assert out.read_text(encoding="utf-8").splitlines()[0] == "ts,o,hi,lo,c,v"
@@ -0,0 +1,105 @@
+import json
+import logging
+from pathlib import Path
+
+import pytest
+
+from autotrade.data import csv_index
+from autotrade.data.csv_loader import CsvLoadStats, load_candles_csv
+from autotrade.data.downloader import download_candles
+from autotrade.models.market import Candle
+
+
+class _Pages:
+    """get_candles가 미리 정한 ts 목록을 차례로 돌려주는 거래소 스텁"""
+
+    name = "stub"
+
+    def __init__(self, *pages):
+        self.pages = list(pages)
+
+    def get_candles(self, symbol, interval, limit=200, to=None):
+        return [Candle(ts, 1.0, 1.0, 1.0, float(ts), 1.0) for ts in self.pages.pop(0)]
+
+
+def _minutes(a: int, b: int) -> list[int]:
+    return [i * 60 for i in range(a, b)]
+
+
+def test_append_dedup_uses_index_without_rescanning(tmp_path: Path, monkeypatch):
+    out = tmp_path / "c.csv"
+    ex = _Pages(_minutes(0, 10), _minutes(5, 15), _minutes(12, 20))
+    download_candles(ex, "KRW-BTC", "1m", out_path=str(out), mode="a")
+
+    def no_scan(*args, **kwargs):
+        raise AssertionError("index should not be rebuilt")
+
+    monkeypatch.setattr(csv_index, "rebuild_index", no_scan)
+    download_candles(ex, "KRW-BTC", "1m", out_path=str(out), mode="a")
+    download_candles(ex, "KRW-BTC", "1m", out_path=str(out), mode="a")
+
+    assert load_candles_csv(str(out)).ts.tolist() == _minutes(0, 20)
+    idx = json.loads((tmp_path / "c.csv.idx.json").read_text())
+    assert (idx["count"], idx["first_ts"], idx["last_ts"], idx["missing"]) == (20, 0, 19 * 60, 0)
+
+
+def test_stale_index_is_rebuilt(tmp_path: Path):
+    out = tmp_path / "c.csv"
+    download_candles(_Pages(_minutes(0, 5)), "KRW-BTC", "1m", out_path=str(out), mode="w")
+    # 다른 도구가 파일을 직접 수정
+    with out.open("a") as f:
+        f.write("300,1,1,1,1,1\n360,1,1,1,1,1\n")
+    download_candles(_Pages(_minutes(5, 9)), "KRW-BTC", "1m", out_path=str(out), mode="a")
+    assert load_candles_csv(str(out)).ts.tolist() == _minutes(0, 9)
+
+    (tmp_path / "c.csv.idx.json").unlink()
+    idx = csv_index.load_index(out, 60)
+    assert (idx.count, idx.last_ts) == (9, 8 * 60)
+
+
+def test_gaps_are_reported_and_counted(tmp_path: Path, caplog):
+    out = tmp_path / "c.csv"
+    download_candles(_Pages(_minutes(0, 3)), "KRW-BTC", "1m", out_path=str(out), mode="w")
+    with caplog.at_level(logging.WARNING, logger="download"):
+        download_candles(
+            _Pages([600, 660, 900]), "KRW-BTC", "1m", out_path=str(out), mode="a"
+        )
+    assert "2 gap(s), 10 missing bar(s)" in caplog.text
+    assert csv_index.load_index(out, 60).missing == 10
+
+
+@pytest.mark.parametrize("content", ["{not json", '{"version": 1, "step": 60, "bogus": 1}'])
+def test_corrupt_index_is_rebuilt(tmp_path: Path, content: str):
+    out = tmp_path / "c.csv"
+    download_candles(_Pages(_minutes(0, 4)), "KRW-BTC", "1m", out_path=str(out), mode="w")
+    (tmp_path / "c.csv.idx.json").write_text(content)
+    assert csv_index.load_index(out, 60).count == 4
+
+
+def test_fresh_ascending_index_enables_early_exit(tmp_path: Path):
+    out = tmp_path / "c.csv"
+    download_candles(_Pages(_minutes(0, 50)), "KRW-BTC", "1m", out_path=str(out), mode="a")
+    assert csv_index.known_ascending(out)
+    st = CsvLoadStats()
+    assert load_candles_csv(str(out), end_ts=9 * 60, stats=st).ts.tolist() == _minutes(0, 10)
+    assert st.rows == 11
+
+    # 다른 도구가 뒤에 과거 행을 붙이면 인덱스가 낡아 끝까지 읽음
+    with out.open("a", encoding="utf-8") as f:
+        f.write("60,1,1,1,1,1\n")
+    assert not csv_index.known_ascending(out)
+    assert load_candles_csv(str(out), end_ts=9 * 60).ts.tolist() == sorted(_minutes(0, 10) + [60])
+    idx = csv_index.load_index(out, 60)
+    assert not idx.ascending
+
+
+def test_append_dedup_on_unsorted_file_uses_all_stored_ts(tmp_path: Path):
+    out = tmp_path / "c.csv"
+    download_candles(_Pages(_minutes(0, 10)), "KRW-BTC", "1m", out_path=str(out), mode="w")
+    # 다른 도구가 과거 행을 뒤에 붙임 → 마지막 행 ts(60)가 최대가 아님
+    with out.open("a", encoding="utf-8") as f:
+        f.write("60,1,1,1,1,1\n")
+    download_candles(_Pages(_minutes(5, 15)), "KRW-BTC", "1m", out_path=str(out), mode="a")
+    ts = load_candles_csv(str(out)).ts.tolist()
+    assert sorted(set(ts)) == _minutes(0, 15)
+    assert len(ts) == 16  # 5~9분은 다시 쓰지 않음 (60은 기존 중복 그대로)
@@ -0,0 +1,75 @@
+import logging
+from pathlib import Path
+
+from autotrade.data.csv_loader import (
+    CsvLoadStats,
+    iter_candle_chunks,
+    iter_candles_csv,
+    load_candles_csv,
+)
+
+
+def _write(tmp_path: Path, rows: list[str], header: str = "ts,o,hi,lo,c,v") -> str:
+    p = tmp_path / "c.csv"
+    p.write_text("\n".join([header, *rows]) + "\n", encoding="utf-8")
+    return str(p)
+
+
+def _rows(ts_list) -> list[str]:
+    return [f"{t},{t}.5,{t}.9,{t}.1,{t}.25,1" for t in ts_list]
+
+
+def test_positional_columns_and_chunks(tmp_path: Path):
+    # 열 순서가 달라도 헤더 기준으로 읽음
+    path = _write(
+        tmp_path, [f"1,{t},{t}.5,{t}.9,{t}.1,{t}.25" for t in range(10)], "v,ts,o,hi,lo,c"
+    )
+    chunks = list(iter_candle_chunks(path, chunk_size=4))
+    assert [len(c) for c in chunks] == [4, 4, 2]
+    candles = [c for ch in chunks for c in ch]
+    assert [c.ts for c in candles] == list(range(10))
+    assert candles[3].c == 3.25 and candles[3].v == 1.0
+
+
+def test_range_and_limit_filters(tmp_path: Path):
+    path = _write(tmp_path, _rows(range(0, 1000, 10)))
+    st = CsvLoadStats()
+    frame = load_candles_csv(path, start_ts=200, end_ts=300, stats=st, assume_sorted=True)
+    assert frame.ts.tolist() == list(range(200, 301, 10))
+    # 오름차순으로 알려진 파일은 end_ts를 넘는 첫 행에서 멈춤
+    assert st.rows == 32
+    st = CsvLoadStats()
+    assert load_candles_csv(path, start_ts=200, end_ts=300, stats=st).ts.tolist() == frame.ts.tolist()
+    assert st.rows == 100  # 정렬 여부를 모르면 끝까지
+    assert load_candles_csv(path, start_ts=500, limit=3).ts.tolist() == [500, 510, 520]
+    assert [c.ts for c in iter_candles_csv(path, end_ts=20)] == [0, 10, 20]
+
+
+def test_sorts_only_when_needed(tmp_path: Path):
+    st = CsvLoadStats()
+    frame = load_candles_csv(_write(tmp_path, _rows([30, 10, 20])), stats=st)
+    assert not st.ascending
+    assert frame.ts.tolist() == [10, 20, 30]
+    assert frame.c.tolist() == [10.25, 20.25, 30.25]
+
+    st2 = CsvLoadStats()
+    load_candles_csv(_write(tmp_path, _rows([10, 10, 20])), stats=st2)
+    assert st2.ascending
+
+
+def test_unsorted_file_keeps_rows_after_end_ts(tmp_path: Path):
+    path = _write(tmp_path, _rows([1, 2, 10, 3]))
+    assert load_candles_csv(path, end_ts=5).ts.tolist() == [1, 2, 3]
+    assert [c.ts for c in iter_candles_csv(path, end_ts=5)] == [1, 2, 3]
+
+
+def test_malformed_rows_are_counted_and_logged(tmp_path: Path, caplog):
+    rows = _rows([1, 2]) + ["x,1,1,1,1,1", "3,1,1,1"] + _rows([4]) + ["", "5,1,nan?,1,1,1"]
+    path = _write(tmp_path, rows)
+    st = CsvLoadStats()
+    with caplog.at_level(logging.WARNING, logger="data"):
+        frame = load_candles_csv(path, stats=st)
+    assert frame.ts.tolist() == [1, 2, 4]
+    assert st.malformed == 3
+    assert st.first_bad_line == 4
+    assert "3 malformed rows" in caplog.text
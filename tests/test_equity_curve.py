@@ -0,0 +1,77 @@
+import random
+
+import numpy as np
+import pytest
+
+from autotrade.backtest.broker import PaperBroker, Portfolio
+from autotrade.backtest.engine import (
+    simulate_merged,
+    simulate_rolling,
+    simulate_streaming,
+    simulate_vectorized,
+)
+from autotrade.backtest.equity import EquityCurve
+from autotrade.models.market import Candle
+from autotrade.strategies.macd import MACDStrategy
+
+SYM = "KRW-BTC"
+
+
+def _candles(n: int = 300, seed: int = 5, offset: int = 0) -> list[Candle]:
+    rnd = random.Random(seed)
+    p = 100.0
+    out = []
+    for i in range(n):
+        p *= 1.0 + rnd.uniform(-0.01, 0.01)
+        out.append(Candle(ts=offset + i * 60, o=p, hi=p, lo=p, c=p, v=1.0))
+    return out
+
+
+def _strat():
+    return MACDStrategy(symbols=[SYM], fast=5, slow=13, signal=4, qty=10.0)
+
+
+@pytest.mark.parametrize(
+    "run", [simulate_rolling, simulate_streaming, simulate_vectorized]
+)
+def test_curve_tracks_real_path(run):
+    candles = _candles()
+    pf = Portfolio(cash=10_000.0)
+    curve = EquityCurve(capacity=len(candles))
+    fills = run(_strat(), SYM, candles, 20, PaperBroker(), pf, curve)
+
+    assert len(curve) == len(candles)
+    assert curve.ts.tolist() == [c.ts for c in candles]
+    # 첫 체결 전 봉은 시작 현금 그대로 (최종 상태가 아님)
+    first = next(i for i, c in enumerate(candles) if c.ts == fills[0].ts)
+    assert np.all(curve.cash[:first] == 10_000.0)
+    assert curve.cash[-1] == pf.cash
+    assert curve.qty[-1] == pf.position(SYM).qty
+    np.testing.assert_array_equal(curve.equity, curve.cash + curve.qty * curve.price)
+
+
+def test_all_paths_record_identical_curves():
+    candles = _candles()
+    curves = []
+    for run in (simulate_rolling, simulate_streaming, simulate_vectorized):
+        curve = EquityCurve(capacity=8)  # 확장 경로도 함께 확인
+        run(_strat(), SYM, candles, 20, PaperBroker(), Portfolio(cash=10_000.0), curve)
+        curves.append(curve)
+    for other in curves[1:]:
+        for col in ("ts", "equity", "price", "cash", "qty", "avg"):
+            np.testing.assert_array_equal(getattr(other, col), getattr(curves[0], col))
+
+
+def test_merged_curve_one_row_per_timestamp():
+    a = _candles(100, 1)
+    b = _candles(100, 2, offset=30)
+    strat = MACDStrategy(symbols=["A", "B"], fast=3, slow=6, signal=3, qty=5.0)
+    pf = Portfolio(cash=10_000.0)
+    curve = EquityCurve()
+    simulate_merged(strat, {"A": iter(a), "B": iter(b)}, 10, PaperBroker(), pf, curve)
+
+    assert len(curve) == 200
+    assert curve.ts.tolist() == sorted({c.ts for c in a + b})
+    marks = {"A": a[-1].c, "B": b[-1].c}
+    assert curve.equity[-1] == pytest.approx(pf.value(marks), rel=1e-12)
+    assert curve.price[-1] == a[-1].c
@@ -0,0 +1,90 @@
+import random
+
+import pytest
+
+from autotrade.analysis import indicators
+from autotrade.analysis.cache import IndicatorCache
+from autotrade.strategies.macd import MACDStrategy
+from autotrade.strategies.registry import create
+
+
+def _series(n: int = 600, seed: int = 4) -> list[float]:
+    rnd = random.Random(seed)
+    p, out = 100.0, []
+    for _ in range(n):
+        p *= 1.0 + rnd.uniform(-0.01, 0.01)
+        out.append(p)
+    return out
+
+
+def _same(a, b) -> bool:
+    return len(a) == len(b) and all((x != x and y != y) or x == y for x, y in zip(a, b))
+
+
+@pytest.mark.parametrize("n", [100, 600])
+def test_results_match_uncached_functions(n):
+    # 캐시는 전략 신호용 exact 경로 (NumPy 커널을 쓰는 n=600에서도 상태형 지표와 동일)
+    xs = _series(n)
+    c = IndicatorCache()
+    assert _same(c.sma(xs, 10), indicators.sma(xs, 10, exact=True))
+    assert _same(c.ema(xs, 9), indicators.ema(xs, 9, exact=True))
+    assert _same(c.wilder_rsi(xs, 14), indicators.wilder_rsi(xs, 14, exact=True))
+    assert _same(c.rolling_std(xs, 20), indicators.rolling_std(xs, 20, exact=True))
+    for got, ref in zip(c.bollinger(xs, 20, 2.0), indicators.bollinger(xs, 20, 2.0, exact=True)):
+        assert _same(got, ref)
+    for got, ref in zip(c.macd(xs, 12, 26, 9), indicators.macd(xs, 12, 26, 9, exact=True)):
+        assert _same(got, ref)
+    assert _same(c.sma(xs, 10), indicators.SMA(10).batch(xs))
+
+
+def test_macd_variants_share_fast_ema():
+    xs = _series()
+    c = IndicatorCache()
+    c.macd(xs, 12, 26, 9)
+    assert (c.hits, c.misses) == (0, 3)  # macd + ema12 + ema26
+    # 같은 내용의 다른 리스트 객체도 같은 시리즈로 취급
+    c.macd(list(xs), 12, 30, 9)
+    assert (c.hits, c.misses) == (1, 5)  # ema12 적중, macd + ema30 계산
+    c.macd(xs, 12, 26, 9)
+    assert c.hits == 2
+    # 내용이 다르면 다른 키
+    c.ema(xs[:-1], 12)
+    assert c.misses == 6
+
+
+def test_lru_eviction_by_bytes():
+    xs = _series(1000)
+    c = IndicatorCache()
+    c.sma(xs, 5)
+    one = c.nbytes
+    c = IndicatorCache(max_bytes=2 * one + one // 2)
+    c.sma(xs, 5)
+    c.sma(xs, 6)
+    c.sma(xs, 5)  # 5를 최근 사용으로
+    c.sma(xs, 7)  # 6이 퇴출
+    assert c.evictions == 1 and len(c) == 2 and c.nbytes <= c.max_bytes
+    c.sma(xs, 5)
+    assert c.hits == 2
+    c.sma(xs, 6)
+    assert c.misses == 4
+
+    tiny = IndicatorCache(max_bytes=10)
+    assert _same(tiny.sma(xs, 5), indicators.sma(xs, 5, exact=True))
+    assert len(tiny) == 0 and tiny.stats()["misses"] == 1
+
+
+def test_strategy_signals_unchanged_with_cache():
+    xs = _series(800)
+    cache = IndicatorCache()
+    for name, params in [
+        ("macd", {"fast": 12, "slow": 26, "signal": 9}),
+        ("rsi", {"period": 14}),
+        ("bbands", {"window": 20, "k": 2.0}),
+        ("sma_cross", {"fast": 5, "slow": 20}),
+    ]:
+        plain = create(name, symbols=["X"], **params)
+        cached = create(name, symbols=["X"], cache=cache, **params)
+        assert cached.signals(xs) == plain.signals(xs)
+    before = cache.misses
+    MACDStrategy(["X"], fast=12, slow=40, cache=cache).signals(xs)
+    assert cache.misses == before + 2 and cache.hits >= 1
@@ -0,0 +1,83 @@
+import math
+import random
+
+import pytest
+
+from autotrade.analysis import indicators as ind
+from autotrade.analysis import kernels
+
+
+def _series(n: int, seed: int = 3, base: float = 50_000_000.0) -> list[float]:
+    rnd = random.Random(seed)
+    p, out = base, []
+    for _ in range(n):
+        p *= 1.0 + rnd.uniform(-0.004, 0.004)
+        out.append(p)
+    return out
+
+
+def _close(a: list[float], b: list[float], rel: float = 1e-9, abs_: float = 1e-9) -> bool:
+    assert len(a) == len(b)
+    for x, y in zip(a, b):
+        if math.isnan(x) or math.isnan(y):
+            if not (math.isnan(x) and math.isnan(y)):
+                return False
+        elif x != pytest.approx(y, rel=rel, abs=abs_):
+            return False
+    return True
+
+
+# (NumPy 경로 함수, 순수 파이썬 기준)
+CASES = [
+    ("sma", lambda xs: ind.sma(xs, 20), lambda xs: ind.SMA(20).batch(xs)),
+    ("sma_long", lambda xs: ind.sma(xs, 300), lambda xs: ind.SMA(300).batch(xs)),
+    ("ema", lambda xs: ind.ema(xs, 12), lambda xs: ind.EMA(12).batch(xs)),
+    ("ema_slow", lambda xs: ind.ema(xs, 400), lambda xs: ind.EMA(400).batch(xs)),
+    ("rsi", lambda xs: ind.wilder_rsi(xs, 14), lambda xs: ind.WilderRSI(14).batch(xs)),
+    ("std", lambda xs: ind.rolling_std(xs, 20), lambda xs: ind.RollingStd(20).batch(xs)),
+    (
+        "macd_hist",
+        lambda xs: ind.macd(xs, 12, 26, 9)[2],
+        lambda xs: [v.hist for v in ind.MACD(12, 26, 9).batch(xs)],
+    ),
+]
+
+
+@pytest.mark.parametrize("name,fast,ref", CASES, ids=[c[0] for c in CASES])
+def test_kernels_agree_with_pure_python(name, fast, ref):
+    # 청크 경계(CHUNK)를 넘는 길이
+    xs = _series(kernels.CHUNK * 2 + 123)
+    assert ind.USE_NUMPY
+    # MACD 히스토그램은 가격(5e7)끼리의 차이라 절대 오차를 가격 규모 기준으로 봄
+    abs_ = 1e-9 * xs[0] if name == "macd_hist" else 1e-9
+    assert _close(fast(xs), ref(xs), abs_=abs_)
+
+
+def test_bollinger_matches_fallback(monkeypatch):
+    xs = _series(1000)
+    up, lo = ind.bollinger(xs, 20, 2.0)
+    monkeypatch.setattr(ind, "USE_NUMPY", False)
+    up2, lo2 = ind.bollinger(xs, 20, 2.0)
+    assert _close(up, up2) and _close(lo, lo2)
+
+
+def test_fallback_without_numpy_is_bit_identical(monkeypatch):
+    monkeypatch.setattr(ind, "USE_NUMPY", False)
+    xs = _series(1000)
+    assert ind.ema(xs, 9) == ind.EMA(9).batch(xs)
+    rsi = ind.wilder_rsi(xs, 14)
+    assert rsi[14:] == ind.WilderRSI(14).batch(xs)[14:]
+
+
+def test_short_inputs_and_edge_cases():
+    assert ind.sma([1.0, 2.0], 5) == [] or all(math.isnan(v) for v in ind.sma([1.0, 2.0], 5))
+    flat = [1.0] * 600
+    assert set(ind.wilder_rsi(flat, 14)[14:]) == {100.0}
+    assert all(v == 0.0 for v in ind.rolling_std(flat, 10)[9:])
+    assert len(kernels.ema(kernels.np.empty(0), 5)) == 0
+
+
+def test_ema_is_exact_on_constant_input():
+    xs = [100.0] * 1000
+    assert ind.ema(xs, 26) == xs
+    assert set(ind.macd(xs, 12, 26, 9)[2]) == {0.0}
@@ -0,0 +1,113 @@
+import math
+import random
+import statistics
+
+import pytest
+
+from autotrade.analysis import indicators
+from autotrade.analysis.indicators import EMA, MACD, SMA, RollingStd, WilderRSI, sma
+
+
+def _series(n: int = 500, seed: int = 11, base: float = 100.0) -> list[float]:
+    rnd = random.Random(seed)
+    p, out = base, []
+    for _ in range(n):
+        p *= 1.0 + rnd.uniform(-0.01, 0.01)
+        out.append(p)
+    return out
+
+
+def _same(a: list[float], b: list[float]) -> bool:
+    """NaN까지 포함한 비트 단위 동일 비교"""
+    return len(a) == len(b) and all(
+        (x != x and y != y) or x == y for x, y in zip(a, b)
+    )
+
+
+@pytest.mark.parametrize(
+    "make",
+    [
+        lambda: SMA(7),
+        lambda: EMA(9),
+        lambda: WilderRSI(14),
+        lambda: RollingStd(20),
+    ],
+)
+def test_update_and_batch_are_bit_identical(make):
+    xs = _series()
+    streamed = make()
+    assert _same([streamed.update(x) for x in xs], make().batch(xs))
+
+
+def test_sma_matches_list_function(monkeypatch):
+    # 순수 파이썬 경로의 sma()와 비트 단위 동일 (NumPy 커널은 test_indicator_kernels)
+    monkeypatch.setattr(indicators, "USE_NUMPY", False)
+    xs = _series()
+    assert _same(SMA(10).batch(xs), sma(xs, 10))
+
+
+def test_ema_seed_and_recurrence():
+    xs = [1.0, 2.0, 3.0]
+    k = 2.0 / 4
+    assert EMA(3).batch(xs) == [1.0, 2.0 * k + 1.0 * (1 - k), 3.0 * k + (2.0 * k + 0.5) * (1 - k)]
+
+
+def test_wilder_rsi_reference():
+    xs = _series(60)
+    p = 5
+    got = WilderRSI(p).batch(xs)
+    assert all(math.isnan(v) for v in got[:p])
+    gains = [max(b - a, 0.0) for a, b in zip(xs, xs[1:])]
+    losses = [max(a - b, 0.0) for a, b in zip(xs, xs[1:])]
+    ag, al = sum(gains[:p]) / p, sum(losses[:p]) / p
+    assert got[p] == 100.0 - 100.0 / (1.0 + ag / al)
+    for i in range(p + 1, len(xs)):
+        ag = (ag * (p - 1) + gains[i - 1]) / p
+        al = (al * (p - 1) + losses[i - 1]) / p
+        assert got[i] == 100.0 - 100.0 / (1.0 + ag / al)
+    assert WilderRSI(3).batch([1.0, 2.0, 3.0, 4.0, 5.0])[3:] == [100.0, 100.0]
+
+
+def test_rolling_std_is_stable_with_large_offsets():
+    # 큰 값 + 작은 변동: s2/w - mean² 방식은 상쇄 오차로 크게 틀어지는 입력
+    rnd = random.Random(5)
+    xs = [1e9 + rnd.uniform(-0.5, 0.5) for _ in range(2000)]
+    w = 30
+    got = RollingStd(w).batch(xs)
+    assert all(math.isnan(v) for v in got[: w - 1])
+    for i in range(w - 1, len(xs), 97):
+        ref = statistics.pstdev(xs[i - w + 1 : i + 1])
+        assert got[i] == pytest.approx(ref, rel=1e-9)
+    assert all(math.isnan(v) for v in RollingStd(1).batch(xs[:5]))
+
+
+def test_macd_components():
+    xs = _series(200)
+    vals = MACD(5, 13, 4).batch(xs)
+    f, s = EMA(5).batch(xs), EMA(13).batch(xs)
+    line = [a - b for a, b in zip(f, s)]
+    sig = EMA(4).batch(line)
+    assert [v.macd for v in vals] == line
+    assert [v.signal for v in vals] == sig
+    assert [v.hist for v in vals] == [m - g for m, g in zip(line, sig)]
+
+
+@pytest.mark.parametrize("cls", [SMA, EMA, WilderRSI, RollingStd])
+def test_rejects_non_positive_window(cls):
+    with pytest.raises(ValueError):
+        cls(0)
+
+
+def test_flat_decimal_windows_are_exact():
+    # 0.1/0.3/0.7은 이진수로 정확히 표현되지 않음: 이동 합계가 틀어지면 평탄 구간의
+    # 평균이 종가와 어긋나고 std == 0과 만나 밴드 돌파가 매 봉 켜짐
+    xs = [0.1] * 300 + [0.3] * 300 + [0.7] * 300
+    w = 20
+    mean, std = SMA(w).batch(xs), RollingStd(w).batch(xs)
+    for i in range(w - 1, len(xs)):
+        if len(set(xs[i - w + 1 : i + 1])) == 1:
+            assert mean[i] == xs[i] and std[i] == 0.0
+    rs = RollingStd(w)
+    for x in xs:
+        rs.update(x)
+    assert rs.mean == 0.7
@@ -0,0 +1,73 @@
+import random
+
+from autotrade.live import ClosedBarFeed
+from autotrade.models.market import Candle
+from autotrade.models.order import OrderRequest
+from autotrade.strategies.sma_cross import SmaCross
+
+SYM = "KRW-BTC"
+
+
+def _candles(n: int = 300, seed: int = 9) -> list[Candle]:
+    rnd = random.Random(seed)
+    p, out = 100.0, []
+    for i in range(n):
+        p *= 1.0 + rnd.uniform(-0.01, 0.01)
+        out.append(Candle(ts=i * 60, o=p, hi=p, lo=p, c=p, v=1.0))
+    return out
+
+
+class _Counting(SmaCross):
+    def __init__(self, **kw):
+        super().__init__(symbols=[SYM], fast=3, slow=8, **kw)
+        self.fed: list[int] = []
+
+    def on_candle(self, sym, candle):
+        self.fed.append(candle.ts)
+        return super().on_candle(sym, candle)
+
+    def generate(self, candles):
+        raise AssertionError("streaming strategies must not be recomputed from the window")
+
+
+def test_feeds_only_new_closed_bars():
+    candles = _candles()
+    now = [0.0]
+    strat = _Counting()
+    strat.on_start()
+    feed = ClosedBarFeed(strat, "1m", clock=lambda: now[0])
+    window, t0 = 60, 60
+    got = []
+    for t in range(t0, len(candles)):
+        now[0] = candles[t].ts + 30  # candles[t]는 진행 중인 봉
+        got.append(feed.step({SYM: candles[t - window + 1 : t + 1]}))
+        feed.step({SYM: candles[t - window + 1 : t + 1]})  # 같은 창을 다시 받아도 중복 없음
+
+    # 봉마다 on_candle 1번, 진행 중인 봉은 닫힌 뒤에만
+    assert strat.fed == [c.ts for c in candles[t0 - window + 1 : len(candles) - 1]]
+    assert got[0] == []  # 워밍업 봉의 주문은 버림
+
+    ref = SmaCross(symbols=[SYM], fast=3, slow=8)
+    want = [ref.on_candle(SYM, c) for c in candles[t0 - window + 1 : len(candles) - 1]]
+    assert got[1:] == want[window - 1 :]
+    assert any(got)
+
+
+def test_generate_fallback_for_non_streaming_strategy():
+    class Every:
+        name = "every"
+        symbols = [SYM]
+        calls = 0
+
+        def on_start(self):
+            pass
+
+        def generate(self, candles):
+            self.calls += 1
+            return [OrderRequest.market(SYM, "buy", 0.01)]
+
+    strat = Every()
+    feed = ClosedBarFeed(strat, "1m", clock=lambda: 1e9)
+    frames = {SYM: _candles(10)}
+    assert feed.step(frames) == feed.step(frames) == [OrderRequest.market(SYM, "buy", 0.01)]
+    assert strat.calls == 2 and feed.bars == 0
@@ -0,0 +1,109 @@
+import asyncio
+import json
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+from websockets.asyncio.server import serve
+
+from autotrade.live import run_live_async
+from autotrade.strategies.sma_cross import SmaCross
+
+DATA = Path(__file__).parent / "data"
+RECORDED = [
+    json.loads(line)
+    for line in (DATA / "upbit_ws_messages.jsonl").read_text(encoding="utf-8").splitlines()
+]
+T0 = 1_704_067_200
+CANDLES = json.loads((DATA / "upbit_candles_krw-btc_1m.json").read_text(encoding="utf-8"))
+
+
+class _Rest(BaseHTTPRequestHandler):
+    """REST 대역: /candles/minutes/1 은 녹화 응답, /ticker 는 고정가 (호출 경로를 기록)"""
+
+    paths: list = []
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        q = parse_qs(url.query)
+        type(self).paths.append(url.path)
+        if url.path.endswith("/ticker"):
+            rows = [{"market": m, "trade_price": 1.0} for m in q["markets"][0].split(",")]
+        else:
+            # 워밍업용으로 가장 오래된 2개 봉만 (이후 봉은 스트림에서 받아야 함)
+            rows = CANDLES[-2:][: int(q["count"][0])]
+        body = json.dumps(rows).encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def _config(tmp_path, rest_port, ws_port, feed="ws"):
+    cfg = tmp_path / "live.yaml"
+    cfg.write_text(
+        json.dumps(
+            {
+                "env": "test",
+                "exchange": {
+                    "base_url": f"http://127.0.0.1:{rest_port}/v1",
+                    "ws_url": f"ws://127.0.0.1:{ws_port}",
+                },
+                "strategy": {
+                    "name": "sma_cross",
+                    "params": {"fast": 2, "slow": 3},
+                    "symbols": ["KRW-BTC"],
+                },
+                "data": {"interval": "1m", "window": 5, "feed": feed},
+            }
+        ),
+        encoding="utf-8",
+    )
+    return str(cfg)
+
+
+def test_ws_feed_drives_the_live_loop(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    # 로그 핸들러는 설치하지 않음 (설치된 것으로 표시)
+    monkeypatch.setattr(logging.getLogger(), "_autotrade_logging_installed", True, raising=False)
+    _Rest.paths = []
+    fed = []
+    on_candle = SmaCross.on_candle
+
+    def record(self, sym, candle):
+        fed.append(candle.ts)
+        return on_candle(self, sym, candle)
+
+    monkeypatch.setattr(SmaCross, "on_candle", record)
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), _Rest)
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+
+    async def ws_handler(ws):
+        sub = json.loads(await ws.recv())
+        codes = {c for part in sub if part.get("type") == "trade" for c in part["codes"]}
+        for m in RECORDED:
+            if m["type"] == "trade" and m["code"] in codes:
+                await ws.send(json.dumps(m).encode())
+        await ws.wait_closed()
+
+    async def body():
+        async with serve(ws_handler, "127.0.0.1", 0) as server:
+            ws_port = server.sockets[0].getsockname()[1]
+            cfg = _config(tmp_path, srv.server_address[1], ws_port)
+            # sleep_s가 크더라도 ws 모드는 봉 이벤트로만 진행
+            await asyncio.wait_for(run_live_async(cfg, loops=4, sleep_s=600), timeout=10)
+
+    try:
+        asyncio.run(body())
+    finally:
+        srv.shutdown()
+    candle_calls = [p for p in _Rest.paths if p.endswith("/candles/minutes/1")]
+    # 워밍업 + 구독 시점에 진행 중이던 봉 1번뿐, 나머지 봉 이벤트는 스트림의 봉으로 처리
+    assert len(candle_calls) == 2
+    # REST 워밍업 2개 봉 뒤로 스트림에서 만든 봉이 이어서 들어감 (중복 없이)
+    assert fed == [T0 + 60 * k for k in range(4)]
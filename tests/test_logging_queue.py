@@ -0,0 +1,71 @@
+import json
+import logging
+import sys
+import threading
+from logging.handlers import QueueHandler
+
+from autotrade import logging_config
+
+
+def test_queued_json_logging_writes_on_listener_thread(tmp_path, monkeypatch):
+    root = logging.getLogger()
+    monkeypatch.setattr(root, "_autotrade_logging_installed", False, raising=False)
+    before = list(root.handlers)
+    logging_config.setup(log_dir=str(tmp_path), queued=True, json_lines=True)
+    try:
+        added = [h for h in root.handlers if h not in before]
+        assert len(added) == 1 and isinstance(added[0], QueueHandler)
+
+        threads = set()
+
+        def where(record):
+            threads.add(threading.current_thread().name)
+            return True
+
+        fh = logging_config._listener.handlers[1]
+        fh.addFilter(where)
+        log = logging.getLogger("executor")
+        log.info("Executed %s %s", "buy", 0.5)
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            log.exception("submit failed")
+        logging.getLogger("test.debug").debug("détail")
+    finally:
+        logging_config.shutdown()
+    logging_config.shutdown()  # 두 번 불러도 안전
+
+    assert not [h for h in root.handlers if isinstance(h, QueueHandler)]
+    assert threads and threading.current_thread().name not in threads
+    rows = [json.loads(line) for line in (tmp_path / "trader.log").read_text("utf-8").splitlines()]
+    assert [r["msg"].splitlines()[0] for r in rows] == ["Executed buy 0.5", "submit failed", "détail"]
+    assert rows[0]["level"] == "INFO" and rows[0]["logger"] == "executor"
+    assert rows[1]["msg"] == "submit failed"
+    assert "ValueError: boom" in rows[1]["exc"] and "exc" not in rows[0]
+    assert rows[0]["ts"].endswith("+00:00")
+
+
+def test_queued_text_log_keeps_traceback(tmp_path, monkeypatch):
+    root = logging.getLogger()
+    monkeypatch.setattr(root, "_autotrade_logging_installed", False, raising=False)
+    logging_config.setup(log_dir=str(tmp_path), queued=True)
+    try:
+        try:
+            {}["k"]
+        except KeyError:
+            logging.getLogger("live").exception("loop error: %s", "k")
+    finally:
+        logging_config.shutdown()
+    text = (tmp_path / "trader.log").read_text("utf-8")
+    assert "loop error: k" in text and "KeyError: 'k'" in text
+
+
+def test_json_formatter_includes_exception():
+    try:
+        raise KeyError("x")
+    except KeyError:
+        rec = logging.getLogger("t").makeRecord(
+            "t", logging.ERROR, __file__, 1, "bad %d", (3,), sys.exc_info()
+        )
+    row = json.loads(logging_config.JsonLinesFormatter().format(rec))
+    assert row["msg"] == "bad 3" and "KeyError" in row["exc"]
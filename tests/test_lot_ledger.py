@@ -0,0 +1,62 @@
+import pytest
+
+from autotrade.backtest.metrics import LotLedger, trade_pnls
+from autotrade.models.order import Order
+
+
+def _f(side, qty, price, symbol="KRW-BTC", ts=None):
+    return Order(id="x", symbol=symbol, side=side, qty=qty, price=price, ts=ts)
+
+
+def test_fifo_partial_fills():
+    fills = [
+        _f("buy", 1.0, 100.0, ts=1),
+        _f("buy", 2.0, 110.0, ts=2),
+        _f("sell", 1.5, 120.0, ts=3),  # 1.0@100 전부 + 0.5@110
+        _f("sell", 1.5, 90.0, ts=4),  # 나머지 1.5@110
+    ]
+    closed = LotLedger().extend(fills)
+    assert [(c.qty, c.entry_price, c.exit_price) for c in closed] == [
+        (1.0, 100.0, 120.0),
+        (0.5, 110.0, 120.0),
+        (1.5, 110.0, 90.0),
+    ]
+    assert [c.pnl for c in closed] == pytest.approx([20.0, 5.0, -30.0])
+    assert closed[1].entry_ts == 2 and closed[1].exit_ts == 3
+
+
+def test_lifo_and_average_cost():
+    fills = [_f("buy", 1.0, 100.0), _f("buy", 1.0, 120.0), _f("sell", 1.0, 130.0)]
+    assert trade_pnls(fills, method="lifo") == pytest.approx([10.0])
+    assert trade_pnls(fills, method="fifo") == pytest.approx([30.0])
+    assert trade_pnls(fills, method="avg") == pytest.approx([20.0])
+
+
+def test_fees_are_prorated():
+    ledger = LotLedger(fee_rate=0.01)
+    ledger.add(_f("buy", 2.0, 100.0))  # 수수료 1.0/개
+    (c,) = ledger.add(_f("sell", 1.0, 110.0))  # 매도 수수료 1.1
+    assert c.pnl == pytest.approx(10.0 - 1.0 - 1.1)
+    assert ledger.open_qty("KRW-BTC") == pytest.approx(1.0)
+
+
+def test_symbols_are_matched_separately_and_oversell_ignored():
+    fills = [
+        _f("buy", 1.0, 100.0, symbol="A"),
+        _f("buy", 1.0, 10.0, symbol="B"),
+        _f("sell", 3.0, 12.0, symbol="B"),
+        _f("sell", 1.0, 105.0, symbol="A"),
+    ]
+    closed = LotLedger().extend(fills)
+    assert [(c.symbol, c.qty, c.pnl) for c in closed] == [
+        ("B", 1.0, pytest.approx(2.0)),
+        ("A", 1.0, pytest.approx(5.0)),
+    ]
+
+
+def test_many_fills_linear():
+    fills = [_f("buy", 1.0, 100.0) for _ in range(100_000)]
+    fills += [_f("sell", 1.0, 101.0) for _ in range(100_000)]
+    pnls = trade_pnls(fills)
+    assert len(pnls) == 100_000
+    assert sum(pnls) == pytest.approx(100_000.0)
@@ -0,0 +1,63 @@
+import random
+
+import pytest
+
+from autotrade.backtest.metrics import (
+    MetricsAccumulator,
+    drawdown_periods,
+    max_drawdown,
+    sharpe_ratio,
+    sortino,
+)
+
+
+def _equity(n: int, seed: int) -> list[float]:
+    rnd = random.Random(seed)
+    v = 10_000.0
+    out = []
+    for _ in range(n):
+        v *= 1.0 + rnd.gauss(0.0, 0.01)
+        out.append(v)
+    return out
+
+
+def _returns(eq: list[float]) -> list[float]:
+    return [b / a - 1.0 for a, b in zip(eq, eq[1:]) if a > 0]
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3, 4])
+def test_accumulator_matches_batch_metrics(seed):
+    eq = _equity(2_000, seed)
+    acc = MetricsAccumulator.from_equity(eq)
+
+    assert acc.max_drawdown == max_drawdown(eq)
+    assert acc.drawdown_periods == drawdown_periods(eq)
+    rets = _returns(eq)
+    assert acc.sharpe == pytest.approx(sharpe_ratio(rets), rel=1e-9)
+    assert acc.sortino == pytest.approx(sortino(rets), rel=1e-9)
+
+
+def test_accumulator_reports_running_stats():
+    eq = [100.0, 110.0, 99.0, 105.0, 121.0, 90.0, 95.0]
+    acc = MetricsAccumulator()
+    for i, v in enumerate(eq, start=1):
+        acc.update(v)
+        assert acc.max_drawdown == max_drawdown(eq[:i])
+        assert acc.drawdown_periods == drawdown_periods(eq[:i])
+    assert acc.count == len(eq)
+    assert acc.last == 95.0
+
+
+def test_accumulator_recovery_period():
+    eq = [100.0, 80.0, 90.0, 100.0, 101.0]
+    acc = MetricsAccumulator.from_equity(eq)
+    assert acc.drawdown_periods == (1, 2)
+    assert acc.max_drawdown == (pytest.approx(-0.2), 100.0, 80.0)
+
+
+def test_empty_accumulator():
+    acc = MetricsAccumulator()
+    assert acc.sharpe == 0.0
+    assert acc.sortino == 0.0
+    assert acc.max_drawdown == (0.0, 0.0, 0.0)
+    assert acc.cagr(1.0) == 0.0
@@ -0,0 +1,162 @@
+import random
+from pathlib import Path
+
+import pytest
+import yaml
+
+from autotrade.backtest.broker import PaperBroker, Portfolio
+from autotrade.backtest.engine import (
+    backtest,
+    load_streams,
+    merge_by_ts,
+    simulate_merged,
+    simulate_streaming,
+)
+from autotrade.data.downloader import download_candles
+from autotrade.exchanges.fake import FakeExchange
+from autotrade.models.market import Candle
+from autotrade.settings import Settings
+from autotrade.strategies.macd import MACDStrategy
+
+
+def _candles(n: int, seed: int, step: int = 60, offset: int = 0) -> list[Candle]:
+    rnd = random.Random(seed)
+    p = 100.0
+    out = []
+    for i in range(n):
+        p *= 1.0 + rnd.uniform(-0.01, 0.01)
+        out.append(Candle(ts=offset + i * step, o=p, hi=p, lo=p, c=p, v=1.0))
+    return out
+
+
+def test_merge_by_ts_is_lazy_and_ordered():
+    pulled = {"A": 0, "B": 0}
+
+    def stream(sym, candles):
+        for c in candles:
+            pulled[sym] += 1
+            yield c
+
+    a = _candles(100, 1, step=60)
+    b = _candles(100, 2, step=120, offset=30)
+    merged = merge_by_ts({"A": stream("A", a), "B": stream("B", b)})
+
+    first = [next(merged) for _ in range(3)]
+    assert [(s, c.ts) for s, c in first] == [("A", 0), ("B", 30), ("A", 60)]
+    # 힙에는 심볼당 캔들 1개만 미리 읽혀 있음
+    assert pulled["A"] <= 3 and pulled["B"] <= 2
+
+    rest = list(merged)
+    ts = [c.ts for _, c in first + rest]
+    assert ts == sorted(ts)
+    assert len(ts) == 200
+
+
+def test_merged_fills_match_per_symbol_runs():
+    a = _candles(300, 3)
+    b = _candles(300, 4)
+
+    def make():
+        return MACDStrategy(symbols=["A", "B"], fast=5, slow=13, signal=4, qty=1.0)
+
+    pf = Portfolio(cash=10_000.0)
+    merged = simulate_merged(make(), {"A": iter(a), "B": iter(b)}, 20, PaperBroker(), pf)
+
+    for sym, candles in (("A", a), ("B", b)):
+        single = simulate_streaming(
+            make(), sym, candles, 20, PaperBroker(), Portfolio(cash=10_000.0)
+        )
+        assert single
+        assert [f for f in merged if f.symbol == sym] == single
+    assert set(pf.positions) == {"A", "B"}
+
+
+def test_strategy_receives_only_ticking_symbol():
+    seen = []
+
+    class Recorder:
+        name = "recorder"
+        symbols = ["A", "B"]
+
+        def on_start(self):
+            pass
+
+        def generate(self, candles):
+            seen.append(sorted(candles))
+            return []
+
+    streams = {"A": iter(_candles(5, 1)), "B": iter(_candles(5, 2, offset=10))}
+    simulate_merged(Recorder(), streams, 1, PaperBroker(), Portfolio(cash=1.0))
+    assert seen == [["A"], ["B"]] * 5
+
+
+def test_merge_rejects_out_of_order_stream():
+    a = _candles(5, 1)
+    with pytest.raises(ValueError, match="ascending"):
+        list(merge_by_ts({"A": iter([a[0], a[2], a[1]])}))
+
+
+def test_generate_history_is_capped_at_window():
+    lens = []
+
+    class Recorder:
+        name = "recorder"
+        symbols = ["A"]
+
+        def on_start(self):
+            pass
+
+        def generate(self, candles):
+            lens.append(len(candles["A"]))
+            return []
+
+    simulate_merged(Recorder(), {"A": iter(_candles(50, 1))}, 7, PaperBroker(), Portfolio(cash=1.0))
+    assert lens == [7] * 44
+
+
+def test_load_streams_sorts_csv_not_known_ascending(tmp_path: Path):
+    indexed = tmp_path / "KRW-BTC.csv"
+    download_candles(FakeExchange(seed=1), "KRW-BTC", "1m", 30, str(indexed))
+    # 인덱스 없이 뒤섞인 CSV (다른 도구가 쓴 파일)
+    rows = indexed.read_text(encoding="utf-8").splitlines()
+    body = rows[1:]
+    random.Random(0).shuffle(body)
+    (tmp_path / "KRW-ETH.csv").write_text("\n".join([rows[0], *body]) + "\n", encoding="utf-8")
+    s = Settings.model_validate(
+        {
+            "strategy": {"name": "macd", "params": {}, "symbols": ["KRW-BTC", "KRW-ETH"]},
+            "data": {"interval": "1m", "window": 10, "csv": str(tmp_path)},
+        }
+    )
+    streams = load_streams(s)
+    assert iter(streams["KRW-BTC"]) is streams["KRW-BTC"]  # 인덱스가 오름차순 → 지연 로드
+    assert iter(streams["KRW-ETH"]) is not streams["KRW-ETH"]  # 전체 적재 후 정렬
+    btc = [c.ts for c in streams["KRW-BTC"]]
+    eth = [c.ts for c in streams["KRW-ETH"]]
+    assert eth == sorted(eth) == btc
+
+
+def test_backtest_reads_csv_directory(tmp_path: Path):
+    data_dir = tmp_path / "data"
+    for seed, sym in enumerate(("KRW-BTC", "KRW-ETH"), start=1):
+        download_candles(
+            FakeExchange(seed=seed), sym, "1m", 120, str(data_dir / f"{sym}.csv")
+        )
+    cfg = {
+        "strategy": {
+            "name": "macd",
+            "params": {"fast": 3, "slow": 6, "signal": 3, "use_crossover": False},
+            "symbols": ["KRW-BTC", "KRW-ETH"],
+        },
+        "data": {"interval": "1m", "window": 10, "csv": str(data_dir)},
+    }
+    config = tmp_path / "multi.yaml"
+    config.write_text(yaml.safe_dump(cfg), encoding="utf-8")
+
+    out_dir = tmp_path / "reports"
+    backtest(str(config), out_dir=str(out_dir))
+
+    trades = (out_dir / "trades.csv").read_text(encoding="utf-8").splitlines()[1:]
+    assert {row.split(",")[2] for row in trades} == {"KRW-BTC", "KRW-ETH"}
+    summary = (out_dir / "summary.txt").read_text(encoding="utf-8")
+    assert "position[KRW-ETH]" in summary
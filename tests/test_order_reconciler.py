@@ -0,0 +1,99 @@
+import hashlib
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+
+import jwt
+import pytest
+
+from autotrade.exchanges.upbit import UpbitClient, UpbitCreds, parse_order_fill
+from autotrade.execution.reconcile import OrderReconciler
+from autotrade.models.order import Order
+
+SECRET = "S"
+
+
+class _Orders(BaseHTTPRequestHandler):
+    """GET /v1/orders/uuids 대역: 첫 조회는 wait, 이후는 done (JWT query_hash 검증)"""
+
+    calls: list = []
+    bad_auth: list = []
+
+    def do_GET(self):
+        cls = type(self)
+        url = urlsplit(self.path)
+        token = self.headers.get("Authorization", "").removeprefix("Bearer ")
+        try:
+            claims = jwt.decode(token, SECRET, algorithms=["HS256"])
+            want = hashlib.sha512(unquote(url.query).encode()).hexdigest()
+            if claims.get("query_hash") != want:
+                cls.bad_auth.append(url.query)
+        except jwt.PyJWTError as e:
+            cls.bad_auth.append(str(e))
+        uuids = parse_qs(url.query)["uuids[]"]
+        cls.calls.append(uuids)
+        first = len(cls.calls) == 1
+        rows = []
+        for u in uuids:
+            if first:
+                rows.append({"uuid": u, "state": "wait", "executed_volume": "0", "paid_fee": "0"})
+            else:
+                rows.append(
+                    {
+                        "uuid": u,
+                        "state": "done",
+                        "executed_volume": "0.002",
+                        "executed_funds": "201000",  # VWAP 100,500,000
+                        "paid_fee": "100.5",
+                    }
+                )
+        body = json.dumps(rows).encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_parse_order_fill_falls_back_to_trades():
+    row = {
+        "state": "done",
+        "executed_volume": "2",
+        "paid_fee": "0.5",
+        "trades": [{"funds": "100"}, {"funds": "110"}],
+    }
+    assert parse_order_fill(row) == {"state": "done", "filled_qty": 2.0, "price": 105.0, "fee": 0.5}
+    assert parse_order_fill({"state": "wait", "executed_volume": "0"})["price"] is None
+
+
+def test_reconciles_in_one_batched_signed_request():
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), _Orders)
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{srv.server_address[1]}/v1"
+    client = UpbitClient(base_url=base, creds=UpbitCreds(access_key="A", secret_key=SECRET))
+    seen: list = []
+    rec = OrderReconciler(client, on_update=seen.append)
+    orders = [Order(id=f"u-{i}", symbol="KRW-BTC", side="buy", qty=0.002, price=1.0) for i in range(3)]
+    try:
+        for o in orders:
+            rec.track(o)
+        rec.poll_once()  # wait: 가격은 그대로, 추적 유지
+        assert rec.pending == 3
+        assert rec.get("u-0").state == "wait" and rec.get("u-0").price == 1.0
+        rec.poll_once()  # done
+    finally:
+        srv.shutdown()
+    assert _Orders.bad_auth == []
+    assert _Orders.calls == [["u-0", "u-1", "u-2"]] * 2  # 주문 3개를 요청 1번씩
+    assert rec.requests == 2 and rec.errors == 0
+    assert rec.pending == 0
+    o = rec.get("u-1")
+    assert o.state == "done"
+    assert o.price == pytest.approx(100_500_000)
+    assert o.filled_qty == pytest.approx(0.002) and o.fee == pytest.approx(100.5)
+    assert [x.id for x in seen[-3:]] == ["u-0", "u-1", "u-2"]
+    rec.poll_once()  # 남은 주문이 없으면 요청 없음
+    assert rec.requests == 2
@@ -0,0 +1,63 @@
+import time
+
+from autotrade.notify.hooks import QueuedNotifier
+
+
+class _SlowNotifier:
+    """웹훅 장애를 흉내: 전송 1건에 delay초"""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.sent = []
+
+    def send(self, text):
+        time.sleep(self.delay)
+        self.sent.append(text)
+
+
+def test_send_does_not_wait_for_webhook():
+    slow = _SlowNotifier(delay=0.5)
+    qn = QueuedNotifier(slow, flush_interval=0.05)
+    t0 = time.perf_counter()
+    for i in range(100):
+        qn.send(f"fill {i}")
+    elapsed = time.perf_counter() - t0
+    assert elapsed < 0.05  # 100건 전송에 웹훅 지연이 섞이지 않음
+    qn.close()
+    assert qn.enqueued == 100 and qn.dropped == 0
+    lines = "\n".join(slow.sent).splitlines()
+    assert lines == [f"fill {i}" for i in range(100)]
+    assert qn.flushes == len(slow.sent) < 100  # 묶어서 전송
+
+
+def test_burst_is_coalesced_into_one_message():
+    slow = _SlowNotifier()
+    with QueuedNotifier(slow, flush_interval=0.2) as qn:
+        for i in range(5):
+            qn.send(f"fill {i}")
+        time.sleep(0.4)
+        assert slow.sent == ["\n".join(f"fill {i}" for i in range(5))]
+    assert qn.flushes == 1
+
+
+def test_full_queue_drops_and_reports():
+    slow = _SlowNotifier(delay=0.3)
+    qn = QueuedNotifier(slow, maxsize=3, flush_interval=0.0)
+    qn.send("first")
+    time.sleep(0.1)  # 작업 스레드가 first를 보내는 중
+    for i in range(10):
+        qn.send(f"burst {i}")
+    qn.close()
+    assert qn.dropped == 7 and qn.enqueued == 4
+    assert "(알림 7건 생략: 큐 가득 참)" in slow.sent[-1]
+    qn.send("after close")
+    assert qn.dropped == 8
+
+
+def test_long_batches_are_split():
+    slow = _SlowNotifier()
+    with QueuedNotifier(slow, flush_interval=0.1, max_chars=50) as qn:
+        for i in range(10):
+            qn.send("x" * 20)
+    assert len(slow.sent) == 5
+    assert all(len(m) <= 50 for m in slow.sent)
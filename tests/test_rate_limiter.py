@@ -0,0 +1,120 @@
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from autotrade.exchanges.ratelimit import RateLimiter, parse_remaining_req
+from autotrade.exchanges.upbit import UpbitClient
+
+
+class _Clock:
+    def __init__(self):
+        self.t = 100.0
+
+    def __call__(self):
+        return self.t
+
+
+def test_schedules_ahead_within_limit():
+    clock = _Clock()
+    rl = RateLimiter({"quotation": 3}, period=1.0, margin=0.0, clock=clock)
+    assert [rl.reserve("quotation") for _ in range(7)] == [0, 0, 0, 1.0, 1.0, 1.0, 2.0]
+    st = rl.stats()["quotation"]
+    assert (st.requests, st.waited, st.wait_max) == (7, 4, 2.0)
+    clock.t += 5
+    assert rl.reserve("quotation") == 0
+    with pytest.raises(KeyError):
+        rl.reserve("nope")
+
+
+def test_learns_limit_from_remaining_req():
+    assert parse_remaining_req("group=default; min=1800; sec=29") == ("default", 29)
+    assert parse_remaining_req("garbage") is None
+    clock = _Clock()
+    rl = RateLimiter(clock=clock)
+    rl.reserve("exchange")
+    rl.observe("exchange", "group=default; min=1800; sec=4")
+    assert rl.stats()["exchange"].limit == 5  # 1개 보냈는데 4개 남음 → 5
+    clock.t += 2
+    rl.reserve("quotation")
+    rl.observe("quotation", "group=ticker; min=600; sec=29")
+    assert rl.stats()["quotation"].limit == 30
+    rl.penalize("order")
+    assert rl.reserve("order") == pytest.approx(1.05)
+    assert rl.stats()["order"].throttled == 1
+
+
+def test_async_tasks_share_the_bucket():
+    rl = RateLimiter({"order": 2}, period=0.2, margin=0.0)
+
+    async def run():
+        t0 = time.monotonic()
+        await asyncio.gather(*(rl.acquire_async("order") for _ in range(6)))
+        return time.monotonic() - t0
+
+    assert asyncio.run(run()) >= 0.39
+
+
+class _LimitedUpbit(BaseHTTPRequestHandler):
+    """초 단위 고정 구간에 LIMIT개까지만 허용하는 /v1/ticker 대역 (Remaining-Req 포함)"""
+
+    LIMIT = 5
+    lock = threading.Lock()
+    windows: dict = {}
+    rejected: list = []  # 거절한 요청의 구간(초)
+
+    def do_GET(self):
+        cls = type(self)
+        with cls.lock:
+            sec = int(time.time())
+            used = cls.windows.get(sec, 0) + 1
+            cls.windows[sec] = used
+            ok = used <= cls.LIMIT
+            if not ok:
+                cls.rejected.append(sec)
+        row = {"market": "KRW-BTC", "trade_price": 1.0}
+        body = json.dumps([row] if ok else {"error": "too many"}).encode()
+        self.send_response(200 if ok else 429)
+        self.send_header("Remaining-Req", f"group=ticker; min=600; sec={max(cls.LIMIT - used, 0)}")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_threads_stay_under_server_limit():
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), _LimitedUpbit)
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{srv.server_address[1]}/v1"
+    limiter = RateLimiter()  # 기본 10/s로 시작 → 헤더로 5/s 학습
+    errors: list = []
+
+    def worker():
+        client = UpbitClient(base_url=base, limiter=limiter, ticker_ttl=0)
+        for _ in range(4):
+            try:
+                client.get_ticker("KRW-BTC")
+            except Exception as e:  # pragma: no cover - 실패 시 메시지 확인용
+                errors.append(e)
+
+    try:
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    finally:
+        srv.shutdown()
+    st = limiter.stats()["quotation"]
+    assert not errors
+    assert st.limit <= _LimitedUpbit.LIMIT
+    # 429는 한도를 배우기 전 처음 두 구간에서만 (이후로는 사전 배치로 한도 안에서 전송)
+    first = min(_LimitedUpbit.windows)
+    assert all(sec <= first + 1 for sec in _LimitedUpbit.rejected)
+    assert st.throttled == len(_LimitedUpbit.rejected)
+    assert st.waited > 0 and st.wait_total > 0
@@ -0,0 +1,172 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from autotrade.exchanges.readcache import AsyncReadCache, ReadCache
+from autotrade.exchanges.upbit import UpbitClient
+from autotrade.models.order import OrderRequest
+
+
+class _Clock:
+    def __init__(self):
+        self.t = 0.0
+
+    def __call__(self):
+        return self.t
+
+
+def test_ttl_immutable_and_lru():
+    clock = _Clock()
+    c = ReadCache(max_entries=2, clock=clock)
+    calls = []
+
+    def load(v):
+        calls.append(v)
+        return v
+
+    assert c.get("a", 1.0, lambda: load(1)) == 1
+    assert c.get("a", 1.0, lambda: load(2)) == 1
+    clock.t = 1.0
+    assert c.get("a", 1.0, lambda: load(3)) == 3  # 만료
+    c.get("closed", None, lambda: load("x"))
+    clock.t = 1e9
+    assert c.get("closed", None, lambda: load("y")) == "x"  # 만료 없음
+    c.get("b", None, lambda: load("b"))  # max_entries=2 → 가장 오래 안 쓴 "a" 퇴출
+    assert len(c) == 2 and calls == [1, 3, "x", "b"]
+    assert c.get("zero", 0, lambda: load("z1")) == "z1"
+    assert c.get("zero", 0, lambda: load("z2")) == "z2"  # ttl=0은 저장 안 함
+    assert (c.hits, c.misses) == (2, 6)
+
+
+def test_concurrent_callers_share_one_request():
+    c = ReadCache()
+    calls = []
+    start = threading.Barrier(8)
+
+    def slow():
+        calls.append(1)
+        time.sleep(0.2)
+        return 42
+
+    results = []
+
+    def worker():
+        start.wait()
+        results.append(c.get("k", 0, slow))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert results == [42] * 8 and len(calls) == 1
+    assert c.coalesced == 7
+
+
+def test_loader_errors_reach_waiters_and_are_not_cached():
+    c = ReadCache()
+    with pytest.raises(RuntimeError):
+        c.get("k", 1.0, lambda: (_ for _ in ()).throw(RuntimeError("down")))
+    with pytest.raises(KeyError):
+        c.get_many(["a", "b"], 1.0, lambda ks: {"a": 1})
+    assert c.get("k", 1.0, lambda: 5) == 5
+
+
+def test_async_cache_shares_inflight_results_and_errors():
+    calls = []
+
+    async def load(keys):
+        calls.append(list(keys))
+        await asyncio.sleep(0.05)
+        if "bad" in keys:
+            raise RuntimeError("down")
+        return {k: k.upper() for k in keys}
+
+    async def run():
+        c = AsyncReadCache()
+        got = await asyncio.gather(*(c.get_many(["a", "b"], 1.0, load) for _ in range(4)))
+        errs = await asyncio.gather(
+            *(c.get_many(["bad"], 1.0, load) for _ in range(3)), return_exceptions=True
+        )
+        return c, got, errs
+
+    c, got, errs = asyncio.run(run())
+    assert got == [{"a": "A", "b": "B"}] * 4
+    assert calls == [["a", "b"], ["bad"]]
+    assert all(isinstance(e, RuntimeError) for e in errs)
+    assert (c.misses, c.coalesced, len(c)) == (3, 8, 2)
+
+
+class _Resp:
+    status_code = 200
+    headers: dict = {}
+
+    def __init__(self, payload):
+        self.payload = payload
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.payload
+
+
+class _Session:
+    def __init__(self):
+        self.calls = []
+
+    def get(self, url, params=None, timeout=None):
+        self.calls.append((url.rsplit("/v1/", 1)[1], dict(params)))
+        if url.endswith("/ticker"):
+            markets = params["markets"].split(",")
+            return _Resp([{"market": m, "trade_price": 100.0 + i} for i, m in enumerate(markets)])
+        return _Resp(
+            [
+                {
+                    "candle_date_time_utc": "2024-01-01T00:00:00",
+                    "opening_price": 1.0,
+                    "high_price": 1.0,
+                    "low_price": 1.0,
+                    "trade_price": 1.0,
+                    "candle_acc_trade_volume": 1.0,
+                }
+            ]
+        )
+
+
+def test_upbit_batches_and_caches_tickers():
+    sess = _Session()
+    c = UpbitClient(session=sess)
+    got = c.get_tickers(["KRW-A", "KRW-B", "KRW-C"])
+    assert {s: t.price for s, t in got.items()} == {"KRW-A": 100.0, "KRW-B": 101.0, "KRW-C": 102.0}
+    assert sess.calls == [("ticker", {"markets": "KRW-A,KRW-B,KRW-C"})]
+    # 같은 순간의 주문들: 캐시된 현재가를 씀
+    for sym in ("KRW-A", "KRW-B", "KRW-B"):
+        c.create_order(OrderRequest.market(sym, "buy", 10000))
+    assert c.get_tickers(["KRW-B", "KRW-D"])["KRW-D"].price == 100.0
+    assert sess.calls[1:] == [("ticker", {"markets": "KRW-D"})]
+
+
+def test_upbit_ticker_ttl_expires():
+    sess = _Session()
+    clock = _Clock()
+    c = UpbitClient(session=sess, cache=ReadCache(clock=clock), ticker_ttl=0.25)
+    c.get_ticker("KRW-A")
+    clock.t = 0.2
+    c.get_ticker("KRW-A")
+    clock.t = 0.3
+    c.get_ticker("KRW-A")
+    assert len(sess.calls) == 2
+
+
+def test_closed_candles_are_cached_open_ones_are_not():
+    sess = _Session()
+    c = UpbitClient(session=sess)
+    for _ in range(3):
+        c.get_candles("KRW-A", "1m", limit=1, to=1_704_067_260)
+    assert len(sess.calls) == 1
+    c.get_candles("KRW-A", "1m", limit=1)
+    c.get_candles("KRW-A", "1m", limit=1)
+    assert len(sess.calls) == 3
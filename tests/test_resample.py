@@ -0,0 +1,110 @@
+import random
+from pathlib import Path
+
+import pytest
+import yaml
+
+from autotrade.backtest.engine import load_batches, load_streams
+from autotrade.data.resample import Resampler, resample, resample_frame
+from autotrade.data.store import write_store
+from autotrade.models.market import Candle, CandleFrame
+from autotrade.settings import Settings
+
+T0 = 1_704_067_200  # 2024-01-01 00:00 UTC
+
+
+def _minutes(start: int, n: int, seed: int = 1) -> list[Candle]:
+    rnd = random.Random(seed)
+    out = []
+    for i in range(n):
+        o = 100 + rnd.random()
+        c = 100 + rnd.random()
+        out.append(
+            Candle(T0 + (start + i) * 60, o, max(o, c) + rnd.random(), min(o, c) - rnd.random(), c, rnd.random())
+        )
+    return out
+
+
+def _expected(parts: list[Candle], ts: int) -> Candle:
+    return Candle(
+        ts,
+        parts[0].o,
+        max(c.hi for c in parts),
+        min(c.lo for c in parts),
+        parts[-1].c,
+        sum(c.v for c in parts),
+    )
+
+
+def test_ohlcv_aggregation_with_edges():
+    # 2분에서 시작(첫 5분봉은 부분), 23분까지 → 마지막 20~23분도 부분
+    src = _minutes(2, 22)
+    bars = list(resample(src, "5m"))
+    assert [b.ts for b in bars] == [T0 + m * 60 for m in (5, 10, 15)]
+    assert bars[0] == _expected(src[3:8], T0 + 300)
+
+    kept = list(resample(src, "5m", partial="keep"))
+    assert [b.ts for b in kept] == [T0 + m * 60 for m in (0, 5, 10, 15, 20)]
+    assert kept[0] == _expected(src[0:3], T0)
+    assert kept[-1] == _expected(src[18:], T0 + 1200)
+
+
+def test_works_over_frame_and_daily():
+    src = _minutes(0, 3 * 1440)
+    frame = resample_frame(CandleFrame.from_candles(src), "1d")
+    assert len(frame) == 3
+    assert frame[1] == _expected(src[1440:2880], T0 + 86_400)
+
+
+def test_live_updates_revisions_and_late_candles():
+    r = Resampler("3m", partial="keep")
+    a, b, c, d = _minutes(0, 4)
+    assert r.update(a) == []
+    r.update(b)
+    # 진행 중 1분봉이 갱신되어 다시 옴 → 덮어씀
+    b2 = Candle(b.ts, b.o, b.hi + 10, b.lo, b.c + 1, b.v + 1)
+    r.update(b2)
+    assert r.peek() == _expected([a, b2], T0)
+    r.update(c)
+    closed = r.update(d)
+    assert closed == [_expected([a, b2, c], T0)]
+    # 이미 닫힌 구간의 늦은 캔들은 버림
+    assert r.update(c) == []
+    assert r.late == 1
+    assert r.flush() == [_expected([d], T0 + 180)]
+
+
+def test_out_of_order_within_bucket():
+    a, b, c = _minutes(0, 3)
+    bars = list(resample([a, c, b], "3m"))
+    assert bars == [_expected([a, b, c], T0)]
+
+
+@pytest.mark.parametrize("interval,source", [("1m", "5m"), ("5m", "3m"), ("2m", "1m")])
+def test_rejects_bad_intervals(interval, source):
+    with pytest.raises(ValueError):
+        Resampler(interval, source=source)
+
+
+def test_backtest_resamples_stored_1m(tmp_path: Path):
+    src = _minutes(0, 120)
+    write_store(tmp_path / "KRW-BTC.candles", src)
+    cfg = tmp_path / "cfg.yaml"
+    cfg.write_text(
+        yaml.safe_dump(
+            {
+                "strategy": {"name": "sma_cross", "params": {}, "symbols": ["KRW-BTC"]},
+                "data": {
+                    "interval": "15m",
+                    "source_interval": "1m",
+                    "window": 3,
+                    "csv": str(tmp_path),
+                },
+            }
+        )
+    )
+    s = Settings.load(str(cfg))
+    frame = load_batches(s)["KRW-BTC"]
+    assert len(frame) == 8
+    assert frame[2] == _expected(src[30:45], T0 + 1800)
+    assert list(load_streams(s)["KRW-BTC"]) == list(frame)
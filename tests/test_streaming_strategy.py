@@ -0,0 +1,79 @@
+import random
+
+import pytest
+
+from autotrade.backtest.broker import PaperBroker, Portfolio
+from autotrade.backtest.engine import simulate, simulate_rolling, simulate_streaming
+from autotrade.models.market import Candle
+from autotrade.models.order import OrderRequest
+from autotrade.strategies.bbands import BBandsStrategy
+from autotrade.strategies.macd import MACDStrategy
+from autotrade.strategies.rsi import RSIStrategy
+from autotrade.strategies.sma_cross import SmaCross
+
+SYM = "KRW-BTC"
+
+
+def _candles(n: int = 400, seed: int = 7) -> list[Candle]:
+    rnd = random.Random(seed)
+    p = 100.0
+    out = []
+    for i in range(n):
+        p *= 1.0 + rnd.uniform(-0.01, 0.01)
+        out.append(Candle(ts=i * 60, o=p, hi=p, lo=p, c=p, v=1.0))
+    return out
+
+
+STRATEGIES = [
+    lambda: RSIStrategy(symbols=[SYM], period=6, buy_th=35, sell_th=65),
+    lambda: RSIStrategy(symbols=[SYM], period=6, use_crossover=False),
+    lambda: MACDStrategy(symbols=[SYM], fast=5, slow=13, signal=4),
+    lambda: MACDStrategy(symbols=[SYM], fast=5, slow=13, signal=4, use_crossover=False),
+    lambda: BBandsStrategy(symbols=[SYM], window=10, k=1.5, mode="breakout"),
+    lambda: BBandsStrategy(symbols=[SYM], window=10, k=1.0, mode="revert"),
+    lambda: BBandsStrategy(
+        symbols=[SYM], window=10, k=1.0, mode="revert", use_crossover=False
+    ),
+    lambda: SmaCross(symbols=[SYM], fast=3, slow=8),
+]
+
+
+@pytest.mark.parametrize("make", STRATEGIES)
+def test_streaming_matches_rolling_fills(make):
+    candles = _candles()
+    win = 20
+
+    pf_a = Portfolio(cash=10_000.0)
+    strat_a = make()
+    strat_a.on_start()
+    rolled = simulate_rolling(strat_a, SYM, candles, win, PaperBroker(), pf_a)
+
+    pf_b = Portfolio(cash=10_000.0)
+    strat_b = make()
+    strat_b.on_start()
+    streamed = simulate_streaming(strat_b, SYM, candles, win, PaperBroker(), pf_b)
+
+    assert rolled, "fixture should produce at least one fill"
+    assert streamed == rolled
+    assert pf_b == pf_a
+
+
+def test_simulate_falls_back_to_generate_for_third_party():
+    class Every50:
+        name = "every50"
+        symbols = [SYM]
+        calls = 0
+
+        def on_start(self):
+            pass
+
+        def generate(self, candles):
+            self.calls += 1
+            cs = list(candles[SYM])
+            return [OrderRequest.market(SYM, "buy", 0.01)] if len(cs) % 50 == 0 else []
+
+    strat = Every50()
+    pf = Portfolio(cash=10_000.0)
+    fills = simulate(strat, SYM, _candles(200), 20, PaperBroker(), pf)
+    assert strat.calls == 200 - 20 + 1
+    assert [f.ts for f in fills] == [49 * 60, 99 * 60, 149 * 60, 199 * 60]
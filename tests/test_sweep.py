@@ -0,0 +1,95 @@
+from pathlib import Path
+
+import yaml
+
+from autotrade.backtest.sweep import _init_worker, _run_one, expand_grid, sweep
+from autotrade.data.downloader import download_candles
+from autotrade.exchanges.fake import FakeExchange
+from autotrade.strategies.registry import accepts, register
+
+
+def test_expand_grid_lists_only():
+    grid = expand_grid({"fast": [5, 8], "slow": [13, 21], "qty": 0.01})
+    assert len(grid) == 4
+    assert grid[0] == {"fast": 5, "slow": 13, "qty": 0.01}
+    assert grid[-1] == {"fast": 8, "slow": 21, "qty": 0.01}
+
+
+def test_sweep_runs_grid_in_parallel(tmp_path: Path):
+    csv_path = tmp_path / "candles.csv"
+    download_candles(FakeExchange(), "KRW-BTC", "1m", 300, str(csv_path))
+    cfg = {
+        "strategy": {
+            "name": "macd",
+            "params": {"fast": [3, 5], "slow": [8, 13], "signal": 3, "qty": 0.01},
+            "symbols": ["KRW-BTC"],
+        },
+        "data": {"interval": "1m", "window": 30, "csv": str(csv_path)},
+    }
+    config = tmp_path / "sweep.yaml"
+    config.write_text(yaml.safe_dump(cfg, sort_keys=False), encoding="utf-8")
+
+    out = tmp_path / "sweep.csv"
+    rows = sweep(str(config), out_path=str(out), workers=2)
+
+    assert [(r["fast"], r["slow"]) for r in rows] == [(3, 8), (3, 13), (5, 8), (5, 13)]
+    for r in rows:
+        assert {"final_equity", "sharpe", "sortino", "calmar", "mdd"} <= set(r)
+    lines = out.read_text(encoding="utf-8").strip().splitlines()
+    assert lines[0].startswith("fast,slow,signal,qty,final_equity")
+    assert len(lines) == 5
+
+
+def test_sweep_covers_every_symbol(tmp_path: Path):
+    paths = {}
+    for sym in ("KRW-BTC", "KRW-ETH"):
+        paths[sym] = str(tmp_path / f"{sym}.csv")
+        download_candles(FakeExchange(), sym, "1m", 300, paths[sym])
+    params = {"fast": 3, "slow": 8, "signal": 3, "qty": 0.01}
+    cfg = {
+        "strategy": {"name": "macd", "params": params, "symbols": ["KRW-BTC", "KRW-ETH"]},
+        "data": {"interval": "1m", "window": 30, "csv": paths},
+    }
+    config = tmp_path / "multi.yaml"
+    config.write_text(yaml.safe_dump(cfg, sort_keys=False), encoding="utf-8")
+    single = tmp_path / "single.yaml"
+    cfg["strategy"]["symbols"] = ["KRW-BTC"]
+    single.write_text(yaml.safe_dump(cfg, sort_keys=False), encoding="utf-8")
+
+    [multi] = sweep(str(config), out_path=str(tmp_path / "m.csv"), workers=1)
+    [one] = sweep(str(single), out_path=str(tmp_path / "s.csv"), workers=1)
+    # 두 번째 심볼의 체결도 포함돼야 함
+    assert multi["trades"] > one["trades"]
+
+
+@register("test_no_cache")
+class _NoCache:
+    """cache 인자가 없는 전략 (generate만 구현)"""
+
+    name = "test_no_cache"
+
+    def __init__(self, symbols, qty=0.01):
+        self.symbols = symbols
+        self.qty = qty
+
+    def on_start(self):
+        pass
+
+    def generate(self, candles):
+        return []
+
+
+def test_run_one_passes_cache_only_when_accepted(tmp_path: Path):
+    csv_path = tmp_path / "candles.csv"
+    download_candles(FakeExchange(), "KRW-BTC", "1m", 100, str(csv_path))
+    cfg = {
+        "strategy": {"name": "test_no_cache", "params": {"qty": 0.01}, "symbols": ["KRW-BTC"]},
+        "data": {"interval": "1m", "window": 30, "csv": str(csv_path)},
+    }
+    config = tmp_path / "nocache.yaml"
+    config.write_text(yaml.safe_dump(cfg, sort_keys=False), encoding="utf-8")
+    assert not accepts("test_no_cache", "cache") and accepts("macd", "cache")
+
+    _init_worker(str(config), {"cash_start": 10_000.0, "fee_rate": 0.0005, "slippage": 0.0})
+    row = _run_one({"qty": 0.01})
+    assert row["trades"] == 0 and row["final_equity"] == 10_000.0
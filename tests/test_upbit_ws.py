@@ -0,0 +1,167 @@
+import asyncio
+import json
+from http import HTTPStatus
+from pathlib import Path
+
+import pytest
+
+from websockets.asyncio.server import serve
+
+from autotrade.exchanges.upbit_ws import UpbitStream, parse_message
+from autotrade.models.market import Ticker, Trade
+
+RECORDED = [
+    json.loads(line)
+    for line in (Path(__file__).parent / "data" / "upbit_ws_messages.jsonl")
+    .read_text(encoding="utf-8")
+    .splitlines()
+]
+EXPECTED = [parse_message(m) for m in RECORDED]
+
+
+class _StandIn:
+    """녹화된 메시지를 재생하는 로컬 WebSocket 서버 (drop_after개 보낸 뒤 첫 연결을 끊음)"""
+
+    def __init__(self, drop_after: int | None = None, reject_first: int = 0):
+        self.drop_after = drop_after
+        self.reject_first = reject_first  # 처음 N번의 핸드셰이크는 503으로 거절
+        self.handshakes = 0
+        self.subscriptions: list[list[dict]] = []
+        self.sent = 0
+
+    async def handler(self, ws):
+        self.subscriptions.append(json.loads(await ws.recv()))
+        first = len(self.subscriptions) == 1
+        for m in RECORDED[self.sent :]:
+            if first and self.drop_after is not None and self.sent == self.drop_after:
+                await ws.close()
+                return
+            await ws.send(json.dumps(m).encode())  # Upbit는 바이너리 프레임으로 보냄
+            self.sent += 1
+        await ws.wait_closed()
+
+    def process_request(self, connection, request):
+        self.handshakes += 1
+        if self.handshakes <= self.reject_first:
+            return connection.respond(HTTPStatus.SERVICE_UNAVAILABLE, "maintenance\n")
+        return None
+
+
+async def _run(stand_in: _StandIn, body):
+    async with serve(
+        stand_in.handler, "127.0.0.1", 0, process_request=stand_in.process_request
+    ) as server:
+        port = server.sockets[0].getsockname()[1]
+        return await asyncio.wait_for(body(f"ws://127.0.0.1:{port}"), timeout=10)
+
+
+async def _until(cond):
+    while not cond():
+        await asyncio.sleep(0.01)
+
+
+def test_replays_recorded_messages_through_async_iterator():
+    seen: list = []
+
+    async def body(url):
+        out = []
+        async with UpbitStream(
+            ["KRW-BTC", "KRW-ETH"], url=url, on_message=seen.append
+        ) as stream:
+            async for msg in stream:
+                out.append(msg)
+                if len(out) == len(RECORDED):
+                    break
+        return out
+
+    stand_in = _StandIn()
+    got = asyncio.run(_run(stand_in, body))
+    assert got == EXPECTED and seen == EXPECTED
+    assert isinstance(got[0], Trade) and any(isinstance(m, Ticker) for m in got)
+    sub = stand_in.subscriptions[0]
+    assert {"type": "trade", "codes": ["KRW-BTC", "KRW-ETH"]} in sub
+    assert sub[-1] == {"format": "DEFAULT"}
+
+
+def test_reconnects_and_resubscribes():
+    async def body(url):
+        stream = UpbitStream(["KRW-BTC"], types=("trade",), url=url, reconnect_delay=0.01)
+        stream.start()
+        await _until(lambda: stream.received == len(RECORDED))
+        await stream.close()
+        return stream, [stream.queue._items.popleft() for _ in range(len(stream.queue))]
+
+    stand_in = _StandIn(drop_after=30)
+    stream, got = asyncio.run(_run(stand_in, body))
+    assert stream.reconnects == 1
+    assert len(stand_in.subscriptions) == 2
+    a, b = stand_in.subscriptions
+    assert a[1:] == b[1:] and a[0]["ticket"] != b[0]["ticket"]
+    assert got == EXPECTED
+
+
+def test_rejected_handshake_backs_off_and_reconnects():
+    async def body(url):
+        out = []
+        stream = UpbitStream(["KRW-BTC"], url=url, reconnect_delay=0.01)
+        async with stream:
+            async for msg in stream:
+                out.append(msg)
+                if len(out) == len(RECORDED):
+                    break
+        return stream, out
+
+    stand_in = _StandIn(reject_first=2)
+    stream, got = asyncio.run(_run(stand_in, body))
+    assert stand_in.handshakes == 3 and stream.reconnects == 2
+    assert got == EXPECTED
+
+
+def test_consumer_sees_reader_failure():
+    seen: list = []
+
+    def boom(msg):
+        seen.append(msg)
+        if len(seen) == len(RECORDED):  # 다 받은 뒤 실패 → 연결 종료가 버퍼에 막히지 않음
+            raise RuntimeError("callback failed")
+
+    async def body(url):
+        stream = UpbitStream(["KRW-BTC"], url=url, on_message=boom)
+        with pytest.raises(RuntimeError, match="callback failed"):
+            async for _ in stream:
+                pass
+        with pytest.raises(RuntimeError, match="callback failed"):
+            await stream.close()
+
+    asyncio.run(_run(_StandIn(), body))
+
+
+def test_slow_consumer_drops_oldest():
+    async def body(url):
+        stream = UpbitStream(["KRW-BTC"], url=url, maxsize=10)
+        async with stream:
+            await _until(lambda: stream.received == len(RECORDED))
+            got = [await stream.__anext__() for _ in range(10)]
+        return stream, got
+
+    stream, got = asyncio.run(_run(_StandIn(), body))
+    assert stream.dropped == len(RECORDED) - 10
+    assert got == EXPECTED[-10:]
+
+
+def test_parse_skips_unknown_and_malformed():
+    stream = UpbitStream(["KRW-BTC"])
+    stream._dispatch(b"not json")
+    stream._dispatch(json.dumps({"type": "orderbook", "code": "KRW-BTC"}))
+    stream._dispatch(json.dumps({"type": "trade", "code": "KRW-BTC"}))
+    stream._dispatch(json.dumps({"error": {"name": "INVALID_PARAM"}}))
+    assert stream.received == 0
+    trade = parse_message(RECORDED[0])
+    assert trade == Trade(
+        RECORDED[0]["code"],
+        RECORDED[0]["trade_timestamp"],
+        RECORDED[0]["trade_price"],
+        RECORDED[0]["trade_volume"],
+        "buy" if RECORDED[0]["ask_bid"] == "BID" else "sell",
+        RECORDED[0]["sequential_id"],
+    )
@@ -0,0 +1,142 @@
+import random
+
+import pytest
+
+from autotrade.backtest.broker import PaperBroker, Portfolio
+from autotrade.backtest.engine import (
+    simulate,
+    simulate_rolling,
+    simulate_streaming,
+    simulate_vectorized,
+)
+from autotrade.models.market import Candle
+from autotrade.strategies.bbands import BBandsStrategy
+from autotrade.strategies.macd import MACDStrategy
+from autotrade.strategies.rsi import RSIStrategy
+from autotrade.strategies.sma_cross import SmaCross
+
+SYM = "KRW-BTC"
+
+
+def _candles(n: int = 400, seed: int = 11) -> list[Candle]:
+    rnd = random.Random(seed)
+    p = 100.0
+    out = []
+    for i in range(n):
+        p *= 1.0 + rnd.uniform(-0.01, 0.01)
+        out.append(Candle(ts=i * 60, o=p, hi=p, lo=p, c=p, v=1.0))
+    return out
+
+
+STRATEGIES = [
+    lambda: RSIStrategy(symbols=[SYM], period=6, buy_th=35, sell_th=65),
+    lambda: RSIStrategy(symbols=[SYM], period=6, use_crossover=False),
+    lambda: MACDStrategy(symbols=[SYM], fast=5, slow=13, signal=4),
+    lambda: MACDStrategy(symbols=[SYM], fast=5, slow=13, signal=4, use_crossover=False),
+    lambda: BBandsStrategy(symbols=[SYM], window=10, k=1.5, mode="breakout"),
+    lambda: BBandsStrategy(symbols=[SYM], window=10, k=1.0, mode="revert"),
+    lambda: SmaCross(symbols=[SYM], fast=3, slow=8),
+]
+
+
+@pytest.mark.parametrize("win", [1, 20])
+@pytest.mark.parametrize("make", STRATEGIES)
+def test_vectorized_matches_rolling_fills(make, win):
+    candles = _candles()
+
+    pf_a = Portfolio(cash=10_000.0)
+    rolled = simulate_rolling(make(), SYM, candles, win, PaperBroker(), pf_a)
+
+    pf_b = Portfolio(cash=10_000.0)
+    vec = simulate_vectorized(make(), SYM, candles, win, PaperBroker(), pf_b)
+
+    assert rolled, "fixture should produce at least one fill"
+    assert vec == rolled
+    assert pf_b == pf_a
+
+
+@pytest.mark.parametrize("cross", [True, False])
+@pytest.mark.parametrize(
+    "closes", [[100.0] * 400, [100.0] * 400 + [101.0] * 5 + [100.0] * 400], ids=["flat", "step"]
+)
+def test_macd_vectorized_matches_streaming_on_flat_prices(closes, cross):
+    # 긴 평탄 구간에서도 NumPy EMA 잡음으로 히스토그램 부호가 뒤집히면 안 됨
+    candles = [Candle(ts=i * 60, o=c, hi=c, lo=c, c=c, v=1.0) for i, c in enumerate(closes)]
+
+    def make():
+        return MACDStrategy(symbols=[SYM], use_crossover=cross)
+
+    pf_a = Portfolio(cash=10_000.0)
+    streamed = simulate_streaming(make(), SYM, candles, 1, PaperBroker(), pf_a)
+    pf_b = Portfolio(cash=10_000.0)
+    vec = simulate_vectorized(make(), SYM, candles, 1, PaperBroker(), pf_b)
+    assert vec == streamed
+    assert pf_b == pf_a
+    if len(closes) == 400:
+        assert vec == []
+
+
+def _tick_grid(n: int, seed: int = 3) -> list[float]:
+    """호가 단위(0.0001) 격자 위의 소수 가격: 평탄 구간과 밴드/교차 경계에 딱 걸리는 종가가 잦음"""
+    rnd = random.Random(seed)
+    p, out = 123, []
+    for _ in range(n):
+        p = max(p + rnd.choice((-1, 0, 0, 1)), 1)
+        out.append(p / 10_000)
+    return out
+
+
+SERIES = {
+    "tick_grid": lambda: _tick_grid(5000),
+    "flat_decimal": lambda: [0.1] * 300 + [0.3] * 300 + [0.7] * 300 + [0.3] * 300,
+}
+
+DEFAULTS = {
+    "bbands": lambda: BBandsStrategy(symbols=[SYM], use_crossover=False),
+    "bbands_cross": lambda: BBandsStrategy(symbols=[SYM]),
+    "sma_cross": lambda: SmaCross(symbols=[SYM], fast=5, slow=20),
+}
+
+
+def _from_closes(closes: list[float]) -> list[Candle]:
+    return [Candle(ts=i * 60, o=c, hi=c, lo=c, c=c, v=1.0) for i, c in enumerate(closes)]
+
+
+@pytest.mark.parametrize("series", list(SERIES), ids=list(SERIES))
+@pytest.mark.parametrize("make", list(DEFAULTS.values()), ids=list(DEFAULTS))
+def test_vectorized_matches_streaming_on_decimal_prices(series, make):
+    # NumPy 커널 길이(NUMPY_MIN_LEN)를 넘는 소수 가격에서도 세 경로의 신호가 같아야 함
+    candles = _from_closes(SERIES[series]())
+
+    pf_a = Portfolio(cash=10_000.0)
+    strat = make()
+    strat.on_start()
+    streamed = simulate_streaming(strat, SYM, candles, 1, PaperBroker(), pf_a)
+    pf_b = Portfolio(cash=10_000.0)
+    vec = simulate_vectorized(make(), SYM, candles, 1, PaperBroker(), pf_b)
+    assert streamed, "series should produce at least one fill"
+    assert vec == streamed
+    assert pf_b == pf_a
+
+    # 롤링은 O(n²)이라 앞부분만 (커널 전환 길이는 넘김)
+    head = candles[:600]
+    pf_c = Portfolio(cash=10_000.0)
+    rolled = simulate_rolling(make(), SYM, head, 1, PaperBroker(), pf_c)
+    pf_d = Portfolio(cash=10_000.0)
+    assert rolled == simulate_vectorized(make(), SYM, head, 1, PaperBroker(), pf_d)
+
+
+def test_simulate_uses_vector_path_only_for_exact_signals():
+    candles = _from_closes(_tick_grid(1000))
+
+    class Approx(SmaCross):
+        exact_signals = False
+
+        def signals(self, closes):
+            raise AssertionError("signals() without exact_signals must not drive the backtest")
+
+    pf_a = Portfolio(cash=10_000.0)
+    fills = simulate(Approx(symbols=[SYM], fast=5, slow=20), SYM, candles, 1, PaperBroker(), pf_a)
+    pf_b = Portfolio(cash=10_000.0)
+    vec = simulate(SmaCross(symbols=[SYM], fast=5, slow=20), SYM, candles, 1, PaperBroker(), pf_b)
+    assert fills and vec == fills and pf_b == pf_a